@@ -1,6 +1,6 @@
 # Import necessary components
 from qiskit import QuantumCircuit
-from qiskit.quantum_info import Statevector
+from quantum_fundamentals.execution import simulate_statevector
 from qiskit.visualization import plot_bloch_multivector
 
 # Create a circuit with one qubit
@@ -11,7 +11,7 @@ qc = QuantumCircuit(1)
 qc.h(0)
 
 # Get the statevector and visualize on the Bloch sphere
-state_after_h = Statevector(qc)
+state_after_h = simulate_statevector(qc)
 print("State after Hadamard gate:")
 print(state_after_h.draw('text'))
 plot_bloch_multivector(state_after_h, title="After H-gate").show()
@@ -22,7 +22,7 @@ plot_bloch_multivector(state_after_h, title="After H-gate").show()
 qc.z(0)
 
 # Get the new statevector and visualize
-state_after_z = Statevector(qc)
+state_after_z = simulate_statevector(qc)
 print("\nState after Z-gate:")
 print(state_after_z.draw('text'))
 plot_bloch_multivector(state_after_z, title="After Z-gate").show()
\ No newline at end of file
@@ -1,17 +1,7 @@
 # Import necessary components
-import numpy as np
 from qiskit import QuantumCircuit, transpile
-from qiskit_aer import AerSimulator
-
-# --- Function for inverse QFT ---
-def qft_dagger(qc, n):
-    """Builds an inverse QFT circuit on n qubits."""
-    for qubit in range(n // 2):
-        qc.swap(qubit, n - qubit - 1)
-    for j in range(n):
-        for m in range(j):
-            qc.cp(-np.pi / (2**(j - m)), m, j)
-        qc.h(j)
+from quantum_fundamentals.execution import make_simulator
+from quantum_fundamentals.qft import append_qft_dagger
 
 # --- Main QPE Circuit ---
 # Use 3 qubits for the counting register and 1 for the state register
@@ -31,14 +21,14 @@ qc.cz(0, 3)
 qc.barrier()
 
 # --- Step 4: Inverse QFT ---
-qft_dagger(qc, 3)
+append_qft_dagger(qc, 3)
 qc.barrier()
 
 # --- Step 5: Measurement ---
 qc.measure(range(3), range(3))
 
 # Simulate the circuit
-simulator = AerSimulator()
+simulator = make_simulator()
 compiled_circuit = transpile(qc, simulator)
 result = simulator.run(compiled_circuit, shots=1024).result()
 counts = result.get_counts()
@@ -1,8 +1,16 @@
 import numpy as np
 from scipy.optimize import minimize
-from qiskit import QuantumCircuit
 from qiskit.quantum_info import SparsePauliOp
-from qiskit.primitives import StatevectorEstimator, StatevectorSampler
+from quantum_fundamentals.cache import default_cache
+from quantum_fundamentals.counts import IntCounts
+from quantum_fundamentals.execution import make_sampler
+from quantum_fundamentals.lightcone import make_lightcone_objective
+from quantum_fundamentals.maxcut import cut_value, max_cut_brute_force
+from quantum_fundamentals.multistart import multistart_minimize, random_starts
+from quantum_fundamentals.qaoa import (
+    TRIANGLE_EDGES, create_qaoa_circuit, make_diagonal_objective, make_objective_function, maxcut_diagonal,
+)
+from quantum_fundamentals.warm_start import graph_degree, optimize_depths
 
 # ---------------------------------------------------------
 # STEP 1: Define the Hamiltonian
@@ -16,38 +24,6 @@ hamiltonian = SparsePauliOp.from_list([
 ])
 print(f"Hamiltonian: {hamiltonian}\n")
 
-# ---------------------------------------------------------
-# STEP 2: Define the QAOA Circuit Building Function
-# ---------------------------------------------------------
-def create_qaoa_circuit(params, reps, n_qubits=3):
-    """
-    Constructs the QAOA Ansatz manually.
-    """
-    qc = QuantumCircuit(n_qubits)
-    
-    # 1. Initialization: Equal Superposition
-    qc.h(range(n_qubits))
-    
-    # Split params
-    gammas = params[0::2]
-    betas = params[1::2]
-    
-    # 2. Apply Layers
-    for i in range(reps):
-        gamma = gammas[i]
-        beta = betas[i]
-        
-        # --- Cost Layer (RZZ) ---
-        qc.rzz(2 * gamma, 0, 1) 
-        qc.rzz(2 * gamma, 1, 2) 
-        qc.rzz(2 * gamma, 0, 2) 
-        
-        # --- Mixer Layer (RX) ---
-        for q in range(n_qubits):
-            qc.rx(2 * beta, q)
-            
-    return qc
-
 # ---------------------------------------------------------
 # NEW STEP: Print the Circuit Once
 # ---------------------------------------------------------
@@ -67,20 +43,11 @@ print("\n(Circuit printed above. Now proceeding to optimization...)\n")
 # ---------------------------------------------------------
 # STEP 3: Define the Objective Function
 # ---------------------------------------------------------
-estimator = StatevectorEstimator()
-
-def objective_function(params):
-    # Create circuit
-    reps = len(params) // 2
-    qc = create_qaoa_circuit(params, reps)
-    
-    # Run Estimator
-    pub = (qc, hamiltonian)
-    job = estimator.run([pub])
-    result = job.result()[0]
-    energy = result.data.evs
-    
-    return float(energy)
+# Builds the QAOA circuit for the given parameters and returns <H>. Values are
+# memoised per (graph, Hamiltonian, parameters): set QC_OBJECTIVE_CACHE=<file>
+# to keep them between runs.
+cache = default_cache()
+objective_function = cache.wrap(make_objective_function(hamiltonian), 'qaoa', TRIANGLE_EDGES, hamiltonian)
 
 # ---------------------------------------------------------
 # STEP 4: Run Classical Optimization
@@ -103,6 +70,10 @@ print("\n--- Optimization Complete ---")
 print(f"Optimal Parameters: {optimal_params}")
 print(f"Minimum Energy Found: {min_energy:.4f}")
 
+# Optimising again from the same start revisits the same points: no new evaluations
+minimize(objective_function, init_params, method='COBYLA', options={'maxiter': 50, 'tol': 1e-4})
+print(f"Objective cache after a repeated optimisation: {cache.stats()}")
+
 # ---------------------------------------------------------
 # STEP 5: Retrieve and Analyze the Optimal State
 # ---------------------------------------------------------
@@ -113,19 +84,102 @@ optimal_circuit = create_qaoa_circuit(optimal_params, reps)
 optimal_circuit.measure_all()
 
 # 2. Sample
-sampler = StatevectorSampler()
+sampler = make_sampler()
 job = sampler.run([optimal_circuit], shots=1024)
 result_sampler = job.result()[0]
-counts = result_sampler.data.meas.get_counts()
+counts = IntCounts.from_bitarray(result_sampler.data.meas)
 
-# 3. Find winner
-sorted_counts = sorted(counts.items(), key=lambda item: item[1], reverse=True)
-most_likely_string = sorted_counts[0][0]
+# 3. Find winner (outcomes stay integers; bitstrings are only for display)
+keys, values = counts.top_k(3)
+most_likely_string = counts.bitstring(keys[0])
 
 print("\nTop 3 Measured Bitstrings (Candidate Solutions):")
-for bitstring, count in sorted_counts[:3]:
-    print(f"State |{bitstring}> : {count} shots")
+for key, count in zip(keys, values):
+    print(f"State |{counts.bitstring(key)}> : {count} shots")
 
 print("\n------------------------------")
 print(f"Winner: {most_likely_string}")
-print("------------------------------")
\ No newline at end of file
+print("------------------------------")
+
+# ---------------------------------------------------------
+# STEP 6: Scaling Up with Lightcones
+# ---------------------------------------------------------
+print("\n=== Step 6: Lightcone Evaluation on a 1000-Node Graph ===")
+# At depth p, each edge's <Z_i Z_j> only depends on the qubits within distance
+# p of that edge, so the energy is a sum of small simulations, and edges with
+# identical neighbourhoods share one.
+lightcone_objective = make_lightcone_objective(TRIANGLE_EDGES)
+print(f"Triangle energy via lightcones: {lightcone_objective(optimal_params):.4f} (full simulation: {min_energy:.4f})")
+
+# A 3-regular graph (a ring plus its diameters) far beyond statevector size
+num_nodes = 1000
+large_edges = [(i, (i + 1) % num_nodes) for i in range(num_nodes)] + \
+              [(i, i + num_nodes // 2) for i in range(num_nodes // 2)]
+large_objective = make_lightcone_objective(large_edges, num_nodes)
+large_result = minimize(large_objective, [0.1, 0.1], method='COBYLA', options={'maxiter': 50, 'tol': 1e-4})
+evaluator = large_objective.evaluators[1]
+print(f"{len(large_edges)} edges, {len(evaluator.classes)} distinct lightcone(s) of at most {evaluator.max_qubits} qubits")
+print(f"p=1 optimum: energy {large_result.fun:.2f}, expected cut {(len(large_edges) - large_result.fun) / 2:.1f} "
+      f"of {len(large_edges)} edges")
+
+# ---------------------------------------------------------
+# STEP 7: Increasing the Depth with Warm Starts
+# ---------------------------------------------------------
+print("\n=== Step 7: Warm-Started Depth Progression ===")
+# Instead of guessing angles for every depth, optimise p=1 and start each p+1
+# from the interpolated p optimum ...
+for record in optimize_depths(objective_function, max_reps=3, strategy='interp'):
+    print(f"Triangle p={record['reps']} (start: {record['source']}): energy {record['energy']:.4f} "
+          f"after {record['evaluations']} evaluations")
+
+# ... or, for a regular graph, from angles tabulated by degree
+for record in optimize_depths(large_objective, max_reps=2, degree=graph_degree(large_edges)):
+    print(f"1000-node p={record['reps']} (start: {record['source']}): energy {record['energy']:.2f} "
+          f"after {record['evaluations']} evaluations")
+
+# ---------------------------------------------------------
+# STEP 8: Multi-Start Optimisation
+# ---------------------------------------------------------
+# Steps 8 and 9 start process pools. Under the spawn start method (Windows,
+# macOS, Linux from Python 3.14) each worker re-imports this script, so they
+# only run in the main process.
+if __name__ == '__main__':
+    print("\n=== Step 8: Multi-Start Optimisation in a Process Pool ===")
+    # One COBYLA run can get stuck in a local minimum. Run 8 seeded starts in
+    # parallel on a 12-node graph: the workers share the precomputed cost diagonal
+    # and stop starts that trail the best energy found so far by more than 1.
+    graph_rng = np.random.default_rng(1)
+    graph_edges = [(i, j) for i in range(12) for j in range(i + 1, 12) if graph_rng.random() < 0.3]
+    diagonal = maxcut_diagonal(graph_edges, 12)
+    multistart = multistart_minimize(make_diagonal_objective, random_starts(8, 6, seed=3),
+                                     kwargs={'n_qubits': 12}, shared={'diagonal': diagonal}, prune_margin=1.0)
+    for run in multistart['runs']:
+        print(f"Start {run['index']}: energy {run['energy']:.3f} after {run['evaluations']} evaluations"
+              f"{' (pruned)' if run['pruned'] else ''}")
+    print(f"Best p=3 energy: {multistart['best']['energy']:.3f} (exact minimum: {diagonal.min():.0f})")
+
+    # ---------------------------------------------------------
+    # STEP 9: Checking Against the Exact Maximum Cut
+    # ---------------------------------------------------------
+    print("\n=== Step 9: Ground Truth by Exhaustive Search ===")
+    # Enumerate every partition (in Gray-code order, across processes) to get the
+    # true maximum cut, and report how close QAOA's expected cut comes to it.
+    triangle_cut, _ = max_cut_brute_force(TRIANGLE_EDGES)
+    print(f"Triangle winner |{most_likely_string}> cuts {cut_value(TRIANGLE_EDGES, most_likely_string):.0f} "
+          f"of a maximum {triangle_cut:.0f} edges")
+
+    graph_cut, graph_assignment = max_cut_brute_force(graph_edges, 12)
+    expected_cut = (len(graph_edges) - multistart['best']['energy']) / 2
+    print(f"12-node graph: maximum cut {graph_cut:.0f} (partition {graph_assignment:012b}), "
+          f"p=3 expected cut {expected_cut:.2f}, approximation ratio {expected_cut / graph_cut:.3f}")
+
+    # The 1000-node graph's construction at 28 nodes, still small enough to enumerate
+    ladder_nodes = 28
+    ladder_edges = [(i, (i + 1) % ladder_nodes) for i in range(ladder_nodes)] + \
+                   [(i, i + ladder_nodes // 2) for i in range(ladder_nodes // 2)]
+    ladder_cut, _ = max_cut_brute_force(ladder_edges, ladder_nodes)
+    ladder_energy = optimize_depths(make_lightcone_objective(ladder_edges, ladder_nodes), max_reps=2,
+                                    degree=graph_degree(ladder_edges))[-1]['energy']
+    ladder_expected = (len(ladder_edges) - ladder_energy) / 2
+    print(f"28-node ladder: maximum cut {ladder_cut:.0f} of {len(ladder_edges)} edges, "
+          f"p=2 expected cut {ladder_expected:.2f}, approximation ratio {ladder_expected / ladder_cut:.3f}")
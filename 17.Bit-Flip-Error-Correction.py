@@ -1,6 +1,6 @@
 # Import necessary components
 from qiskit import QuantumCircuit, QuantumRegister, ClassicalRegister, transpile
-from qiskit_aer import AerSimulator
+from quantum_fundamentals.execution import make_simulator
 
 # --- Setup ---
 q = QuantumRegister(3, 'q')
@@ -41,7 +41,7 @@ qc.add_register(final_measure)
 qc.measure(q[0], final_measure[0])
 
 # --- Simulation ---
-simulator = AerSimulator()
+simulator = make_simulator()
 result = simulator.run(transpile(qc, simulator), shots=100).result()
 print("Bit-Flip Error Correction Circuit:")
 print(qc)
\ No newline at end of file
@@ -0,0 +1,22 @@
+# Import necessary components
+from quantum_fundamentals.repetition import build_repetition_code, make_decoder, run_memory_experiment
+
+# Generalises script 17 to a distance-d repetition code measured over several
+# rounds, with all shots decoded at once from bit-packed sampler records.
+
+# ==================== MAIN EXECUTION ====================
+
+shots = 1_000_000
+p = 0.01
+
+print("Distance-3 Repetition Code, 2 Rounds:")
+print(build_repetition_code(3, 2))
+
+print(f"\nMemory experiment at p = {p}, {shots} shots per code")
+print(f"{'d':<4}{'Rounds':<8}{'Decoder':<22}{'p_L':<12}{'Sim (s)':<10}{'Decode (s)':<12}{'Decode shots/s'}")
+for distance in [3, 5, 7]:
+    rounds = distance
+    decoder = make_decoder(distance, rounds)
+    p_l, t_sim, t_dec = run_memory_experiment(distance, rounds, p, shots=shots, seed=1234, decoder=decoder)
+    print(f"{distance:<4}{rounds:<8}{type(decoder).__name__:<22}{p_l:<12.3e}"
+          f"{t_sim:<10.2f}{t_dec:<12.3f}{shots / t_dec:.3e}")
@@ -1,9 +1,14 @@
+import asyncio
 import numpy as np
 from scipy.optimize import minimize
-from qiskit import QuantumCircuit
-from qiskit.quantum_info import SparsePauliOp
-from qiskit.circuit import Parameter
-from qiskit.primitives import StatevectorEstimator
+from quantum_fundamentals.cache import default_cache
+from quantum_fundamentals.grouping import GroupedEstimator
+from quantum_fundamentals.jobs import JobRunner
+from quantum_fundamentals.multistart import multistart_minimize, random_starts
+from quantum_fundamentals.pauli import PauliKernelEstimator
+from quantum_fundamentals.vqe import (
+    ising_hamiltonian, exact_ground_energy, hardware_efficient_ansatz, make_cost_function,
+)
 
 # ---------------------------------------------------------
 # STEP 1: Define the Problem (The Hamiltonian)
@@ -14,13 +19,12 @@ print("--- Step 1: Defining the Hamiltonian ---")
 # This represents a simple Ising model interactions.
 
 # 'ZZ' acts on qubit 0 and 1. 'XI' acts on qubit 0.
-hamiltonian = SparsePauliOp.from_list([("ZZ", 1.0), ("XI", 1.0)])
+hamiltonian = ising_hamiltonian()
 print(f"Hamiltonian Operator:\n{hamiltonian}")
 
 # Calculate the exact reference value using standard linear algebra (NumPy)
 # This lets us check if our VQE actually works.
-matrix = hamiltonian.to_matrix()
-exact_eigenvalue = np.min(np.linalg.eigvalsh(matrix))
+exact_eigenvalue = exact_ground_energy(hamiltonian)
 print(f"Target (Exact) Energy: {exact_eigenvalue:.4f}\n")
 
 
@@ -35,13 +39,7 @@ print("--- Step 2: Creating the Ansatz Circuit ---")
 # 2. Entanglement (CX) to correlate them.
 # 3. Parameterized so the optimizer can tune it.
 
-theta = Parameter('θ')
-phi = Parameter('φ')
-
-ansatz = QuantumCircuit(2)
-ansatz.ry(theta, 0)  # Rotation on Qubit 0
-ansatz.ry(phi, 1)    # Rotation on Qubit 1
-ansatz.cx(0, 1)      # Entanglement
+ansatz = hardware_efficient_ansatz()
 
 print("Ansatz Circuit Diagram:")
 print(ansatz.draw(output='text'))
@@ -55,32 +53,16 @@ print("--- Step 3: Defining the Cost Function (Expectation Value) ---")
 
 # In Qiskit 1.0+, we use the 'Estimator' primitive.
 # It replaces QuantumInstance. It takes a circuit and an observable
-# and calculates <psi | H | psi>.
-estimator = StatevectorEstimator()
-
-def cost_function(params):
-    """
-    Accepts a list of parameters (angles), runs the circuit,
-    and returns the expected energy.
-    """
-    # The Estimator expects inputs in a specific structure (pub = primitive unified bloc)
-    # (circuit, observable, parameter_values)
-    
-    # 1. Bind the classical optimizer's values to the circuit parameters
-    pub = (ansatz, hamiltonian, params)
-    
-    # 2. Run the job
-    job = estimator.run([pub])
-    
-    # 3. Extract the result (energy)
-    result = job.result()[0]
-    energy = result.data.evs
-    
-    # Print the step for visualization
-    # Note: We cast to float because the estimator returns a numpy array
-    print(f"Evaluated params {params} -> Energy: {float(energy):.4f}")
-    
-    return energy
+# and calculates <psi | H | psi>. PauliKernelEstimator evaluates it directly
+# on the statevector amplitudes, term by term, without building a matrix.
+estimator = PauliKernelEstimator()
+
+# cost_function(params) binds the classical optimizer's values to the ansatz,
+# runs the Estimator and prints and returns the expected energy.
+# The wrapper memoises energies per (ansatz, Hamiltonian, parameters); with
+# QC_OBJECTIVE_CACHE=<file> a rerun reads them back instead of re-estimating.
+cache = default_cache()
+cost_function = cache.wrap(make_cost_function(ansatz, hamiltonian, estimator), ansatz, hamiltonian)
 
 
 # ---------------------------------------------------------
@@ -109,4 +91,70 @@ print(f"VQE Final Energy:   {result.fun:.4f}")
 print(f"Exact Target Energy: {exact_eigenvalue:.4f}")
 
 difference = abs(result.fun - exact_eigenvalue)
-print(f"Accuracy Difference: {difference:.6f}")
\ No newline at end of file
+print(f"Accuracy Difference: {difference:.6f}")
+print(f"Objective cache: {cache.stats()}")
+
+
+# ---------------------------------------------------------
+# STEP 5: Estimate the Energy from Measurement Shots
+# ---------------------------------------------------------
+print("\n--- Step 5: Estimating the Final Energy from Shots ---")
+
+# On hardware <H> comes from counts. Terms that commute qubit by qubit share
+# one measurement circuit (rotated into their common basis), and every term's
+# expectation is read off that circuit's counts.
+shot_estimator = GroupedEstimator(seed=42)
+shot_result = shot_estimator.run([(ansatz, hamiltonian, result.x)]).result()[0]
+print(f"Measurement circuits: {shot_result.metadata['num_groups']} for {len(hamiltonian)} terms, "
+      f"shots per circuit: {shot_result.metadata['group_shots']}")
+print(f"Sampled Energy:     {float(shot_result.data.evs):.4f} +/- {float(shot_result.data.stds):.4f}")
+
+# The same total budget, split in proportion to |coefficient| x standard deviation
+# of each circuit's terms. The split is re-estimated from every run's counts, so
+# it improves over repeated calls (e.g. the iterations of an optimiser).
+adaptive_estimator = GroupedEstimator(seed=42, allocation='variance', shot_budget=shot_result.metadata['shots'])
+for _ in range(3):
+    adaptive_result = adaptive_estimator.run([(ansatz, hamiltonian, result.x)]).result()[0]
+print(f"Variance-weighted shots per circuit: {adaptive_result.metadata['group_shots']}")
+print(f"Sampled Energy:     {float(adaptive_result.data.evs):.4f} +/- {float(adaptive_result.data.stds):.4f}")
+
+
+# ---------------------------------------------------------
+# STEP 6: Multi-Start Optimisation
+# ---------------------------------------------------------
+# The multi-start step starts a process pool. Under the spawn start method
+# (Windows, macOS, Linux from Python 3.14) each worker re-imports this script,
+# so it only runs in the main process.
+if __name__ == '__main__':
+    print("\n--- Step 6: Multi-Start Optimisation ---")
+
+    # A single start can land in a local minimum. Four seeded starts run in worker
+    # processes, each of which builds its own cost function from the ansatz and
+    # Hamiltonian once.
+    multistart = multistart_minimize(make_cost_function, random_starts(4, 2, seed=7),
+                                     args=(ansatz, hamiltonian), kwargs={'verbose': False},
+                                     options={'maxiter': 40, 'tol': 1e-4})
+    for run in multistart['runs']:
+        print(f"Start {run['index']} from {run['start'].round(2)}: energy {run['energy']:.4f} "
+              f"after {run['evaluations']} evaluations")
+    print(f"Best Energy:        {multistart['best']['energy']:.4f}")
+
+
+# ---------------------------------------------------------
+# STEP 7: Scanning the Energy Landscape Asynchronously
+# ---------------------------------------------------------
+print("\n--- Step 7: Energy Landscape via Asynchronous Jobs ---")
+
+# Each grid point is submitted as its own awaitable estimator job; the runner
+# coalesces submissions that arrive together into one estimator run.
+async def scan_landscape(angles):
+    async with JobRunner(estimator=estimator) as runner:
+        jobs = [runner.estimate([(ansatz, hamiltonian, [theta, phi])]) for theta in angles for phi in angles]
+        results = await asyncio.gather(*jobs)
+    return np.array([float(r[0].data.evs) for r in results]).reshape(len(angles), len(angles)), runner.stats()
+
+angles = np.linspace(-np.pi, np.pi, 9)
+landscape, job_stats = asyncio.run(scan_landscape(angles))
+theta_index, phi_index = np.unravel_index(np.argmin(landscape), landscape.shape)
+print(f"{job_stats['submissions']} submissions ran as {job_stats['batches']} estimator run(s)")
+print(f"Lowest grid point: θ={angles[theta_index]:.2f}, φ={angles[phi_index]:.2f}, energy {landscape.min():.4f}")
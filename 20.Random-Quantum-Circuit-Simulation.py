@@ -2,7 +2,8 @@
 import random
 import time
 from qiskit import QuantumCircuit, transpile
-from qiskit_aer import AerSimulator
+from quantum_fundamentals.execution import make_simulator
+from quantum_fundamentals.drawing import draw_circuit
 
 # --- Circuit Parameters ---
 num_qubits = 10
@@ -29,13 +30,14 @@ for d in range(depth):
 qc.measure_all()
 
 # --- Simulate the Circuit and Time it ---
-simulator = AerSimulator(method='statevector')
+simulator = make_simulator(method='statevector')
 print(f"Simulating a random circuit with {num_qubits} qubits and depth {depth}...")
 start_time = time.time()
 compiled_circuit = transpile(qc, simulator)
 result = simulator.run(compiled_circuit, shots=10).result()
 end_time = time.time()
-qc.draw(output='mpl', filename='quantum_advantage_long.png', fold=-1)
+# Rendered in the background into circuit_drawings/, and only with QC_DRAW_CIRCUITS=1
+draw_circuit(qc, 'quantum_advantage_long.png', fold=-1)
 
 # --- Print Results ---
 print(f"Simulation finished in {end_time - start_time:.4f} seconds.")
@@ -0,0 +1,68 @@
+# Import necessary components
+import random
+import sys
+import time
+from qiskit import QuantumCircuit, transpile
+from quantum_fundamentals.counts import IntCounts
+from quantum_fundamentals.execution import make_sampler
+
+# Scripts 11 and 16 sort get_counts() dicts and re-parse every key with
+# int(output, 2). IntCounts keeps the histogram as integer-indexed NumPy arrays
+# built straight from the sampler's packed bits; bitstrings are display-only.
+
+
+def random_circuit(num_qubits, depth, seed=0):
+    """Random layered circuit in the style of script 20."""
+    rng = random.Random(seed)
+    qc = QuantumCircuit(num_qubits)
+    for _ in range(depth):
+        for i in range(num_qubits):
+            getattr(qc, rng.choice(['h', 's', 't', 'x']))(i)
+        pairs = rng.sample(range(num_qubits), num_qubits)
+        for i in range(0, num_qubits - 1, 2):
+            getattr(qc, rng.choice(['cx', 'cz']))(pairs[i], pairs[i + 1])
+    qc.measure_all()
+    return qc
+
+
+# ==================== MAIN EXECUTION ====================
+
+num_qubits = 20
+shots = 200_000
+qc = random_circuit(num_qubits, 6)
+sampler = make_sampler(seed=1234)
+
+start = time.perf_counter()
+bit_array = sampler.run([transpile(qc, optimization_level=0)], shots=shots).result()[0].data.meas
+sample_time = time.perf_counter() - start
+
+start = time.perf_counter()
+counts_dict = bit_array.get_counts()
+sorted_dict = sorted(counts_dict.items(), key=lambda x: x[1], reverse=True)[:10]
+top_dict = [(int(k, 2), v) for k, v in sorted_dict]
+dict_time = time.perf_counter() - start
+
+start = time.perf_counter()
+counts = IntCounts.from_bitarray(bit_array)
+top_keys, top_values = counts.top_k(10)
+int_time = time.perf_counter() - start
+
+dict_bytes = sys.getsizeof(counts_dict) + sum(sys.getsizeof(k) + sys.getsizeof(v) for k, v in counts_dict.items())
+print(f"{num_qubits}-qubit random circuit, {shots} shots ({sample_time:.2f} s sampling)")
+print(f"Distinct outcomes: {len(counts)}  (storage: {'dense' if counts.dense else 'sorted arrays'})")
+print(f"{'':<22}{'Histogram + top-10 (ms)':<26}{'Memory (bytes)'}")
+print(f"{'dict of bitstrings':<22}{dict_time * 1e3:<26.1f}{dict_bytes}")
+print(f"{'IntCounts':<22}{int_time * 1e3:<26.1f}{counts.nbytes}")
+# Outcomes with tied counts may be ordered differently, so compare the counts
+print(f"Top-10 counts agree: {[v for _, v in top_dict] == top_values.tolist()}")
+
+print("\nTop 5 outcomes:")
+for key, value in zip(top_keys[:5], top_values[:5]):
+    print(f"  |{counts.bitstring(key)}>  {value}")
+
+print("\nMarginal over qubits 0-3:")
+print(counts.marginal([0, 1, 2, 3]).to_dict())
+
+second = IntCounts.from_bitarray(make_sampler(seed=5678).run([transpile(qc, optimization_level=0)], shots=shots).result()[0].data.meas)
+merged = counts + second
+print(f"\nMerged two runs: {merged.shots} shots, {len(merged)} distinct outcomes")
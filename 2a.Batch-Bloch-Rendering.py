@@ -0,0 +1,34 @@
+# Import necessary components
+import time
+import numpy as np
+from qiskit import QuantumCircuit
+from quantum_fundamentals.bloch import BlochRenderer, bloch_vectors, gate_sequence_states, render_frames
+
+# Renders Bloch spheres headlessly, reusing one Agg figure per worker process
+# instead of building a new plot_bloch_multivector figure per state (see
+# quantum_fundamentals/bloch.py).
+
+# ==================== MAIN EXECUTION ====================
+
+# Guarded so worker processes can import this file without re-running the demo
+if __name__ == '__main__':
+    # --- Script 1 (superposition and phase flip) as an animation ---
+    qc = QuantumCircuit(1)
+    qc.h(0)
+    qc.z(0)
+    states, titles = gate_sequence_states(qc)
+    BlochRenderer(1).animate([bloch_vectors(s) for s in states], 'bloch_h_z.gif', titles)
+    print("Wrote bloch_h_z.gif")
+
+    # --- A long gate sequence rendered frame by frame in a worker pool ---
+    sweep = QuantumCircuit(2)
+    for step in range(199):
+        sweep.ry(np.pi / 40, 0)
+        sweep.rz(np.pi / 25, 1)
+        if step % 50 == 49:
+            sweep.cx(0, 1)
+    states, titles = gate_sequence_states(sweep)
+
+    start = time.perf_counter()
+    frames = render_frames(states, 'bloch_frames', titles)
+    print(f"Rendered {frames} frames into bloch_frames/ in {time.perf_counter() - start:.2f} s")
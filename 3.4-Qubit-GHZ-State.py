@@ -1,6 +1,6 @@
 # Import necessary components
 from qiskit import QuantumCircuit, transpile
-from qiskit_aer import AerSimulator
+from quantum_fundamentals.execution import make_simulator
 from qiskit.visualization import plot_histogram
 
 # Create a circuit with 4 qubits and 4 classical bits
@@ -22,7 +22,7 @@ qc.barrier()
 qc.measure([0, 1, 2, 3], [0, 1, 2, 3])
 
 # Initialize and run the simulator
-simulator = AerSimulator()
+simulator = make_simulator()
 compiled_circuit = transpile(qc, simulator)
 result = simulator.run(compiled_circuit, shots=1024).result()
 counts = result.get_counts(qc)
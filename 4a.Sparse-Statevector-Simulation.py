@@ -0,0 +1,51 @@
+# Import necessary components
+import time
+import numpy as np
+from qiskit import QuantumCircuit
+from qiskit.quantum_info import Statevector
+from quantum_fundamentals.ghz import ghz_linear as ghz
+from quantum_fundamentals.sparse import simulate_sparse
+
+# The GHZ (3), Bell (4), half-adder (5) and no-cloning (8) states only have a
+# handful of non-zero amplitudes, yet Statevector(qc) allocates all 2^n of them.
+# simulate_sparse keeps only the non-zero amplitudes and switches to a dense
+# Statevector once the support grows past a fraction of 2^n (the returned
+# SparseStatevector then holds the dense array).
+
+# ==================== MAIN EXECUTION ====================
+
+bell = QuantumCircuit(2)
+bell.h(0)
+bell.cx(0, 1)
+
+half_adder = QuantumCircuit(3)
+half_adder.x([0, 1])
+half_adder.ccx(0, 1, 2)
+half_adder.cx(0, 1)
+
+no_cloning = QuantumCircuit(2)
+no_cloning.initialize(np.array([np.sqrt(0.7), np.sqrt(0.3)]), 0)
+no_cloning.cx(0, 1)
+
+print("--- Agreement with Statevector ---")
+for name, qc in [('GHZ(4)', ghz(4)), ('Bell', bell), ('Half-adder 1+1', half_adder), ('No-cloning', no_cloning)]:
+    sparse = simulate_sparse(qc)
+    dense = Statevector(qc)
+    print(f"{name:<16} support = {sparse.support:<3} matches dense: {np.allclose(sparse.to_dense(), dense.data)}")
+    print(f"{'':<16} {sparse.to_dict(decimals=3)}")
+
+print("\n--- Scaling with qubit count (GHZ state) ---")
+print(f"{'Qubits':<8}{'Support':<10}{'Sparse bytes':<15}{'Dense bytes':<16}{'Sparse time (ms)'}")
+for n in [10, 20, 28, 64, 256]:
+    start = time.perf_counter()
+    state = simulate_sparse(ghz(n))
+    elapsed = (time.perf_counter() - start) * 1e3
+    print(f"{n:<8}{state.support:<10}{state.nbytes():<15}{16 * 2 ** n:<16.3g}{elapsed:.2f}")
+
+print("\n--- Dense fallback ---")
+spread = QuantumCircuit(6)
+spread.h(range(6))
+spread.cx(0, 1)
+result = simulate_sparse(spread)
+print(f"H on all 6 qubits -> {'dense' if result.dense is not None else 'sparse'} {result.to_dense().dtype}, "
+      f"matches: {np.allclose(result.to_dense(), Statevector(spread).data)}")
@@ -0,0 +1,68 @@
+# Import necessary components
+import time
+import numpy as np
+from qiskit import QuantumCircuit
+from qiskit.quantum_info import Statevector
+from quantum_fundamentals.stepper import StatevectorStepper, trace_statevectors
+
+# Scripts 1 and 4 call Statevector(qc) after every gate, re-simulating the whole
+# circuit each time: O(gates^2) to trace a circuit. StatevectorStepper applies
+# each gate once to a single evolving state and keeps O(1) snapshots.
+
+
+def random_circuit(num_qubits, num_gates, seed=0):
+    rng = np.random.default_rng(seed)
+    qc = QuantumCircuit(num_qubits)
+    for _ in range(num_gates):
+        if rng.random() < 0.5:
+            getattr(qc, rng.choice(['h', 's', 't', 'x']))(int(rng.integers(num_qubits)))
+        else:
+            a, b = rng.choice(num_qubits, 2, replace=False)
+            qc.cx(int(a), int(b))
+    return qc
+
+
+# ==================== MAIN EXECUTION ====================
+
+# --- Script 4 (Bell state), evolved incrementally ---
+stepper = StatevectorStepper(2)
+stepper.snapshot('initial')
+stepper.h(0)
+stepper.snapshot('after_h')
+stepper.cx(0, 1)
+stepper.snapshot('bell')
+
+print("Initial State (|00>):")
+print(stepper.snapshots['initial'].draw('text'))
+print("\nState after H-gate on q0 (Superposition):")
+print(stepper.snapshots['after_h'].draw('text'))
+print("\nFinal State after CNOT (Entangled Bell State):")
+print(stepper.snapshots['bell'].draw('text'))
+print("\nCircuit Diagram:")
+print(stepper.circuit)
+
+# --- Script 1 (superposition and phase flip) ---
+phase_flip = StatevectorStepper(1)
+print("\nState after Hadamard gate:")
+print(phase_flip.h(0).snapshot('after_h').draw('text'))
+print("State after Z-gate:")
+print(phase_flip.z(0).snapshot('after_z').draw('text'))
+
+# --- Gate-by-gate tracing: re-simulation vs incremental ---
+print(f"\n{'Gates':<8}{'Statevector(qc) per gate (s)':<32}{'Stepper (s)':<14}{'Final states agree'}")
+for num_gates in [50, 100, 200]:
+    qc = random_circuit(12, num_gates)
+
+    start = time.perf_counter()
+    prefix = QuantumCircuit(qc.num_qubits)
+    for instruction in qc.data:
+        prefix.append(instruction)
+        reference = Statevector(prefix)
+    resimulate = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _, state in trace_statevectors(qc):
+        pass
+    incremental = time.perf_counter() - start
+
+    print(f"{num_gates:<8}{resimulate:<32.3f}{incremental:<14.3f}{state.equiv(reference)}")
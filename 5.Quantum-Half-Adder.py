@@ -1,6 +1,8 @@
 # Import necessary components
+import asyncio
 from qiskit import QuantumCircuit, transpile
-from qiskit_aer import AerSimulator
+from quantum_fundamentals.execution import make_simulator
+from quantum_fundamentals.jobs import JobRunner
 
 # Create a circuit with 3 qubits and 2 classical bits
 # q0: input A
@@ -30,11 +32,40 @@ qc.measure(1, 0) # Map q1 to classical bit 0 (Sum)
 qc.measure(2, 1) # Map q2 to classical bit 1 (Carry)
 
 # Simulate the circuit
-simulator = AerSimulator()
+simulator = make_simulator()
 compiled_circuit = transpile(qc, simulator)
 result = simulator.run(compiled_circuit, shots=1).result()
 counts = result.get_counts()
 
 # Print the circuit and the result
 print("Quantum Half-Adder Circuit for 1 + 1:")
-print(qc)
\ No newline at end of file
+print(qc)
+print("Measurement (Carry, Sum):", counts)
+
+# --- Full Truth Table ---
+# One circuit per input pair, each submitted as an awaitable job. Submissions
+# made together are coalesced into a single simulator run.
+def half_adder(a, b):
+    circuit = QuantumCircuit(3, 2)
+    if a:
+        circuit.x(0)
+    if b:
+        circuit.x(1)
+    circuit.ccx(0, 1, 2)
+    circuit.cx(0, 1)
+    circuit.measure(1, 0)
+    circuit.measure(2, 1)
+    return transpile(circuit, simulator)
+
+async def truth_table(inputs):
+    async with JobRunner(simulator) as runner:
+        results = await asyncio.gather(*(runner.run(half_adder(a, b), shots=1) for a, b in inputs))
+    return [result.get_counts() for result in results], runner.stats()
+
+inputs = [(0, 0), (0, 1), (1, 0), (1, 1)]
+table, job_stats = asyncio.run(truth_table(inputs))
+runs = 'run' if job_stats['batches'] == 1 else 'runs'
+print(f"\nTruth table ({job_stats['submissions']} jobs in {job_stats['batches']} simulator {runs}):")
+for (a, b), row in zip(inputs, table):
+    carry, total = next(iter(row))
+    print(f"{a} + {b} -> Carry {carry}, Sum {total}")
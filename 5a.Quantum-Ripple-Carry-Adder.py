@@ -0,0 +1,18 @@
+# Import necessary components
+from quantum_fundamentals.reversible import cuccaro_adder, verify_adder_exhaustively, run_adder_on_aer
+
+# Script 5 checks a half-adder on a single input (1 + 1) with a full simulator
+# run. Adders are built only from X, CX and CCX, so the bit-sliced reversible
+# simulator verifies them classically on all 2^(2n) inputs at once.
+
+# ==================== MAIN EXECUTION ====================
+
+print("4-Bit Cuccaro Ripple-Carry Adder:")
+print(cuccaro_adder(4))
+
+print(f"\n{'n':<4}{'Inputs':<12}{'Gates':<8}{'Correct':<10}{'Time (ms)'}")
+for n in [1, 2, 4, 8, 12]:
+    correct, seconds = verify_adder_exhaustively(n)
+    print(f"{n:<4}{2 ** (2 * n):<12}{cuccaro_adder(n).size():<8}{str(correct):<10}{seconds * 1e3:.2f}")
+
+print(f"\nAer cross-check, 3-bit adder: 5 + 6 = {run_adder_on_aer(3, 5, 6)}")
@@ -1,6 +1,6 @@
 # Import necessary components
 from qiskit import QuantumCircuit
-from qiskit_aer import Aer
+from quantum_fundamentals.execution import make_simulator
 from qiskit.visualization import plot_histogram
 
 # Create a circuit with one qubit
@@ -13,8 +13,8 @@ qc.h(0)
 qc.measure_all()
 
 # --- Run the simulation 1024 times ---
-# Use the Qiskit Aer simulator backend
-simulator = Aer.get_backend('qasm_simulator')
+# Use the Qiskit Aer simulator backend (sized by the active execution profile)
+simulator = make_simulator()
 job = simulator.run(qc, shots=1024)
 result = job.result()
 counts = result.get_counts(qc)
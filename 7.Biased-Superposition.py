@@ -1,7 +1,7 @@
 # Import necessary components
 import numpy as np
 from qiskit import QuantumCircuit, transpile
-from qiskit_aer import AerSimulator
+from quantum_fundamentals.execution import make_simulator
 from qiskit.visualization import plot_histogram
 
 # Create a circuit with one qubit and one classical bit
@@ -18,7 +18,7 @@ qc.measure(0, 0)
 
 # Simulate the circuit
 shots = 4096
-simulator = AerSimulator()
+simulator = make_simulator()
 compiled_circuit = transpile(qc, simulator)
 result = simulator.run(compiled_circuit, shots=shots).result()
 counts = result.get_counts(qc)
@@ -0,0 +1,42 @@
+# Import necessary components
+import time
+import numpy as np
+from qiskit import QuantumCircuit
+from quantum_fundamentals.shots import (
+    stream_shots_to_file, iter_shot_chunks, StreamingBitEstimator, StreamingOutcomeHistogram,
+)
+
+# Script 7 estimates a 75% bias from 4096 aggregated counts. Here every shot is
+# streamed in chunks to a bit-packed memory-mapped file and validated with
+# streaming estimators, so RAM use is bounded by the chunk size.
+
+# ==================== MAIN EXECUTION ====================
+
+# Same biased superposition as script 7: Prob(1) = sin^2(theta/2) = 0.75
+angle = 2 * np.pi / 3
+qc = QuantumCircuit(1, 1)
+qc.ry(angle, 0)
+qc.measure(0, 0)
+theory = np.array([np.cos(angle / 2) ** 2, np.sin(angle / 2) ** 2])
+
+# 10^7 shots keep the demo short; memory stays bounded by CHUNK_SHOTS for 10^9
+total_shots = 10_000_000
+path = 'biased_superposition_shots.npy'
+
+start = time.perf_counter()
+stream_shots_to_file(qc, total_shots, path, seed=1234)
+print(f"Streamed {total_shots} shots to {path} in {time.perf_counter() - start:.1f} s")
+
+start = time.perf_counter()
+mean = StreamingBitEstimator(qc.num_clbits)
+histogram = StreamingOutcomeHistogram(qc.num_clbits)
+for chunk in iter_shot_chunks(path):
+    mean.update(chunk)
+    histogram.update(chunk)
+print(f"Estimated from the record in {time.perf_counter() - start:.1f} s")
+
+low, high = mean.confidence_interval(0.99)
+chi2, p_value = histogram.chi_square(theory)
+print(f"\nTheoretical Prob(1): {theory[1]:.6f}")
+print(f"Estimated Prob(1):   {mean.mean[0]:.6f}  (99% CI [{low[0]:.6f}, {high[0]:.6f}])")
+print(f"Chi-square vs ry({angle:.4f}): statistic = {chi2:.3f}, p-value = {p_value:.3f}")
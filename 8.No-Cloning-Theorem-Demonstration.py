@@ -1,7 +1,7 @@
 # Import necessary components
 import numpy as np
 from qiskit import QuantumCircuit
-from qiskit.quantum_info import Statevector
+from quantum_fundamentals.execution import simulate_statevector
 
 # --- Define an arbitrary initial state for one qubit ---
 # This is the state we want to clone.
@@ -18,7 +18,7 @@ qc.initialize(initial_state_vector, 0) # Prepare q0 in the desired state
 qc.cx(0, 1) # Use a CNOT as a "copying" mechanism
 
 # --- Get the actual final state vector from the circuit ---
-actual_final_state = Statevector(qc)
+actual_final_state = simulate_statevector(qc)
 
 # --- Compare the states ---
 print("Initial State to Clone: |psi> = sqrt(0.7)|0> + sqrt(0.3)|1>")
@@ -1,6 +1,6 @@
 # Import necessary components
 from qiskit import QuantumCircuit, transpile
-from qiskit_aer import AerSimulator
+from quantum_fundamentals.execution import make_simulator
 from qiskit.visualization import plot_histogram
 
 # --- Define the Oracle ---
@@ -38,7 +38,7 @@ for _ in range(num_iterations):
 qc.measure([0, 1, 2], [0, 1, 2])
 
 # Simulate the circuit
-simulator = AerSimulator()
+simulator = make_simulator()
 compiled_circuit = transpile(qc, simulator)
 result = simulator.run(compiled_circuit, shots=1024).result()
 counts = result.get_counts()
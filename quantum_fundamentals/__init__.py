@@ -0,0 +1,71 @@
+"""
+Reusable building blocks of the quantum computing fundamentals examples.
+
+The numbered scripts in the repository root are demos; the circuits,
+simulators and analysis helpers they use live here so they can be imported
+without re-running a demo. Importing the package itself is cheap: submodules,
+and with them qiskit, qiskit_aer, scipy and matplotlib, are only loaded when
+one of their names is first accessed, e.g.
+
+    from quantum_fundamentals import c_amod15   # loads .shor (and qiskit)
+    import quantum_fundamentals.counts          # NumPy only
+
+Run ``python -m quantum_fundamentals --help`` for the command-line interface.
+"""
+import importlib
+
+# Public name -> submodule that defines it
+_EXPORTS = {
+    'qft': ['qft_circuit', 'qft_dagger', 'append_qft_dagger'],
+    'shor': ['c_amod15', 'shor_circuit', 'shors_algorithm', 'process_measurement_results',
+             'print_abstract_circuit', 'print_compact_circuit'],
+    'qaoa': ['TRIANGLE_EDGES', 'maxcut_hamiltonian', 'create_qaoa_circuit', 'make_objective_function',
+             'maxcut_diagonal', 'make_diagonal_objective'],
+    'vqe': ['ising_hamiltonian', 'exact_ground_energy', 'hardware_efficient_ansatz', 'make_cost_function'],
+    'ghz': ['ghz_linear', 'ghz_tree', 'select_simulation_method', 'ghz_fidelity', 'parity_oscillation',
+            'coherence_phases', 'coherence_from_parities', 'run_by_method',
+            'ghz_fidelity_bound', 'fidelity_bound_from_samples'],
+    'bit_flip': ['build_bit_flip_memory_circuit', 'run_noise_sweep', 'fit_logical_error_curve'],
+    'frames': ['sample_pauli_frames', 'reference_sample', 'pauli_noise_table'],
+    'repetition': ['build_repetition_code', 'make_decoder', 'run_memory_experiment'],
+    'reversible': ['cuccaro_adder', 'exhaustive_inputs', 'simulate_reversible', 'verify_adder_exhaustively'],
+    'sparse': ['SparseStatevector', 'simulate_sparse'],
+    'stepper': ['StatevectorStepper', 'trace_statevectors'],
+    'counts': ['IntCounts'],
+    'shots': ['stream_shots_to_file', 'iter_shot_chunks', 'StreamingBitEstimator', 'StreamingOutcomeHistogram'],
+    'bloch': ['bloch_vectors', 'BlochRenderer', 'render_frames'],
+    'drawing': ['draw_circuit', 'print_circuit_summary'],
+    'runner': ['discover_examples', 'run_examples', 'compare_to_baseline'],
+    'execution': ['ExecutionProfile', 'get_profile', 'set_profile', 'make_simulator', 'make_sampler',
+                  'make_estimator', 'complex_dtype', 'simulate_statevector'],
+    'tracing': ['span', 'traced', 'enable_tracing', 'disable_tracing', 'export_chrome_trace', 'export_csv'],
+    'precision': ['validate_precision', 'statevector_deviation', 'counts_deviation', 'expectation_deviation'],
+    'pauli': ['PauliKernel', 'pauli_expectations', 'PauliKernelEstimator'],
+    'grouping': ['MeasurementGroup', 'group_measurements', 'measurement_circuits', 'expectation_from_counts',
+                 'GroupedEstimator'],
+    'lightcone': ['Lightcone', 'LightconeEvaluator', 'make_lightcone_objective'],
+    'warm_start': ['PARAMETER_TABLE', 'interpolate_params', 'fourier_params', 'next_depth_params',
+                   'optimize_depths', 'load_parameter_table', 'save_parameter_table'],
+    'multistart': ['multistart_minimize', 'random_starts'],
+    'maxcut': ['max_cut_brute_force', 'cut_value'],
+    'cache': ['ObjectiveCache', 'default_cache', 'context_digest'],
+    'jobs': ['JobRunner'],
+    'autotune': ['TranspileTuner', 'circuit_family', 'format_measurements'],
+}
+_LOCATIONS = {name: module for module, names in _EXPORTS.items() for name in names}
+
+__all__ = sorted(_LOCATIONS)
+
+
+def __getattr__(name):
+    if name in _LOCATIONS:
+        value = getattr(importlib.import_module(f'.{_LOCATIONS[name]}', __name__), name)
+        globals()[name] = value
+        return value
+    if name in _EXPORTS:
+        return importlib.import_module(f'.{name}', __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__) | set(_EXPORTS))
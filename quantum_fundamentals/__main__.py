@@ -0,0 +1,320 @@
+"""
+Command-line entry point: python -m quantum_fundamentals <command> [options]
+
+Only argparse and the standard library are imported up front; each command
+imports the submodules (and qiskit, qiskit_aer, scipy, ...) it needs itself.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+# Modules that must never be loaded just by importing a submodule
+HEAVY_MODULES = ['qiskit_aer', 'scipy', 'matplotlib']
+# Submodules that must not even load qiskit, and the package root
+NUMPY_ONLY = ['', 'counts', 'reversible', 'shots', 'bloch', 'runner', 'execution', 'precision', 'tracing']
+# Import-time budget in seconds for the package root and NUMPY_ONLY submodules
+IMPORT_BUDGET = 0.5
+REPORT_PATH = 'examples_report.json'
+
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+seconds = time.perf_counter() - start
+print(json.dumps({{'seconds': seconds, 'loaded': [m for m in {watch!r} if m in sys.modules]}}))
+"""
+
+
+def measure_import(module):
+    """Imports module in a fresh interpreter; returns (seconds, heavy modules it loaded)."""
+    watch = HEAVY_MODULES + ['qiskit']
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    output = subprocess.run([sys.executable, '-c', _PROBE.format(module=module, watch=watch)],
+                            cwd=root, capture_output=True, text=True, check=True).stdout
+    probe = json.loads(output)
+    return probe['seconds'], probe['loaded']
+
+
+def cmd_import_time(args):
+    from . import _EXPORTS
+
+    # qiskit itself pulls in scipy; only blame a submodule for what it adds on top
+    _, pulled_in_by_qiskit = measure_import('qiskit')
+    failures = []
+    print(f"{'Module':<36}{'Import (s)':<12}{'Heavy modules loaded'}")
+    for name in [''] + list(_EXPORTS):
+        module = f'quantum_fundamentals.{name}' if name else 'quantum_fundamentals'
+        seconds, loaded = measure_import(module)
+        print(f"{module:<36}{seconds:<12.3f}{', '.join(loaded) or '-'}")
+        if name in NUMPY_ONLY:
+            forbidden = [m for m in loaded if m in HEAVY_MODULES or m == 'qiskit']
+        else:
+            forbidden = [m for m in loaded if m in HEAVY_MODULES and m not in pulled_in_by_qiskit]
+        if forbidden:
+            failures.append(f"{module} eagerly imports {', '.join(forbidden)}")
+        if name in NUMPY_ONLY and seconds > args.budget:
+            failures.append(f"{module} took {seconds:.3f} s (budget {args.budget:.3f} s)")
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    return 1 if failures else 0
+
+
+def cmd_list(args):
+    from . import _EXPORTS
+
+    for module, names in _EXPORTS.items():
+        print(f"{module}: {', '.join(names)}")
+    return 0
+
+
+def cmd_examples(args):
+    from .runner import (discover_examples, run_examples, compare_to_baseline, write_report,
+                         load_report, STAGES)
+
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    paths = discover_examples(root, only=args.only)
+    if args.profile:
+        # Worker processes read the execution profile from the environment
+        os.environ['QC_EXECUTION_PROFILE'] = args.profile
+    print(f"Running {len(paths)} examples with {args.workers or os.cpu_count()} workers")
+    print(f"{'Example':<46}{'Status':<9}" + ''.join(f"{stage:<14}" for stage in STAGES + ['total']) + "Peak RSS (MB)")
+
+    def progress(name, record):
+        seconds = record['seconds'] or {}
+        timings = ''.join(f"{seconds.get(stage, float('nan')):<14.3f}" for stage in STAGES + ['total'])
+        rss = record['peak_rss_mb']
+        print(f"{name:<46}{record['status']:<9}{timings}{rss if rss is None else round(rss)}")
+        if record['error']:
+            print(f"    {record['error']}")
+
+    report = run_examples(paths, max_workers=args.workers, timeout=args.timeout, progress=progress)
+    failed = [name for name, record in report['examples'].items() if record['status'] != 'ok']
+    if args.baseline:
+        report['regressions'] = compare_to_baseline(report, load_report(args.baseline), threshold=args.threshold)
+        print(f"\n{len(report['regressions'])} regression(s) against {args.baseline} "
+              f"(threshold {args.threshold:.0%}):")
+        for r in report['regressions']:
+            if r['stage'] == 'status':
+                print(f"  {r['example']}: was ok, now {r['current']}")
+            else:
+                print(f"  {r['example']} {r['stage']}: {r['baseline']:.3f} s -> {r['current']:.3f} s "
+                      f"({r['ratio']:.2f}x)")
+    write_report(report, args.report)
+    print(f"\nWrote {args.report}" + (f"; failed: {', '.join(failed)}" if failed else ""))
+    return 1 if failed or report.get('regressions') else 0
+
+
+def cmd_profile(args):
+    from .execution import PRESETS, ExecutionProfile, get_profile
+
+    if args.name:
+        profile = ExecutionProfile.from_file(args.name) if args.name.endswith('.json') \
+            else ExecutionProfile.preset(args.name)
+    else:
+        profile = get_profile()
+    print(f"Execution profile: {profile.name}")
+    for option, value in profile.backend_options().items():
+        print(f"  {option} = {value!r}")
+    if not profile.options:
+        print("  (Aer defaults)")
+    print(f"Presets: {', '.join(PRESETS)}")
+    return 0
+
+
+def cmd_precision(args):
+    import numpy as np
+    from qiskit import QuantumCircuit
+    from .ghz import ghz_tree
+    from .precision import validate_precision
+    from .qaoa import create_qaoa_circuit, maxcut_hamiltonian
+    from .qft import qft_circuit
+    from .vqe import hardware_efficient_ansatz, ising_hamiltonian
+
+    n = args.qubits
+    qft = QuantumCircuit(n)
+    qft.x(range(0, n, 3))
+    qft.compose(qft_circuit(n), inplace=True)
+    rng = np.random.default_rng(args.seed)
+    rotations = QuantumCircuit(n)
+    for _ in range(args.layers):
+        for q in range(n):
+            rotations.ry(rng.uniform(0, np.pi), q)
+            rotations.rz(rng.uniform(0, np.pi), q)
+        for q in range(0, n - 1, 2):
+            rotations.cx(q, q + 1)
+    circuits = {f'QFT({n})': qft, f'GHZ tree({n})': ghz_tree(n), f'Rotation layers({n})': rotations}
+    for qc in circuits.values():
+        qc.measure_all()
+    pubs = {'VQE Ising': (hardware_efficient_ansatz(), ising_hamiltonian(), [0.3, -1.2]),
+            'QAOA triangle': (create_qaoa_circuit([0.4, 0.7], 1), maxcut_hamiltonian())}
+
+    rows = validate_precision(circuits, pubs, shots=args.shots, seed=args.seed)
+    print(f"Single vs double precision ({args.shots} shots for counts); state memory "
+          f"{16 * 2 ** n / 2 ** 20:.0f} MiB -> {8 * 2 ** n / 2 ** 20:.0f} MiB")
+    print(f"{'Circuit':<24}{'Check':<14}{'Deviation':<40}{'Sampling double/single (s)'}")
+    worst = 0.0
+    for row in rows:
+        if row['check'] == 'statevector':
+            deviation, timing = f"max |da| {row['max_amplitude_error']:.2e}, infid. {row['infidelity']:.2e}", ''
+            worst = max(worst, row['max_amplitude_error'])
+        elif row['check'] == 'counts':
+            deviation = f"TVD {row['total_variation_distance']:.2e} (noise {row['shot_noise']:.2e})"
+            timing = f"{row['double_seconds']:.3f} / {row['single_seconds']:.3f}"
+        else:
+            deviation, timing = f"|d<H>| {row['abs_deviation']:.2e}", ''
+            worst = max(worst, row['abs_deviation'])
+        print(f"{row['name']:<24}{row['check']:<14}{deviation:<40}{timing}")
+    return 0 if worst <= args.tolerance else 1
+
+
+def cmd_trace(args):
+    import runpy
+    from . import tracing
+
+    tracing.enable_tracing()
+    sys.argv = [args.script] + args.script_args
+    try:
+        with tracing.span(os.path.basename(args.script), 'script'):
+            runpy.run_path(args.script, run_name='__main__')
+    finally:
+        tracing.export(args.out)
+        print(f"\n{'Category':<16}{'Calls':<10}{'Seconds'}")
+        for category, (calls, seconds) in sorted(tracing.summarize().items(), key=lambda item: -item[1][1]):
+            print(f"{category or '-':<16}{calls:<10}{seconds:.4f}")
+        print(f"Wrote {len(tracing.get_spans())} spans to {args.out}")
+    return 0
+
+
+def cmd_shor(args):
+    from .shor import shors_algorithm
+
+    qc, counts, factors = shors_algorithm(args.N, args.a, shots=args.shots)
+    print(f"{args.N} = {factors[0]} × {factors[1]}" if factors else "No factors found in this run.")
+    return 0 if factors else 1
+
+
+def cmd_ghz(args):
+    from .ghz import ghz_fidelity, ghz_fidelity_bound
+
+    if args.exact:
+        fidelity, method = ghz_fidelity(args.qubits, shots=args.shots, seed=args.seed)
+        print(f"{args.qubits}-qubit GHZ fidelity: {fidelity:.4f} ({method})")
+    else:
+        bound, method = ghz_fidelity_bound(args.qubits, shots=args.shots, seed=args.seed)
+        print(f"{args.qubits}-qubit GHZ fidelity >= {bound:.4f} ({method})")
+    return 0
+
+
+def cmd_adder(args):
+    from .reversible import verify_adder_exhaustively
+
+    correct, seconds = verify_adder_exhaustively(args.bits)
+    print(f"{args.bits}-bit adder, {2 ** (2 * args.bits)} inputs: "
+          f"{'correct' if correct else 'INCORRECT'} ({seconds * 1e3:.1f} ms)")
+    return 0 if correct else 1
+
+
+def cmd_qaoa(args):
+    from scipy.optimize import minimize
+    from .qaoa import maxcut_hamiltonian, make_objective_function
+
+    objective_function = make_objective_function(maxcut_hamiltonian())
+    init_params = [0.1, 0.1] * args.reps
+    result = minimize(objective_function, init_params, method='COBYLA',
+                      options={'maxiter': args.maxiter, 'tol': 1e-4})
+    print(f"Optimal Parameters: {result.x}")
+    print(f"Minimum Energy Found: {result.fun:.4f}")
+    return 0
+
+
+def cmd_vqe(args):
+    from scipy.optimize import minimize
+    from .vqe import ising_hamiltonian, exact_ground_energy, hardware_efficient_ansatz, make_cost_function
+
+    hamiltonian = ising_hamiltonian()
+    cost_function = make_cost_function(hardware_efficient_ansatz(), hamiltonian, verbose=False)
+    result = minimize(cost_function, [0.0, 0.0], method='COBYLA',
+                      options={'maxiter': args.maxiter, 'tol': 1e-4})
+    print(f"VQE Final Energy:   {result.fun:.4f}")
+    print(f"Exact Target Energy: {exact_ground_energy(hamiltonian):.4f}")
+    return 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='python -m quantum_fundamentals',
+                                     description="Run the quantum computing fundamentals building blocks.")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    commands.add_parser('list', help="list modules and their public names").set_defaults(func=cmd_list)
+
+    p = commands.add_parser('import-time', help="measure import times and fail on eager heavy imports")
+    p.add_argument('--budget', type=float, default=IMPORT_BUDGET)
+    p.set_defaults(func=cmd_import_time)
+
+    p = commands.add_parser('examples', help="run the numbered example scripts in parallel with stage timings")
+    p.add_argument('only', nargs='*', help="example numbers to run, e.g. 3 4a 17b (default: all)")
+    p.add_argument('--workers', type=int, default=None)
+    p.add_argument('--timeout', type=int, default=1800, help="per-example timeout in seconds")
+    p.add_argument('--report', default=REPORT_PATH, help="JSON report to write")
+    p.add_argument('--baseline', help="earlier report to compare against")
+    p.add_argument('--threshold', type=float, default=0.25, help="relative slowdown flagged as a regression")
+    p.add_argument('--profile', help="execution profile preset or JSON file for the examples' backends")
+    p.set_defaults(func=cmd_examples)
+
+    p = commands.add_parser('profile', help="show the active (or a given) execution profile")
+    p.add_argument('name', nargs='?', help="preset name or JSON file (default: from the environment)")
+    p.set_defaults(func=cmd_profile)
+
+    p = commands.add_parser('precision', help="compare single- against double-precision results")
+    p.add_argument('--qubits', type=int, default=20)
+    p.add_argument('--layers', type=int, default=4)
+    p.add_argument('--shots', type=int, default=100_000)
+    p.add_argument('--seed', type=int, default=1234)
+    p.add_argument('--tolerance', type=float, default=1e-5,
+                   help="largest amplitude / expectation-value deviation accepted")
+    p.set_defaults(func=cmd_precision)
+
+    p = commands.add_parser('trace', help="run a script with span tracing and export the trace")
+    p.add_argument('script')
+    p.add_argument('script_args', nargs=argparse.REMAINDER)
+    p.add_argument('--out', default='trace.json', help="Chrome-trace .json or flat .csv")
+    p.set_defaults(func=cmd_trace)
+
+    p = commands.add_parser('shor', help="factor N with Shor's algorithm")
+    p.add_argument('--N', type=int, default=15)
+    p.add_argument('--a', type=int, default=7)
+    p.add_argument('--shots', type=int, default=2048)
+    p.set_defaults(func=cmd_shor)
+
+    p = commands.add_parser('ghz', help="bound (or estimate) the fidelity of a log-depth GHZ state")
+    p.add_argument('--qubits', type=int, default=1000)
+    p.add_argument('--shots', type=int, default=1000)
+    p.add_argument('--exact', action='store_true',
+                   help="estimate the fidelity itself from n + 1 circuits (tens of qubits)")
+    p.add_argument('--seed', type=int, default=None)
+    p.set_defaults(func=cmd_ghz)
+
+    p = commands.add_parser('adder', help="exhaustively verify an n-bit ripple-carry adder")
+    p.add_argument('--bits', type=int, default=8)
+    p.set_defaults(func=cmd_adder)
+
+    p = commands.add_parser('qaoa', help="optimise QAOA for Max-Cut on the triangle graph")
+    p.add_argument('--reps', type=int, default=2)
+    p.add_argument('--maxiter', type=int, default=50)
+    p.set_defaults(func=cmd_qaoa)
+
+    p = commands.add_parser('vqe', help="run VQE on the two-qubit Ising model")
+    p.add_argument('--maxiter', type=int, default=20)
+    p.set_defaults(func=cmd_vqe)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,194 @@
+"""
+Transpiler optimisation-level autotuning per circuit family (scripts 11, 11a).
+
+Which optimization_level is cheapest end to end depends on the circuit: a
+higher level spends transpile time to shrink depth and size, which pays off
+for a large circuit simulated once and not for a tiny one rebuilt in a loop.
+TranspileTuner.tune measures, for each configuration in CONFIGS (levels 0-3,
+each with and without Aer's gate fusion, the simulator's own optimisation
+pass), the median transpile time, the transpiled depth and size and the
+simulation time at the caller's shot count, and keeps the configuration with
+the lowest
+
+    transpile_seconds + executions * simulate_seconds
+
+Configurations are measured from level 0 up, and one whose first transpile
+already takes longer than the best cost so far is neither repeated nor
+simulated. Timings this small are noisy, so the default configuration (then
+the lowest level) is kept unless another beats it by more than COST_MARGIN.
+Results are stored per family (any string, by default one derived from the
+circuit's name, width and instructions) in a JSON file, QC_TRANSPILE_TUNING or
+transpile_tuning.json, so later runs go straight to the winning setting; the
+winning transpiled circuit is also kept in memory, so transpile() right after
+tune() does not compile it again. A stored result from another Qiskit or Aer
+version, or measured at another shot count, is measured again.
+"""
+import json
+import os
+import re
+import time
+import numpy as np
+
+TUNING_ENV = 'QC_TRANSPILE_TUNING'
+DEFAULT_TUNING_PATH = 'transpile_tuning.json'
+# Names QuantumCircuit gives unnamed circuits
+AUTO_NAME = re.compile(r'circuit-\d+')
+
+# name -> (transpile options, run options)
+CONFIGS = {
+    f'level{level}{suffix}': ({'optimization_level': level}, {'fusion_enable': fusion})
+    for level in range(4) for suffix, fusion in (('', True), ('-nofusion', False))
+}
+# Preferred when no other configuration is clearly cheaper (shors_algorithm's own level, Aer's default fusion)
+DEFAULT_CONFIG = 'level1'
+# A configuration must cost this fraction less than the preferred one to replace it
+COST_MARGIN = 0.1
+
+
+def _versions():
+    import qiskit
+    import qiskit_aer
+    return {'qiskit': qiskit.__version__, 'qiskit_aer': qiskit_aer.__version__}
+
+
+def circuit_family(qc):
+    """
+    Family name from the circuit's name, width and instructions (same
+    construction, same family). Names Qiskit generates ('circuit-41') count
+    up with every circuit built, so they are left out.
+    """
+    from .cache import context_digest
+
+    prefix = 'circuit' if AUTO_NAME.fullmatch(qc.name) else qc.name
+    return f"{prefix}-{qc.num_qubits}q-{context_digest(qc)[:12]}"
+
+
+def _median_seconds(func, repeats):
+    times, value = [], None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        value = func()
+        times.append(time.perf_counter() - start)
+    return float(np.median(times)), value
+
+
+class TranspileTuner:
+    """Measured transpile settings per circuit family, persisted to a JSON file."""
+
+    def __init__(self, path=None, configs=None, executions=1, repeats=3, shots=1024,
+                 default=DEFAULT_CONFIG, margin=COST_MARGIN):
+        self.path = path or os.environ.get(TUNING_ENV) or DEFAULT_TUNING_PATH
+        self.configs = CONFIGS if configs is None else configs
+        self.executions = executions
+        self.repeats = repeats
+        self.shots = shots
+        self.default = default
+        self.margin = margin
+        self.records = {}
+        # family -> (circuit_family of the tuned circuit, winning transpiled circuit), this process only
+        self._compiled = {}
+        if os.path.exists(self.path):
+            with open(self.path) as f:
+                self.records = json.load(f)
+
+    def save(self):
+        # Written aside and renamed, so scripts tuning in parallel never read a partial file
+        temporary = f"{self.path}.{os.getpid()}.tmp"
+        with open(temporary, 'w') as f:
+            json.dump(self.records, f, indent=2)
+        os.replace(temporary, self.path)
+
+    def record(self, family):
+        """Stored tuning result for family, or None (also when it is from other versions)."""
+        record = self.records.get(family)
+        return record if record is not None and record['versions'] == _versions() else None
+
+    def _choose(self, measurements):
+        """Cheapest configuration, unless the default (or else the first) simulated one is within the margin."""
+        best = min(measurements, key=lambda name: measurements[name]['cost'])
+        threshold = measurements[best]['cost'] * (1 + self.margin)
+        preference = [self.default] if self.default in measurements else []
+        preference += [name for name in measurements if name != self.default]
+        for name in preference:
+            m = measurements[name]
+            if m['simulate_seconds'] is not None and m['cost'] <= threshold:
+                return name
+        return best
+
+    def tune(self, qc, backend=None, family=None, force=False, shots=None):
+        """
+        Measures every configuration on qc, simulating shots shots (the
+        tuner's default when None), and stores the winner. Returns the record:
+        {'config', 'transpile_options', 'run_options', 'shots', 'measurements',
+        'versions'}, measurements holding transpile_seconds, depth, size,
+        simulate_seconds and cost per configuration.
+        """
+        from qiskit import transpile
+
+        family = family or circuit_family(qc)
+        shots = self.shots if shots is None else shots
+        stored = self.record(family)
+        if not force and stored is not None and stored.get('shots') == shots:
+            return stored
+        if backend is None:
+            from .execution import make_simulator
+            backend = make_simulator()
+
+        measurements, compiled, best_cost = {}, {}, np.inf
+        for name, (transpile_options, run_options) in self.configs.items():
+            key = json.dumps(transpile_options, sort_keys=True)
+            if key not in compiled:
+                # Configurations differing only in run options share one transpilation
+                compile_once = lambda: transpile(qc, backend, **transpile_options)  # noqa: E731
+                compiled[key] = _median_seconds(compile_once, 1)
+                if compiled[key][0] < best_cost and self.repeats > 1:
+                    compiled[key] = _median_seconds(compile_once, self.repeats)
+            transpile_seconds, tqc = compiled[key]
+            measurement = {'transpile_seconds': transpile_seconds, 'depth': tqc.depth(), 'size': tqc.size()}
+            if transpile_seconds >= best_cost:
+                # Transpiling alone costs more than the best so far: not simulated
+                measurement.update(simulate_seconds=None, cost=transpile_seconds)
+            else:
+                backend.run(tqc, shots=shots, **run_options).result()  # warm-up
+                simulate_seconds, _ = _median_seconds(
+                    lambda: backend.run(tqc, shots=shots, **run_options).result(), self.repeats)
+                measurement.update(simulate_seconds=simulate_seconds,
+                                   cost=transpile_seconds + self.executions * simulate_seconds)
+                best_cost = min(best_cost, measurement['cost'])
+            measurements[name] = measurement
+        best = self._choose(measurements)
+        self._compiled[family] = (circuit_family(qc),
+                                  compiled[json.dumps(self.configs[best][0], sort_keys=True)][1])
+        self.records[family] = {'config': best, 'transpile_options': self.configs[best][0],
+                                'run_options': self.configs[best][1], 'shots': shots,
+                                'measurements': measurements, 'versions': _versions()}
+        self.save()
+        return self.records[family]
+
+    def transpile(self, qc, backend, family=None, shots=None):
+        """
+        qc transpiled with the family's winning options (tuned now, at shots,
+        if the family has no record). The circuit compiled while tuning is
+        returned as is when qc matches it. Returns (transpiled circuit, run
+        options).
+        """
+        from qiskit import transpile
+
+        family = family or circuit_family(qc)
+        record = self.tune(qc, backend, family, shots=shots)
+        fingerprint, tqc = self._compiled.get(family, (None, None))
+        if tqc is None or fingerprint != circuit_family(qc):
+            tqc = transpile(qc, backend, **record['transpile_options'])
+            self._compiled[family] = (circuit_family(qc), tqc)
+        return tqc, dict(record['run_options'])
+
+
+def format_measurements(record):
+    """Table of a tuning record's measurements, best configuration marked ('-': not simulated)."""
+    lines = [f"{'Config':<18}{'Transpile (ms)':>15}{'Depth':>8}{'Size':>8}{'Simulate (ms)':>15}{'Cost (ms)':>12}"]
+    for name, m in record['measurements'].items():
+        marker = ' *' if name == record['config'] else ''
+        simulate = '-' if m['simulate_seconds'] is None else f"{1000 * m['simulate_seconds']:.1f}"
+        lines.append(f"{name + marker:<18}{1000 * m['transpile_seconds']:>15.1f}{m['depth']:>8}{m['size']:>8}"
+                     f"{simulate:>15}{1000 * m['cost']:>12.1f}")
+    return '\n'.join(lines)
@@ -0,0 +1,123 @@
+"""
+Headless batch Bloch-sphere rendering with figure reuse (script 2a).
+
+One Agg figure is built per process and only the Bloch vector artists are
+updated per frame. Batches of frames are split across a process pool, each
+worker owning its own figure.
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+
+
+def bloch_vectors(state):
+    """(num_qubits, 3) array of single-qubit Bloch vectors of a pure state."""
+    data = np.asarray(getattr(state, 'data', state))
+    n = int(np.log2(len(data)))
+    vectors = np.empty((n, 3))
+    for k in range(n):
+        # Reduced density matrix of qubit k (little-endian ordering)
+        psi = data.reshape(2 ** (n - k - 1), 2, 2 ** k)
+        rho = np.einsum('aib,ajb->ij', psi, psi.conj())
+        vectors[k] = [2 * rho[0, 1].real, 2 * rho[1, 0].imag, (rho[0, 0] - rho[1, 1]).real]
+    return vectors
+
+
+def _pyplot():
+    """Imports pyplot on the headless Agg backend (no display or GUI toolkit)."""
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    return plt
+
+
+class BlochRenderer:
+    """One reusable Agg figure with a Bloch sphere per qubit."""
+
+    def __init__(self, num_qubits, size=3.0, dpi=80):
+        plt = _pyplot()
+        self.figure = plt.figure(figsize=(size * num_qubits, size), dpi=dpi)
+        self.title = self.figure.suptitle('')
+        self.arrows = []
+        u, v = np.mgrid[0:2 * np.pi:24j, 0:np.pi:12j]
+        for k in range(num_qubits):
+            ax = self.figure.add_subplot(1, num_qubits, k + 1, projection='3d')
+            ax.plot_wireframe(np.cos(u) * np.sin(v), np.sin(u) * np.sin(v), np.cos(v),
+                              color='lightgray', linewidth=0.4)
+            for axis in np.eye(3):
+                ax.plot(*np.stack([-axis, axis]).T, color='gray', linewidth=0.6)
+            ax.text(0, 0, 1.2, '|0>', ha='center')
+            ax.text(0, 0, -1.35, '|1>', ha='center')
+            ax.set_axis_off()
+            ax.set_box_aspect((1, 1, 1))
+            ax.set_title(f'qubit {k}')
+            line, = ax.plot([0, 0], [0, 0], [0, 1], color='#6f2da8', linewidth=2)
+            tip, = ax.plot([0], [0], [1], 'o', color='#6f2da8')
+            self.arrows.append((line, tip))
+
+    def update(self, vectors, title=''):
+        """Moves the Bloch vector artists; nothing else on the figure is rebuilt."""
+        for (line, tip), (x, y, z) in zip(self.arrows, vectors):
+            line.set_data_3d([0, x], [0, y], [0, z])
+            tip.set_data_3d([x], [y], [z])
+        self.title.set_text(title)
+        return [artist for arrow in self.arrows for artist in arrow] + [self.title]
+
+    def render(self, vectors, path, title=''):
+        self.update(vectors, title)
+        self.figure.savefig(path)
+
+    def animate(self, frames, path, titles=None, fps=4):
+        """Writes all frames as one GIF through the same figure."""
+        from matplotlib.animation import FuncAnimation, PillowWriter
+
+        titles = titles or [''] * len(frames)
+        animation = FuncAnimation(self.figure, lambda i: self.update(frames[i], titles[i]),
+                                  frames=len(frames), blit=False)
+        animation.save(path, writer=PillowWriter(fps=fps))
+
+
+# One renderer per worker process, created lazily on its first batch
+_worker_renderer = None
+
+
+def _render_batch(batch):
+    global _worker_renderer
+    vectors, paths, titles = batch
+    if _worker_renderer is None or len(_worker_renderer.arrows) != vectors.shape[1]:
+        _worker_renderer = BlochRenderer(vectors.shape[1])
+    for frame, path, title in zip(vectors, paths, titles):
+        _worker_renderer.render(frame, path, title)
+    return len(paths)
+
+
+def render_frames(states, out_dir, titles=None, workers=None, prefix='frame'):
+    """
+    Renders one PNG per state into out_dir using a pool of worker processes.
+    Bloch vectors are computed up front, so only small arrays are sent to workers.
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    vectors = np.stack([bloch_vectors(s) for s in states])
+    titles = titles or [''] * len(states)
+    paths = [os.path.join(out_dir, f'{prefix}_{i:05d}.png') for i in range(len(states))]
+    workers = workers or os.cpu_count()
+    bounds = np.linspace(0, len(states), workers + 1).astype(int)
+    batches = [(vectors[a:b], paths[a:b], titles[a:b]) for a, b in zip(bounds[:-1], bounds[1:]) if b > a]
+    if workers == 1:
+        return sum(map(_render_batch, batches))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return sum(pool.map(_render_batch, batches))
+
+
+def gate_sequence_states(qc):
+    """Statevector after each gate of qc, evolved incrementally."""
+    from qiskit.quantum_info import Statevector
+
+    state = Statevector.from_int(0, 2 ** qc.num_qubits)
+    states, titles = [state], ['initial']
+    for instruction in qc.data:
+        qubits = [qc.find_bit(q).index for q in instruction.qubits]
+        state = state.evolve(instruction.operation, qubits)
+        states.append(state)
+        titles.append(f'{instruction.operation.name} {qubits}')
+    return states, titles
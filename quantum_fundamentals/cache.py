@@ -0,0 +1,158 @@
+"""
+Memoised objective evaluations (scripts 16 and 18).
+
+ObjectiveCache.wrap(objective, *context) returns an objective that looks each
+parameter vector up before evaluating it. The key is a digest of the context
+(circuits, observables, anything else that fixes the function) and of the
+parameters rounded to a tolerance, so optimiser steps that revisit a point,
+repeated sweeps and reruns of a script reuse earlier evaluations:
+
+    memory  an LRU of the most recent values (capacity entries)
+    disk    an append-only JSON-lines file, one {"key", "value"} per
+            evaluation, flushed as it is written; an interrupted run keeps
+            everything evaluated so far. Only an index of key -> file offset
+            is held in memory.
+
+Circuits are hashed by their instructions and parameter names, and
+SparsePauliOps by their labels and coefficients, so the digests stay the same
+from one process to the next. The estimator's type and the execution profile
+(precision, Aer options) are part of the digest too. default_cache() stores to the file named by
+QC_OBJECTIVE_CACHE (memory only when unset).
+"""
+import hashlib
+import json
+import os
+from collections import OrderedDict
+import numpy as np
+
+CACHE_ENV = 'QC_OBJECTIVE_CACHE'
+DEFAULT_CAPACITY = 4096
+# Parameters closer than this (per component) share an entry
+DEFAULT_TOLERANCE = 1e-9
+
+
+def _context_token(item):
+    """A process-independent description of one context item."""
+    from qiskit import QuantumCircuit
+    from qiskit.quantum_info import SparsePauliOp
+
+    if isinstance(item, QuantumCircuit):
+        instructions = [(instruction.operation.name,
+                         [item.find_bit(qubit).index for qubit in instruction.qubits],
+                         [item.find_bit(clbit).index for clbit in instruction.clbits],
+                         [str(param) for param in instruction.operation.params])
+                        for instruction in item.data]
+        return ['circuit', item.num_qubits, item.num_clbits, str(item.global_phase), instructions]
+    if isinstance(item, SparsePauliOp):
+        return ['operator', item.paulis.to_labels(), [[c.real, c.imag] for c in item.coeffs.tolist()]]
+    if isinstance(item, np.ndarray):
+        return ['array', item.dtype.str, list(item.shape), hashlib.blake2b(item.tobytes()).hexdigest()]
+    return ['repr', repr(item)]
+
+
+def context_digest(*context):
+    """Hex digest identifying an objective function by what it was built from."""
+    text = json.dumps([_context_token(item) for item in context], default=str)
+    return hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
+
+
+class ObjectiveCache:
+    """LRU of objective values in front of an optional append-only file."""
+
+    def __init__(self, path=None, capacity=DEFAULT_CAPACITY, tolerance=DEFAULT_TOLERANCE):
+        self.path = path
+        self.capacity = capacity
+        self.tolerance = tolerance
+        self.memory_hits = self.disk_hits = self.misses = 0
+        self._memory = OrderedDict()
+        self._offsets = {}
+        if path is not None and os.path.exists(path):
+            self._index()
+
+    def _index(self):
+        with open(self.path, 'rb') as f:
+            offset = 0
+            for line in f:
+                # A line cut short by an interrupted write (always the last one) is dropped below
+                if not line.endswith(b'\n'):
+                    break
+                try:
+                    self._offsets[json.loads(line)['key']] = offset
+                except (ValueError, KeyError):
+                    pass
+                offset += len(line)
+        if offset < os.path.getsize(self.path):
+            # Otherwise the next record would be appended to the fragment and lost with it
+            with open(self.path, 'r+b') as f:
+                f.truncate(offset)
+
+    def key(self, digest, params):
+        steps = np.rint(np.asarray(params, dtype=float).ravel() / self.tolerance).astype(np.int64)
+        return hashlib.blake2b(digest.encode() + steps.tobytes(), digest_size=16).hexdigest()
+
+    def _remember(self, key, value):
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        if len(self._memory) > self.capacity:
+            self._memory.popitem(last=False)
+
+    def get(self, key):
+        """Cached value for key, or None."""
+        if key in self._memory:
+            self.memory_hits += 1
+            self._memory.move_to_end(key)
+            return self._memory[key]
+        if key in self._offsets:
+            with open(self.path, 'rb') as f:
+                f.seek(self._offsets[key])
+                value = json.loads(f.readline())['value']
+            self.disk_hits += 1
+            self._remember(key, value)
+            return value
+        return None
+
+    def put(self, key, value):
+        self._remember(key, value)
+        if self.path is not None and key not in self._offsets:
+            with open(self.path, 'ab') as f:
+                self._offsets[key] = f.tell()
+                f.write(json.dumps({'key': key, 'value': value}).encode() + b'\n')
+
+    def wrap(self, objective, *context, estimator=None):
+        """
+        objective(params) memoised under the digest of context, of the
+        estimator (by default objective.estimator, as set by
+        make_objective_function and make_cost_function) and of the execution
+        profile, so values computed under another estimator, profile or
+        precision are not reused.
+        """
+        from .execution import get_profile
+
+        estimator = getattr(objective, 'estimator', None) if estimator is None else estimator
+        profile = getattr(estimator, 'profile', None) or get_profile()
+        estimator_token = None if estimator is None else (
+            f"{type(estimator).__module__}.{type(estimator).__qualname__}",
+            getattr(estimator, '_default_precision', None))
+        digest = context_digest(*context, estimator_token, repr(profile))
+
+        def cached_objective(params):
+            key = self.key(digest, params)
+            value = self.get(key)
+            if value is None:
+                self.misses += 1
+                value = float(objective(params))
+                self.put(key, value)
+            return value
+
+        cached_objective.cache = self
+        cached_objective.digest = digest
+        return cached_objective
+
+    def stats(self):
+        return {'memory_hits': self.memory_hits, 'disk_hits': self.disk_hits, 'misses': self.misses,
+                'entries': len(self._offsets) if self.path is not None else len(self._memory)}
+
+
+def default_cache(capacity=DEFAULT_CAPACITY, tolerance=DEFAULT_TOLERANCE):
+    """ObjectiveCache on the file named by QC_OBJECTIVE_CACHE, or in memory only."""
+    return ObjectiveCache(os.environ.get(CACHE_ENV) or None, capacity, tolerance)
@@ -0,0 +1,145 @@
+"""
+Integer-indexed measurement histograms (script 20a).
+
+IntCounts keeps a histogram as NumPy arrays indexed by the integer outcome: a
+dense count array for few bits, sorted (key, value) arrays otherwise.
+Bitstrings are only built when the histogram is displayed.
+"""
+import numpy as np
+from .tracing import traced
+
+# Up to this many bits the histogram is a dense array of length 2^n
+DENSE_MAX_BITS = 16
+
+
+class IntCounts:
+    """Measurement histogram keyed by integer outcomes (bit k = clbit k)."""
+
+    def __init__(self, num_bits, keys, values):
+        """keys: sorted unique uint64 outcomes, values: their int64 counts."""
+        if num_bits > 64:
+            raise ValueError("IntCounts supports at most 64 classical bits")
+        self.num_bits = num_bits
+        if num_bits <= DENSE_MAX_BITS:
+            self._dense = np.bincount(keys.astype(np.int64), weights=values, minlength=2 ** num_bits).astype(np.int64)
+            self._keys = self._values = None
+        else:
+            self._dense = None
+            self._keys = keys.astype(np.uint64)
+            self._values = values.astype(np.int64)
+
+    # --- Constructors ---
+    @classmethod
+    def from_samples(cls, num_bits, samples):
+        """From one integer outcome per shot."""
+        keys, values = np.unique(np.asarray(samples, dtype=np.uint64), return_counts=True)
+        return cls(num_bits, keys, values)
+
+    @classmethod
+    @traced('post_process')
+    def from_bitarray(cls, bit_array):
+        """From a primitives BitArray (e.g. SamplerV2 result data), without strings."""
+        packed = bit_array.array.reshape(-1, bit_array.array.shape[-1])
+        # BitArray rows are big-endian bytes; left-pad to 8 bytes and view as uint64
+        padded = np.zeros((packed.shape[0], 8), dtype=np.uint8)
+        padded[:, 8 - packed.shape[1]:] = packed
+        return cls.from_samples(bit_array.num_bits, padded.view('>u8').ravel())
+
+    @classmethod
+    @traced('post_process')
+    def from_result(cls, result, experiment=0):
+        """From a backend Result (e.g. AerSimulator.run), via its integer-valued hex counts (no bitstrings)."""
+        header = result.results[experiment].header
+        num_bits = header['memory_slots'] if isinstance(header, dict) else header.memory_slots
+        counts = result.data(experiment).get('counts', {})
+        keys = np.array([int(key, 16) for key in counts], dtype=np.uint64)
+        return cls._aggregate(num_bits, keys, np.array(list(counts.values()), dtype=np.int64))
+
+    @classmethod
+    def from_dict(cls, counts, num_bits=None):
+        """From a get_counts() style {bitstring: count} dict (an empty dict gives an empty histogram)."""
+        items = [(int(k.replace(' ', ''), 2), v) for k, v in counts.items()]
+        if num_bits is None:
+            num_bits = len(next(iter(counts)).replace(' ', '')) if counts else 0
+        keys = np.array([k for k, _ in items], dtype=np.uint64)
+        values = np.array([v for _, v in items], dtype=np.int64)
+        order = np.argsort(keys)
+        return cls(num_bits, keys[order], values[order])
+
+    # --- Views ---
+    @property
+    def dense(self):
+        return self._dense is not None
+
+    def keys_values(self):
+        """(keys, values) of the non-zero outcomes, sorted by key."""
+        if self.dense:
+            keys = np.flatnonzero(self._dense).astype(np.uint64)
+            return keys, self._dense[keys.astype(np.int64)]
+        return self._keys, self._values
+
+    @property
+    def shots(self):
+        return int(self._dense.sum() if self.dense else self._values.sum())
+
+    def __len__(self):
+        return int(np.count_nonzero(self._dense)) if self.dense else len(self._keys)
+
+    def __getitem__(self, outcome):
+        if isinstance(outcome, str):
+            outcome = int(outcome.replace(' ', ''), 2)
+        if self.dense:
+            return int(self._dense[outcome])
+        i = np.searchsorted(self._keys, np.uint64(outcome))
+        return int(self._values[i]) if i < len(self._keys) and self._keys[i] == outcome else 0
+
+    @property
+    def nbytes(self):
+        return self._dense.nbytes if self.dense else self._keys.nbytes + self._values.nbytes
+
+    # --- Vectorised operations ---
+    def top_k(self, k):
+        """The k most frequent outcomes as (keys, values), most frequent first."""
+        keys, values = self.keys_values()
+        k = min(k, len(keys))
+        if k <= 0:
+            return keys[:0], values[:0]
+        part = np.argpartition(values, len(values) - k)[len(values) - k:]
+        order = part[np.argsort(values[part], kind='stable')[::-1]]
+        return keys[order], values[order]
+
+    def marginal(self, bits):
+        """Histogram over the given clbit indices; bits[j] becomes bit j."""
+        keys, values = self.keys_values()
+        new_keys = np.zeros_like(keys)
+        for j, bit in enumerate(bits):
+            new_keys |= ((keys >> np.uint64(bit)) & np.uint64(1)) << np.uint64(j)
+        return IntCounts._aggregate(len(bits), new_keys, values)
+
+    def merge(self, other):
+        """Sum of two histograms over the same number of bits."""
+        if other.num_bits != self.num_bits:
+            raise ValueError("Cannot merge histograms of different widths")
+        (keys_a, values_a), (keys_b, values_b) = self.keys_values(), other.keys_values()
+        return IntCounts._aggregate(self.num_bits, np.concatenate([keys_a, keys_b]),
+                                    np.concatenate([values_a, values_b]))
+
+    __add__ = merge
+
+    @staticmethod
+    def _aggregate(num_bits, keys, values):
+        if not len(keys):
+            return IntCounts(num_bits, keys.astype(np.uint64), values.astype(np.int64))
+        order = np.argsort(keys, kind='stable')
+        keys, values = keys[order], values[order]
+        starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]])
+        return IntCounts(num_bits, keys[starts], np.add.reduceat(values, starts))
+
+    # --- Display only ---
+    def bitstring(self, key):
+        return format(int(key), f'0{self.num_bits}b')
+
+    def to_dict(self):
+        """{bitstring: count}, as returned by get_counts()."""
+        keys, values = self.keys_values()
+        return {self.bitstring(k): int(v) for k, v in zip(keys, values)}
@@ -0,0 +1,88 @@
+"""
+Opt-in, off-the-hot-path circuit drawing for the example scripts.
+
+Rendering a large circuit with the mpl drawer can take longer than simulating
+it. draw_circuit() therefore does nothing unless QC_DRAW_CIRCUITS=1 is set,
+prints a compact summary instead of drawing circuits above a size cutoff, and
+otherwise hands the circuit to a separate Python process (via a QPY file) so
+the calling script never waits for Matplotlib. Relative filenames are written
+under QC_DRAW_DIR (circuit_drawings by default), so the figures checked into
+the repository are never overwritten.
+"""
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from collections import Counter
+
+# Circuits with more operations than this are summarised instead of drawn
+DRAW_MAX_OPS = 1500
+DRAW_DIR_ENV = 'QC_DRAW_DIR'
+DEFAULT_DRAW_DIR = 'circuit_drawings'
+
+
+def drawing_enabled():
+    return os.environ.get('QC_DRAW_CIRCUITS', '0') == '1'
+
+
+def print_circuit_summary(qc, title='ABSTRACT CIRCUIT STRUCTURE'):
+    """Compact text summary in the style of print_abstract_circuit (script 11a)."""
+    print("=" * 80)
+    print(title.center(80))
+    print("=" * 80)
+    print("Registers:")
+    for register in qc.qregs:
+        print(f"  - {register.name}: {register.size} qubits")
+    for register in qc.cregs:
+        print(f"  - {register.name}: {register.size} classical bits")
+    print("\nOperations:")
+    for name, count in Counter(inst.operation.name for inst in qc.data).most_common():
+        print(f"  - {name}: {count}")
+    print(f"\nTotal operations: {qc.size()}")
+    print(f"Circuit depth: {qc.depth()}")
+    print("=" * 80)
+
+
+def draw_circuit(qc, filename, max_ops=DRAW_MAX_OPS, summary=print_circuit_summary, **draw_kwargs):
+    """
+    Renders qc to filename (relative to QC_DRAW_DIR) with the mpl drawer in
+    a background process.
+
+    Returns the subprocess.Popen handle, or None when drawing is disabled or
+    the circuit is above max_ops (in which case summary(qc) is printed).
+    """
+    if not drawing_enabled():
+        return None
+    if qc.size() > max_ops:
+        print(f"Circuit has {qc.size()} operations (> {max_ops}); printing a summary instead of drawing {filename}")
+        summary(qc)
+        return None
+
+    directory = os.environ.get(DRAW_DIR_ENV) or DEFAULT_DRAW_DIR
+    filename = os.path.join(directory, filename)
+    os.makedirs(os.path.dirname(filename) or '.', exist_ok=True)
+
+    from qiskit import qpy
+    with tempfile.NamedTemporaryFile(suffix='.qpy', delete=False) as f:
+        qpy.dump(qc, f)
+    return subprocess.Popen(
+        [sys.executable, os.path.abspath(__file__), f.name, filename, json.dumps(draw_kwargs)],
+        stdout=subprocess.DEVNULL,
+    )
+
+
+def _render(qpy_path, filename, draw_kwargs):
+    import matplotlib
+    matplotlib.use('Agg')
+    from qiskit import qpy
+    try:
+        with open(qpy_path, 'rb') as f:
+            qc = qpy.load(f)[0]
+    finally:
+        os.remove(qpy_path)
+    qc.draw(output='mpl', filename=filename, **draw_kwargs)
+
+
+if __name__ == '__main__':
+    _render(sys.argv[1], sys.argv[2], json.loads(sys.argv[3]))
@@ -0,0 +1,182 @@
+"""
+Execution profiles: one place that sizes every Aer backend the examples use.
+
+A profile is a named set of AerSimulator options (thread counts, shot and
+experiment parallelism, gate fusion, precision). make_simulator, make_sampler
+and make_estimator build Aer backends and primitives from the active profile,
+which is read once from the environment:
+
+    QC_EXECUTION_PROFILE=latency                 a preset name, or
+    QC_EXECUTION_PROFILE=/path/to/profile.json   {"preset": "throughput", "max_parallel_threads": 16}
+    QC_AER_MAX_PARALLEL_THREADS=8                per-option overrides (QC_AER_<OPTION>)
+
+Presets:
+    default     Aer's own defaults
+    throughput  many small circuits: one thread per circuit, circuits run in parallel
+    shots       one circuit, many (noisy) shots: shots run in parallel
+    latency     one big circuit: all threads on the state update, fusion and
+                OpenMP kick in at smaller widths
+
+The precision option ('double' or 'single', also QC_AER_PRECISION=single)
+applies to the Aer backends and primitives, simulate_statevector and the
+in-house engines (StatevectorStepper, the dense fallback of simulate_sparse).
+Single precision halves the memory of a dense state; see
+quantum_fundamentals.precision for checking what it costs in accuracy.
+"""
+import json
+import os
+import numpy as np
+# Imported for its side effect: QC_TRACE=<file> turns tracing on for any script using the package
+from . import tracing  # noqa: F401
+
+PROFILE_ENV = 'QC_EXECUTION_PROFILE'
+OPTION_ENV_PREFIX = 'QC_AER_'
+
+# Option -> type of the AerSimulator options a profile may set
+PROFILE_OPTIONS = {
+    'max_parallel_threads': int,
+    'max_parallel_experiments': int,
+    'max_parallel_shots': int,
+    'max_memory_mb': int,
+    'statevector_parallel_threshold': int,
+    'fusion_enable': bool,
+    'fusion_threshold': int,
+    'fusion_max_qubit': int,
+    'precision': str,
+}
+PRECISIONS = ['double', 'single']
+
+# Aer reads 0 as "all available cores" for the max_parallel_* options
+PRESETS = {
+    'default': {},
+    'throughput': {'max_parallel_threads': 0, 'max_parallel_experiments': 0, 'max_parallel_shots': 1},
+    'shots': {'max_parallel_threads': 0, 'max_parallel_experiments': 1, 'max_parallel_shots': 0},
+    'latency': {'max_parallel_threads': 0, 'max_parallel_experiments': 1, 'max_parallel_shots': 1,
+                'statevector_parallel_threshold': 12, 'fusion_enable': True, 'fusion_threshold': 12},
+}
+
+_active = None
+
+
+def _parse_option(name, value):
+    if name not in PROFILE_OPTIONS:
+        raise ValueError(f"unknown execution profile option {name!r}; expected one of {sorted(PROFILE_OPTIONS)}")
+    kind = PROFILE_OPTIONS[name]
+    if kind is bool and isinstance(value, str):
+        value = value.strip().lower() in ('1', 'true', 'yes', 'on')
+    value = kind(value)
+    if name == 'precision' and value not in PRECISIONS:
+        raise ValueError(f"precision must be one of {PRECISIONS}, got {value!r}")
+    return value
+
+
+class ExecutionProfile:
+    """A named set of AerSimulator options."""
+
+    def __init__(self, name='default', **options):
+        self.name = name
+        self.options = {key: _parse_option(key, value) for key, value in options.items()}
+
+    @classmethod
+    def preset(cls, name, **overrides):
+        if name not in PRESETS:
+            raise ValueError(f"unknown execution profile {name!r}; presets are {sorted(PRESETS)}")
+        return cls(name, **{**PRESETS[name], **overrides})
+
+    @classmethod
+    def from_file(cls, path):
+        """From a JSON file: {"preset": <name>, <option>: <value>, ...}."""
+        with open(path) as f:
+            config = json.load(f)
+        return cls.preset(config.pop('preset', 'default'), **config)
+
+    @classmethod
+    def from_env(cls, environ=None):
+        """From QC_EXECUTION_PROFILE (preset name or JSON file) plus QC_AER_<OPTION> overrides."""
+        environ = os.environ if environ is None else environ
+        source = environ.get(PROFILE_ENV, 'default')
+        profile = cls.from_file(source) if source.endswith('.json') else cls.preset(source)
+        overrides = {key[len(OPTION_ENV_PREFIX):].lower(): value
+                     for key, value in environ.items() if key.startswith(OPTION_ENV_PREFIX)}
+        return profile.replace(**overrides) if overrides else profile
+
+    def replace(self, **options):
+        """Copy of this profile with some options changed."""
+        return ExecutionProfile(self.name, **{**self.options, **options})
+
+    @property
+    def precision(self):
+        return self.options.get('precision', 'double')
+
+    def backend_options(self, **options):
+        """AerSimulator options of this profile, updated with options."""
+        return {**self.options, **options}
+
+    def __repr__(self):
+        options = ', '.join(f'{key}={value!r}' for key, value in self.options.items())
+        return f"ExecutionProfile({self.name!r}{', ' if options else ''}{options})"
+
+
+def get_profile():
+    """The active profile, read from the environment on first use."""
+    global _active
+    if _active is None:
+        _active = ExecutionProfile.from_env()
+    return _active
+
+
+def set_profile(profile):
+    """Activates a profile (an ExecutionProfile or a preset name); None re-reads the environment."""
+    global _active
+    _active = ExecutionProfile.preset(profile) if isinstance(profile, str) else profile
+
+
+def complex_dtype(profile=None):
+    """NumPy dtype of statevector amplitudes under the profile's precision."""
+    return np.complex64 if (profile or get_profile()).precision == 'single' else np.complex128
+
+
+def simulate_statevector(qc, profile=None):
+    """
+    Final Statevector of qc (final measurements ignored). In double precision
+    this is Statevector(qc); in single precision the circuit runs on Aer's
+    statevector method with precision='single'.
+    """
+    from qiskit import transpile
+    from qiskit.quantum_info import Statevector
+
+    profile = profile or get_profile()
+    qc = qc.remove_final_measurements(inplace=False)
+    if profile.precision == 'double':
+        return Statevector(qc)
+    simulator = make_simulator(profile, method='statevector')
+    qc.save_statevector()
+    # Level 0: higher levels may elide SWAPs into a final layout, which save_statevector ignores
+    return simulator.run(transpile(qc, simulator, optimization_level=0)).result().get_statevector()
+
+
+def make_simulator(profile=None, **options):
+    """AerSimulator configured by the profile (default: the active one); options take precedence."""
+    from qiskit_aer import AerSimulator
+
+    profile = profile or get_profile()
+    return AerSimulator(**profile.backend_options(**options))
+
+
+def make_sampler(seed=None, default_shots=1024, profile=None, **options):
+    """Aer SamplerV2 whose simulator is configured by the profile; options are extra backend options."""
+    from qiskit_aer.primitives import SamplerV2
+
+    profile = profile or get_profile()
+    return SamplerV2(default_shots=default_shots, seed=seed,
+                     options={'backend_options': profile.backend_options(**options)})
+
+
+def make_estimator(seed=None, profile=None, **options):
+    """Aer EstimatorV2 (exact expectation values) whose simulator is configured by the profile."""
+    from qiskit_aer.primitives import EstimatorV2
+
+    profile = profile or get_profile()
+    run_options = {} if seed is None else {'seed_simulator': seed}
+    return EstimatorV2(options={'backend_options': profile.backend_options(**options),
+                                'run_options': run_options})
@@ -0,0 +1,138 @@
+"""
+Vectorised Pauli-frame sampling of noisy Clifford circuits (scripts 3a and 17a).
+
+Aer's stabilizer method draws the noise of every shot separately, so a few
+noisy shots of a small circuit cost about as much as a statevector run. For
+Pauli noise on a Clifford circuit only the Pauli error that has accumulated
+on each qubit matters: a noisy shot is a noiseless reference shot with the
+measured bits flipped wherever that error has an X component. The frames of
+all shots are held as (num_qubits, shots) boolean X and Z arrays, so each gate
+is one XOR or swap over every shot at once, and each noise location one draw
+of shots Pauli indices:
+
+    h        swaps X and Z         cx c, t  X_t ^= X_c, Z_c ^= Z_t
+    s, sdg   Z ^= X                cz a, b  Z_a ^= X_b, Z_b ^= X_a
+    sx, sxdg X ^= Z                swap     swaps the two qubits' frames
+    measure  records X, then randomises Z (the state collapsed onto Z)
+
+Frames start, and restart after a reset, with a random Z, which leaves |0>
+unchanged; carried through the circuit it randomises exactly the outcomes that
+are random in the noiseless circuit, so one reference shot is enough.
+"""
+import numpy as np
+from .tracing import traced
+
+# Gates that leave every frame unchanged (Paulis only change the sign)
+PAULI_GATES = {'id', 'x', 'y', 'z', 'barrier', 'delay'}
+FRAME_GATES = PAULI_GATES | {'h', 's', 'sdg', 'sx', 'sxdg', 'cx', 'cz', 'swap', 'measure', 'reset'}
+
+
+def _pauli_bits(instructions, num_qubits):
+    """X and Z bits of one noise term, given as Aer instruction dicts ('id', 'x', 'y', 'z', 'pauli')."""
+    x, z = np.zeros(num_qubits, dtype=bool), np.zeros(num_qubits, dtype=bool)
+    for instruction in instructions:
+        if instruction['name'] == 'pauli':
+            # Qiskit labels are little-endian: the last character acts on the first qubit
+            letters = zip(instruction['qubits'], reversed(instruction['params'][0]))
+        elif instruction['name'] in ('id', 'x', 'y', 'z'):
+            letters = [(instruction['qubits'][0], instruction['name'].upper())]
+        else:
+            raise ValueError(f"Noise instruction '{instruction['name']}' is not a Pauli")
+        for qubit, letter in letters:
+            x[qubit] ^= letter in 'XY'
+            z[qubit] ^= letter in 'ZY'
+    return x, z
+
+
+def pauli_noise_table(noise_model):
+    """
+    {gate name: {gate qubits or None (any): (probabilities, X bits, Z bits)}}
+    from a NoiseModel made of Pauli channels (pauli_error, depolarizing_error
+    and their tensor products).
+    """
+    table = {}
+    if noise_model is None:
+        return table
+    for error in noise_model.to_dict()['errors']:
+        if error['type'] != 'qerror':
+            raise ValueError(f"Noise of type '{error['type']}' cannot be sampled on Pauli frames")
+        num_qubits = 1 + max(qubit for term in error['instructions'] for instruction in term
+                             for qubit in instruction['qubits'])
+        bits = [_pauli_bits(term, num_qubits) for term in error['instructions']]
+        probabilities = np.asarray(error['probabilities'], dtype=float)
+        entry = (probabilities / probabilities.sum(), np.array([b[0] for b in bits]), np.array([b[1] for b in bits]))
+        for name in error['operations']:
+            for qubits in error.get('gate_qubits') or [None]:
+                table.setdefault(name, {})[None if qubits is None else tuple(qubits)] = entry
+    return table
+
+
+def _apply_noise(rng, x, z, qubits, entry):
+    """Multiplies every frame by a Pauli term drawn from entry on qubits."""
+    probabilities, x_bits, z_bits = entry
+    terms = rng.choice(len(probabilities), size=x.shape[1], p=probabilities)
+    # Terms only span the qubits they act on, up to the highest one
+    qubits = qubits[:x_bits.shape[1]]
+    x[qubits] ^= x_bits[terms].T
+    z[qubits] ^= z_bits[terms].T
+
+
+def reference_sample(qc):
+    """One noiseless shot of qc on Aer's stabilizer method, as a bool array indexed by clbit."""
+    from .execution import make_simulator
+
+    memory = make_simulator(method='stabilizer').run(qc, shots=1, memory=True).result().get_memory()[0]
+    return np.array([bit == '1' for bit in reversed(memory.replace(' ', ''))], dtype=bool)
+
+
+@traced('run')
+def sample_pauli_frames(qc, shots, noise_model=None, seed=None, reference=None):
+    """
+    Samples shots noisy runs of the Clifford circuit qc, with the Pauli noise
+    of noise_model applied after every gate it names (before a measurement,
+    as Aer does). seed is an int or a numpy Generator. reference is a
+    noiseless outcome of qc (one Aer stabilizer shot when None). Returns a
+    (shots, num_clbits) bool array, column i holding clbit i.
+    """
+    rng = np.random.default_rng(seed)
+    noise = pauli_noise_table(noise_model)
+    reference = reference_sample(qc) if reference is None else np.asarray(reference, dtype=bool)
+
+    x = np.zeros((qc.num_qubits, shots), dtype=bool)
+    z = rng.integers(0, 2, size=(qc.num_qubits, shots), dtype=np.uint8).astype(bool)
+    flips = np.zeros((qc.num_clbits, shots), dtype=bool)
+    for instruction in qc.data:
+        name = instruction.operation.name
+        qubits = [qc.find_bit(qubit).index for qubit in instruction.qubits]
+        if name not in FRAME_GATES:
+            raise ValueError(f"Gate '{name}' is not supported by the Pauli-frame sampler")
+        entry = noise.get(name, {})
+        entry = entry.get(tuple(qubits), entry.get(None))
+        if entry is not None and name == 'measure':
+            # Aer applies measurement errors before the measurement
+            _apply_noise(rng, x, z, qubits, entry)
+        if name == 'h':
+            x[qubits], z[qubits] = z[qubits], x[qubits]
+        elif name in ('s', 'sdg'):
+            z[qubits] ^= x[qubits]
+        elif name in ('sx', 'sxdg'):
+            x[qubits] ^= z[qubits]
+        elif name == 'cx':
+            control, target = qubits
+            x[target] ^= x[control]
+            z[control] ^= z[target]
+        elif name == 'cz':
+            a, b = qubits
+            z[a] ^= x[b]
+            z[b] ^= x[a]
+        elif name == 'swap':
+            x[qubits], z[qubits] = x[qubits[::-1]], z[qubits[::-1]]
+        elif name in ('measure', 'reset'):
+            if name == 'measure':
+                flips[[qc.find_bit(clbit).index for clbit in instruction.clbits]] = x[qubits]
+            else:
+                x[qubits] = False
+            z[qubits] = rng.integers(0, 2, size=(len(qubits), shots), dtype=np.uint8).astype(bool)
+        if entry is not None and name != 'measure':
+            _apply_noise(rng, x, z, qubits, entry)
+    return (flips ^ reference[:, None]).T
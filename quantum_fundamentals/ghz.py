@@ -0,0 +1,192 @@
+"""
+Log-depth GHZ preparation and scalable GHZ verification (script 3a).
+
+The simulator is picked automatically: stabilizer method for Clifford circuits
+(thousands of qubits), statevector for small non-Clifford ones, matrix product
+states beyond that. ghz_fidelity estimates the fidelity itself from one
+parity circuit per qubit, at phases k pi / n; those at multiples of pi/2 stay
+Clifford, the rest do not, so it costs n + 1 circuits, most of them on
+statevector or MPS. ghz_fidelity_bound is the check for large n: a stabilizer
+witness from two Clifford circuits (Z and X bases), sampled on Pauli frames
+in time linear in n, for thousands of qubits.
+"""
+import numpy as np
+from qiskit import QuantumCircuit
+from .tracing import traced
+
+CLIFFORD_GATES = {'h', 's', 'sdg', 'x', 'y', 'z', 'sx', 'sxdg', 'cx', 'cy', 'cz', 'swap', 'id',
+                  'measure', 'barrier', 'reset'}
+MAX_STATEVECTOR_QUBITS = 24
+
+
+@traced('build')
+def ghz_linear(n):
+    """GHZ state with the CNOT cascade from script 3 (depth n)."""
+    qc = QuantumCircuit(n)
+    qc.h(0)
+    for target in range(1, n):
+        qc.cx(0, target)
+    return qc
+
+
+@traced('build')
+def ghz_tree(n):
+    """GHZ state with a doubling CNOT fan-out tree (depth ceil(log2 n) + 1)."""
+    qc = QuantumCircuit(n)
+    qc.h(0)
+    entangled = 1
+    while entangled < n:
+        for control in range(min(entangled, n - entangled)):
+            qc.cx(control, control + entangled)
+        entangled *= 2
+    return qc
+
+
+def select_simulation_method(qc):
+    """Picks the cheapest Aer method that can simulate qc exactly."""
+    if all(instruction.operation.name in CLIFFORD_GATES for instruction in qc.data):
+        return 'stabilizer'
+    if qc.num_qubits <= MAX_STATEVECTOR_QUBITS:
+        return 'statevector'
+    return 'matrix_product_state'
+
+
+@traced('run')
+def run_auto(circuits, shots, noise_model=None, seed=None):
+    """Runs a batch of circuits on the method chosen for the most demanding one."""
+    from .execution import make_simulator
+
+    methods = {select_simulation_method(qc) for qc in circuits}
+    for method in ['matrix_product_state', 'statevector', 'stabilizer']:
+        if method in methods:
+            break
+    simulator = make_simulator(method=method, noise_model=noise_model, seed_simulator=seed)
+    result = simulator.run(circuits, shots=shots).result()
+    return [result.get_counts(i) for i in range(len(circuits))], method
+
+
+@traced('post_process')
+def parity_from_counts(counts):
+    """Expectation value of the product of all measured Z's."""
+    shots = sum(counts.values())
+    odd = sum(count for key, count in counts.items() if key.count('1') % 2)
+    return (shots - 2 * odd) / shots
+
+
+def run_by_method(circuits, shots, noise_model=None, seed=None):
+    """Runs every circuit on its own cheapest method (one batch per method); returns counts and the methods used."""
+    by_method = {}
+    for index, qc in enumerate(circuits):
+        by_method.setdefault(select_simulation_method(qc), []).append(index)
+    counts = [None] * len(circuits)
+    for indices in by_method.values():
+        batch_counts, _ = run_auto([circuits[i] for i in indices], shots, noise_model, seed)
+        for index, batch_count in zip(indices, batch_counts):
+            counts[index] = batch_count
+    return counts, '+'.join(sorted(by_method))
+
+
+def _parity_circuit(n, phi):
+    """GHZ tree measured along cos(phi) X + sin(phi) Y on every qubit."""
+    qc = ghz_tree(n)
+    quarter = phi / (np.pi / 2)
+    if np.isclose(quarter, round(quarter)):
+        # rz(-phi) up to a global phase, as a Clifford gate (or nothing)
+        gate = [None, 'sdg', 'z', 's'][round(quarter) % 4]
+        if gate is not None:
+            getattr(qc, gate)(range(n))
+    else:
+        qc.p(-phi, range(n))
+    qc.h(range(n))
+    qc.measure_all()
+    return qc
+
+
+def coherence_phases(n):
+    """The n phases k pi / n (k = 0..n-1) that isolate the n-fold parity oscillation."""
+    return np.pi * np.arange(n) / n
+
+
+def parity_oscillation(n, phis, shots=1024, noise_model=None, seed=None):
+    """
+    Measures every qubit along cos(phi) X + sin(phi) Y. For an ideal GHZ state
+    the parity oscillates as cos(n * phi); the n-fold frequency is the
+    signature of n-qubit entanglement. Phases that are multiples of pi/2 are
+    Clifford circuits (stabilizer method); the others run on statevector or,
+    beyond MAX_STATEVECTOR_QUBITS, matrix product states.
+    """
+    counts, method = run_by_method([_parity_circuit(n, phi) for phi in phis], shots, noise_model, seed)
+    return np.array([parity_from_counts(c) for c in counts]), method
+
+
+@traced('post_process')
+def coherence_from_parities(parities):
+    """
+    C = (1/n) sum_k (-1)^k <P(k pi / n)> over coherence_phases(n). A coherence
+    between states differing in w bits oscillates as (n - 2w) phi, and over
+    these n phases every term but w = 0, n cancels, leaving 2 Re rho_{0...0, 1...1}.
+    """
+    parities = np.asarray(parities)
+    return float(np.mean((-1.0) ** np.arange(len(parities)) * parities))
+
+
+def _ghz_basis_circuits(n):
+    """GHZ tree measured in the Z basis and in the X basis."""
+    z_basis = ghz_tree(n)
+    z_basis.measure_all()
+    x_basis = ghz_tree(n)
+    x_basis.h(range(n))
+    x_basis.measure_all()
+    return z_basis, x_basis
+
+
+@traced('post_process')
+def fidelity_bound_from_samples(z_bits, x_bits):
+    """
+    Lower bound on the GHZ fidelity from (shots, n) Z-basis and X-basis
+    samples. The GHZ projector is the product of two commuting projectors,
+    onto the span of 0...0 and 1...1 (the Z_i Z_{i+1} = +1 stabilizers) and
+    onto X...X = +1, and for commuting projectors AB >= A + B - 1, so
+
+        F >= P(0...0) + P(1...1) + (1 + <X...X>) / 2 - 1
+    """
+    p_aligned = np.mean(z_bits.all(axis=1) | ~z_bits.any(axis=1))
+    x_parity = 1 - 2 * np.mean(x_bits.sum(axis=1) % 2)
+    return float(p_aligned + (1 + x_parity) / 2 - 1)
+
+
+def ghz_fidelity_bound(n, shots=1000, noise_model=None, seed=None):
+    """
+    Stabilizer-witness lower bound on the GHZ fidelity
+    (fidelity_bound_from_samples). Both circuits are Clifford and the noise
+    must be Pauli, so the shots are drawn on Pauli frames (frames.py) in time
+    linear in n: thousands of qubits take seconds. Returns (bound, method).
+    """
+    from .frames import sample_pauli_frames
+
+    rng = np.random.default_rng(seed)
+    # 0...0 is a possible noiseless outcome of both circuits, so no reference shot is needed
+    reference = np.zeros(n, dtype=bool)
+    z_bits, x_bits = (sample_pauli_frames(qc, shots, noise_model, rng, reference) for qc in _ghz_basis_circuits(n))
+    return fidelity_bound_from_samples(z_bits, x_bits), 'pauli_frames'
+
+
+def ghz_fidelity(n, shots=100, noise_model=None, seed=None):
+    """
+    Estimates the GHZ fidelity from the populations and the parity-oscillation
+    coherence C (coherence_from_parities):
+
+        F = (P(0...0) + P(1...1)) / 2 + C / 2
+
+    This takes n + 1 circuits: one population measurement and one per phase of
+    coherence_phases(n), so it suits tens of qubits; ghz_fidelity_bound scales
+    further. Returns (fidelity, methods used).
+    """
+    populations = ghz_tree(n)
+    populations.measure_all()
+    circuits = [populations] + [_parity_circuit(n, phi) for phi in coherence_phases(n)]
+    counts, method = run_by_method(circuits, shots, noise_model, seed)
+    p_zeros = counts[0].get('0' * n, 0) / shots
+    p_ones = counts[0].get('1' * n, 0) / shots
+    coherence = coherence_from_parities([parity_from_counts(c) for c in counts[1:]])
+    return (p_zeros + p_ones) / 2 + coherence / 2, method
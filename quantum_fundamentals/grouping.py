@@ -0,0 +1,291 @@
+"""
+Commuting measurement groups for shot-based expectation values.
+
+A Pauli term can be read off Z-basis counts once the circuit is rotated into a
+basis where the term is diagonal. group_measurements partitions the terms of a
+SparsePauliOp into sets that share such a basis:
+
+    qubit_wise=True   qubit-wise commuting sets: on every qubit the terms agree
+                      or are I, so the rotation is one H (X) or Sdg H (Y) per qubit
+    qubit_wise=False  commuting sets (fewer groups): the rotation is a Clifford
+                      circuit mapping the group's independent terms to Z strings
+
+Every term of a group becomes (sign, Z mask) on the rotated counts, so each
+term's expectation is a signed parity average over the group's one histogram.
+An Ising Hamiltonian (ZZ couplings plus an X field) needs two circuits instead
+of one per term. GroupedEstimator is an EstimatorV2 that samples one circuit per
+group through an Aer SamplerV2 built from the execution profile; with
+allocation='variance' it spends its shots where the variance is.
+"""
+import math
+import numpy as np
+from qiskit import QuantumCircuit
+from qiskit.primitives import BaseEstimatorV2, PrimitiveJob, PrimitiveResult
+from qiskit.primitives.containers import DataBin, EstimatorPub, PubResult
+from qiskit.quantum_info import SparsePauliOp, StabilizerState
+
+from .counts import IntCounts
+from .pauli import _parity
+from .tracing import traced
+
+# 1 / sqrt(4096): the EstimatorV2 default
+DEFAULT_PRECISION = 0.015625
+ALLOCATIONS = ['uniform', 'variance']
+# Variance-weighted allocation never starves a group below this (its sigma must stay measurable)
+MIN_GROUP_SHOTS = 64
+# Weight of the previous sigma estimate when a run's counts update it
+SIGMA_MEMORY = 0.5
+
+
+class MeasurementGroup:
+    """
+    Terms of an observable that are measured together: the basis rotation that
+    diagonalises all of them and, per term, the sign and Z mask of the rotated
+    term (bit q of the mask = qubit q = classical bit q of the counts).
+    """
+
+    def __init__(self, observable, rotation, z_masks, signs):
+        self.observable = observable
+        self.rotation = rotation
+        self.z_masks = np.asarray(z_masks, dtype=np.uint64)
+        self.signs = np.asarray(signs, dtype=float)
+
+    @property
+    def labels(self):
+        return self.observable.paulis.to_labels()
+
+    def __len__(self):
+        return len(self.observable)
+
+    def measurement_circuit(self, qc):
+        """qc (final measurements removed) followed by the rotation and a measurement of every qubit."""
+        measured = qc.remove_final_measurements(inplace=False)
+        measured.compose(self.rotation, inplace=True)
+        measured.measure_all()
+        return measured
+
+    def term_signs(self, keys):
+        """+-1 eigenvalue of every term on each outcome: one row per key, one column per term."""
+        keys = np.asarray(keys, dtype=np.uint64)
+        return self.signs * (1.0 - 2.0 * _parity(keys[:, None] & self.z_masks[None, :]))
+
+    def term_expectations(self, counts):
+        """Expectation of every term (without coefficients) from counts of the measurement circuit."""
+        counts = counts if isinstance(counts, IntCounts) else IntCounts.from_dict(counts)
+        keys, values = counts.keys_values()
+        return values @ self.term_signs(keys) / counts.shots
+
+    def expectation(self, counts):
+        """Expectation of the group's observable (coefficients included)."""
+        return float(np.real(self.observable.coeffs @ self.term_expectations(counts)))
+
+
+def _qubit_wise_group(group):
+    n = group.num_qubits
+    x, z = group.paulis.x.any(axis=0), group.paulis.z.any(axis=0)
+    rotation = QuantumCircuit(n)
+    for qubit in range(n):
+        if x[qubit] and z[qubit]:
+            rotation.sdg(qubit)
+        if x[qubit]:
+            rotation.h(qubit)
+    weights = 1 << np.arange(n, dtype=np.uint64)
+    support = group.paulis.x | group.paulis.z
+    return MeasurementGroup(group, rotation, (support * weights).sum(axis=1, dtype=np.uint64), np.ones(len(group)))
+
+
+def _independent_terms(group):
+    """Indices of a maximal set of terms independent over GF(2) (as (x | z) bit vectors)."""
+    rows, pivots, chosen = [], [], []
+    for index, vector in enumerate(np.hstack([group.paulis.x, group.paulis.z]).astype(np.uint8)):
+        for row, pivot in zip(rows, pivots):
+            if vector[pivot]:
+                vector = vector ^ row
+        nonzero = np.flatnonzero(vector)
+        if len(nonzero):
+            rows.append(vector)
+            pivots.append(nonzero[0])
+            chosen.append(index)
+    return chosen
+
+
+def _commuting_group(group):
+    # A stabilizer state whose stabilizers include the group's independent terms:
+    # U maps Z_k to those terms, so U^dagger rotates every term of the group to a Z string
+    generators = [group.paulis[i].to_label() for i in _independent_terms(group)]
+    clifford = StabilizerState.from_stabilizer_list(generators, allow_underconstrained=True).clifford
+    rotation = clifford.to_circuit().inverse()
+    z_masks, signs = [], []
+    for pauli in group.paulis:
+        rotated = pauli.evolve(clifford, frame='h')
+        if rotated.x.any() or rotated.phase % 2:
+            raise ValueError(f"term {pauli} is not diagonal after the group's rotation")
+        z_masks.append(sum(1 << q for q in np.flatnonzero(rotated.z)))
+        signs.append(-1.0 if rotated.phase == 2 else 1.0)
+    return MeasurementGroup(group, rotation, z_masks, signs)
+
+
+@traced('build')
+def group_measurements(operator, qubit_wise=True):
+    """
+    Partitions the terms of operator (a SparsePauliOp or anything it accepts)
+    into qubit-wise commuting (or, with qubit_wise=False, commuting) groups.
+    """
+    operator = operator if isinstance(operator, SparsePauliOp) else SparsePauliOp(operator)
+    if operator.num_qubits > 64:
+        raise ValueError("group_measurements supports at most 64 qubits")
+    build = _qubit_wise_group if qubit_wise else _commuting_group
+    return [build(group) for group in operator.group_commuting(qubit_wise=qubit_wise)]
+
+
+def measurement_circuits(qc, groups):
+    """One measurement circuit per group."""
+    return [group.measurement_circuit(qc) for group in groups]
+
+
+def expectation_from_counts(groups, counts):
+    """Expectation of the grouped operator from counts[i] of groups[i]'s measurement circuit."""
+    return sum(group.expectation(group_counts) for group, group_counts in zip(groups, counts))
+
+
+class GroupedEstimator(BaseEstimatorV2):
+    """
+    EstimatorV2 that samples: the Pauli strings of all observables of a pub are
+    grouped once, each group's measurement circuit is sampled (for all
+    parameter values in one sampler pub), and every observable is rebuilt from
+    the group counts. stds include the covariance of terms read from the same
+    shots.
+
+    Shots per group (allocation):
+        'uniform'   shot_budget split evenly or, without a budget,
+                    sum(sigma^2) / precision^2 each, so that the std of the
+                    total meets precision. Before sigma_g has been measured
+                    it is bounded by the sum of |coefficient| over the group's
+                    terms (each term is +-1 per shot).
+        'variance'  proportional to sigma_g, the per-shot standard deviation of
+                    the group's part of the observable (|coefficient| x std for
+                    a single term): shot_budget split in that proportion or,
+                    without a budget, sigma_g * sum(sigma) / precision^2 shots,
+                    the fewest that reach the target precision (at least
+                    MIN_GROUP_SHOTS per group, and never more than the
+                    budget). The first run for a set of terms is the uniform
+                    allocation, which measures sigma_g; it is re-estimated from
+                    every later run's counts, so an optimiser reusing the
+                    estimator keeps refining the split.
+    """
+
+    def __init__(self, *, default_precision=DEFAULT_PRECISION, sampler=None, qubit_wise=True,
+                 allocation='uniform', shot_budget=None, seed=None, profile=None):
+        if allocation not in ALLOCATIONS:
+            raise ValueError(f"allocation must be one of {ALLOCATIONS}, got {allocation!r}")
+        if sampler is None:
+            from .execution import make_sampler
+            sampler = make_sampler(seed=seed, profile=profile)
+        self.sampler = sampler
+        self.qubit_wise = qubit_wise
+        self.allocation = allocation
+        self.shot_budget = shot_budget
+        self._default_precision = default_precision
+        self._groups = {}
+        self._sigmas = {}
+
+    def groups(self, labels):
+        """Measurement groups of the Pauli strings labels (cached)."""
+        labels = tuple(labels)
+        if labels not in self._groups:
+            self._groups[labels] = group_measurements(SparsePauliOp(list(labels)), self.qubit_wise)
+        return self._groups[labels]
+
+    def sigmas(self, labels):
+        """Current per-shot standard deviation estimate of each group of labels (None before the first run)."""
+        return self._sigmas.get(tuple(labels))
+
+    def run(self, pubs, *, precision=None):
+        if precision is None:
+            precision = self._default_precision
+        coerced_pubs = [EstimatorPub.coerce(pub, precision) for pub in pubs]
+        job = PrimitiveJob(self._run, coerced_pubs)
+        job._submit()
+        return job
+
+    def _run(self, pubs):
+        return PrimitiveResult([self._run_pub(pub) for pub in pubs], metadata={'version': 2})
+
+    def _allocate(self, sigmas, precision, bounds):
+        """Shots of each group (uniform while sigmas is None, with bounds standing in for sigma)."""
+        num_groups = len(bounds)
+        if self.allocation == 'uniform' or sigmas is None:
+            if self.shot_budget is None:
+                spread = bounds if sigmas is None else sigmas
+                return np.full(num_groups, max(1, math.ceil(np.sum(np.square(spread)) / precision ** 2)))
+            return np.full(num_groups, max(1, self.shot_budget // num_groups))
+        weights = np.maximum(sigmas, 1e-12)
+        if self.shot_budget is None:
+            return np.maximum(np.ceil(weights * weights.sum() / precision ** 2), MIN_GROUP_SHOTS).astype(int)
+        # Reserve the floor first and split what is left, so the total stays within the budget
+        floor = min(MIN_GROUP_SHOTS, max(1, self.shot_budget // num_groups))
+        spare = max(self.shot_budget - floor * num_groups, 0)
+        return (floor + np.floor(spare * weights / weights.sum())).astype(int)
+
+    def _sample(self, pub, groups, shots):
+        """Counts of every group's circuit, one IntCounts per parameter index."""
+        values = pub.parameter_values
+        parameters = values.as_array() if values.num_parameters else None
+        sampler_pubs = [(group.measurement_circuit(pub.circuit), parameters, int(group_shots))
+                        for group, group_shots in zip(groups, shots)]
+        results = self.sampler.run(sampler_pubs).result()
+        counts = []
+        for result in results:
+            bit_array = result.data.meas
+            counts.append({index: IntCounts.from_bitarray(bit_array[index]) for index in np.ndindex(*values.shape)})
+        return counts
+
+    def _run_pub(self, pub):
+        parameter_indices = list(np.ndindex(*pub.parameter_values.shape))
+        positions = np.arange(len(parameter_indices)).reshape(pub.parameter_values.shape)
+        bc_positions, bc_obs = np.broadcast_arrays(positions, pub.observables)
+        labels = tuple(sorted({label for observable in bc_obs.ravel() for label in observable}))
+        groups = self.groups(labels)
+        sigmas = self._sigmas.get(labels)
+        # sigma_g <= sum of |coefficient| over the group's terms, for any observable of the pub
+        bounds = np.array([max(sum(abs(observable.get(label, 0.0)) for label in group.labels)
+                               for observable in bc_obs.ravel()) for group in groups])
+        shots = self._allocate(sigmas, pub.precision, bounds)
+        group_counts = self._sample(pub, groups, shots)
+
+        evs = np.zeros(bc_obs.shape, dtype=np.float64)
+        stds = np.zeros(bc_obs.shape, dtype=np.float64)
+        # Per-shot variance of each group's part of the observables, for the next allocation
+        spreads = [[] for _ in groups]
+        # +-1 term eigenvalues per (group, parameter index), computed on first use
+        tables = {}
+        for index in np.ndindex(*bc_obs.shape):
+            observable, parameter_index = bc_obs[index], parameter_indices[bc_positions[index]]
+            variance = 0.0
+            for g, group in enumerate(groups):
+                weights = np.array([observable.get(label, 0.0) for label in group.labels])
+                if not weights.any():
+                    continue
+                if (g, parameter_index) not in tables:
+                    keys, values = group_counts[g][parameter_index].keys_values()
+                    tables[g, parameter_index] = (group.term_signs(keys), values)
+                signs, values = tables[g, parameter_index]
+                per_shot = signs @ weights
+                mean = values @ per_shot / shots[g]
+                spread = values @ (per_shot - mean) ** 2 / shots[g]
+                evs[index] += mean
+                variance += spread / shots[g]
+                spreads[g].append(spread)
+            stds[index] = math.sqrt(variance)
+
+        if sigmas is None:
+            self._sigmas[labels] = np.array([math.sqrt(np.mean(spread)) if spread else 0.0 for spread in spreads])
+        else:
+            measured = np.array([math.sqrt(np.mean(spread)) if spread else sigma
+                                 for spread, sigma in zip(spreads, sigmas)])
+            self._sigmas[labels] = SIGMA_MEMORY * sigmas + (1 - SIGMA_MEMORY) * measured
+
+        data = DataBin(evs=evs, stds=stds, shape=evs.shape)
+        return PubResult(data, metadata={'target_precision': pub.precision, 'shots': int(shots.sum()),
+                                         'group_shots': shots.tolist(), 'num_groups': len(groups),
+                                         'circuit_metadata': pub.circuit.metadata})
@@ -0,0 +1,160 @@
+"""
+Awaitable simulator and primitive jobs, with small submissions coalesced.
+
+JobRunner turns the blocking `backend.run(...).result()`,
+`sampler.run(pubs).result()` and `estimator.run(pubs).result()` calls into
+coroutines, so optimisers, sweeps and post-processing can overlap:
+
+    async with JobRunner() as runner:
+        results = await asyncio.gather(*(runner.estimate([(ansatz, H, p)]) for p in points))
+
+Submissions with the same kind and options that arrive within batch_window
+seconds of each other are concatenated into one run (up to max_batch circuits
+or pubs), and every caller gets back only its own share, shaped like the result
+of the call it replaces; if a coalesced run fails, its submissions are run
+again one by one, so an error only reaches the caller whose input caused it.
+The blocking runs execute in a thread pool of max_workers threads, which
+bounds how many jobs are in flight; Aer releases the GIL while it simulates.
+"""
+import asyncio
+import copy
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from .tracing import traced
+
+# Seconds a submission waits for others to join its batch
+BATCH_WINDOW = 0.002
+# Circuits or pubs per coalesced run; larger submissions run on their own
+MAX_BATCH = 64
+
+
+class JobRunner:
+    """
+    Coalescing asyncio front end for one backend, sampler and estimator (each
+    built with the execution profile on first use unless given).
+    """
+
+    def __init__(self, backend=None, sampler=None, estimator=None, max_workers=None,
+                 batch_window=BATCH_WINDOW, max_batch=MAX_BATCH):
+        self.backend, self.sampler, self.estimator = backend, sampler, estimator
+        self.batch_window = batch_window
+        self.max_batch = max_batch
+        self.submissions = self.batches = 0
+        self._executor = ThreadPoolExecutor(max_workers or os.cpu_count() or 1)
+        self._pending = {}
+        self._timers = {}
+        self._tasks = set()
+
+    def _target(self, kind):
+        if kind == 'run':
+            if self.backend is None:
+                from .execution import make_simulator
+                self.backend = make_simulator()
+            return self.backend
+        if kind == 'sample':
+            if self.sampler is None:
+                from .execution import make_sampler
+                self.sampler = make_sampler()
+            return self.sampler
+        if self.estimator is None:
+            from .pauli import PauliKernelEstimator
+            self.estimator = PauliKernelEstimator()
+        return self.estimator
+
+    async def run(self, circuits, **options):
+        """Like backend.run(circuits, **options).result(): a Result with these circuits' experiments."""
+        return await self._submit('run', circuits, options)
+
+    async def sample(self, pubs, shots=None):
+        """Like sampler.run(pubs, shots=shots).result()."""
+        return await self._submit('sample', pubs, {} if shots is None else {'shots': shots})
+
+    async def estimate(self, pubs, precision=None):
+        """Like estimator.run(pubs, precision=precision).result()."""
+        return await self._submit('estimate', pubs, {} if precision is None else {'precision': precision})
+
+    async def _submit(self, kind, items, options):
+        # A single circuit is a one-item submission, as with backend.run
+        items = list(items) if kind != 'run' or isinstance(items, (list, tuple)) else [items]
+        self.submissions += 1
+        future = asyncio.get_running_loop().create_future()
+        if len(items) >= self.max_batch:
+            self._dispatch(kind, options, [(items, future)])
+            return await future
+        key = (kind, repr(sorted(options.items())))
+        batch = self._pending.setdefault(key, (options, []))[1]
+        batch.append((items, future))
+        if sum(len(entry[0]) for entry in batch) >= self.max_batch:
+            self._flush(key)
+        elif len(batch) == 1:
+            self._timers[key] = asyncio.get_running_loop().call_later(self.batch_window, self._flush, key)
+        return await future
+
+    def _flush(self, key):
+        timer = self._timers.pop(key, None)
+        if timer is not None:
+            timer.cancel()
+        if key in self._pending:
+            options, batch = self._pending.pop(key)
+            self._dispatch(key[0], options, batch)
+
+    def _dispatch(self, kind, options, batch):
+        self.batches += 1
+        task = asyncio.ensure_future(self._execute(kind, options, batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _execute(self, kind, options, batch):
+        items = [item for entry in batch for item in entry[0]]
+        sizes = [len(entry[0]) for entry in batch]
+        try:
+            results = await asyncio.get_running_loop().run_in_executor(
+                self._executor, self._run_batch, kind, options, items, sizes)
+        except Exception as exc:
+            if len(batch) > 1:
+                # Run the submissions on their own, so only the one at fault gets the error
+                self.batches += len(batch)
+                await asyncio.gather(*(self._execute(kind, options, [entry]) for entry in batch))
+                return
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(exc)
+        else:
+            for (_, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
+
+    @traced('run', 'JobRunner batch')
+    def _run_batch(self, kind, options, items, sizes):
+        """One blocking run of the concatenated items, split back per submission."""
+        result = self._target(kind).run(items, **options).result()
+        shares, start = [], 0
+        for size in sizes:
+            if kind == 'run':
+                share = copy.copy(result)
+                share.results = result.results[start:start + size]
+            else:
+                from qiskit.primitives import PrimitiveResult
+                share = PrimitiveResult(list(result)[start:start + size], metadata=result.metadata)
+            shares.append(share)
+            start += size
+        return shares
+
+    def stats(self):
+        """Submissions received and runs actually executed."""
+        return {'submissions': self.submissions, 'batches': self.batches}
+
+    async def aclose(self):
+        """Runs whatever is still waiting for its batch, waits for all jobs and stops the threads."""
+        for key in list(self._pending):
+            self._flush(key)
+        if self._tasks:
+            await asyncio.gather(*self._tasks)
+        self._executor.shutdown()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.aclose()
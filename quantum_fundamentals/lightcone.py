@@ -0,0 +1,231 @@
+"""
+Lightcone-restricted QAOA energies for Max-Cut on large sparse graphs (script 16).
+
+At depth p, <Z_u Z_v> only depends on the gates in the reverse lightcone of
+edge (u, v). Going backwards from the observable, each cost layer grows its
+support by one step in the graph, so in forward layer i (1..p) the cone holds
+the cost gates on edges touching B_(p-i), the nodes within distance p - i of u
+or v, and the mixers on B_(p-i). Every other gate cancels, and the edge's
+expectation is simulated on the qubits of B_p only.
+
+Edges with isomorphic lightcones (same graph, same distances from the edge,
+same weights) have the same <Z_u Z_v> for every parameter vector, so one
+representative per class is simulated. A bounded-degree graph with 1000 nodes
+has a handful of classes at p = 1 or 2. Classes are bucketed by a
+Weisfeiler-Lehman hash and confirmed with rustworkx's VF2 isomorphism test;
+when there are enough of them they are simulated in a process pool.
+"""
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import rustworkx as rx
+from qiskit import QuantumCircuit
+from qiskit.circuit import ParameterVector
+
+from .tracing import traced
+
+# A lightcone wider than this is refused: use fewer layers or a sparser graph
+MAX_LIGHTCONE_QUBITS = 24
+# Fewer distinct classes than this are simulated in-process (a pool costs more to start)
+POOL_MIN_CLASSES = 8
+WL_ROUNDS = 3
+
+
+def _adjacency(edges, weights, num_nodes):
+    adjacency = [dict() for _ in range(num_nodes)]
+    for (a, b), weight in zip(edges, weights):
+        adjacency[a][b] = adjacency[b][a] = weight
+    return adjacency
+
+
+def _distances(adjacency, sources, radius):
+    """Breadth-first distance from the nearest source, for nodes within radius."""
+    distance = {node: 0 for node in sources}
+    queue = deque(sources)
+    while queue:
+        node = queue.popleft()
+        if distance[node] == radius:
+            continue
+        for neighbour in adjacency[node]:
+            if neighbour not in distance:
+                distance[neighbour] = distance[node] + 1
+                queue.append(neighbour)
+    return distance
+
+
+class Lightcone:
+    """
+    The reverse lightcone of one edge at depth reps: local qubits (the edge's
+    endpoints first, as qubits 0 and 1), their distance from the edge, and the
+    local edges (a, b, weight) that carry a gate in at least one layer.
+    """
+
+    def __init__(self, adjacency, edge, reps):
+        distance = _distances(adjacency, edge, reps)
+        others = sorted((node for node in distance if node not in edge), key=lambda node: (distance[node], node))
+        self.nodes = list(edge) + others
+        self.reps = reps
+        local = {node: index for index, node in enumerate(self.nodes)}
+        self.distances = [distance[node] for node in self.nodes]
+        self.edges = sorted({(min(local[a], local[b]), max(local[a], local[b]), weight)
+                             for a in self.nodes if distance[a] < reps
+                             for b, weight in adjacency[a].items()})
+
+    @property
+    def num_qubits(self):
+        return len(self.nodes)
+
+    def invariant(self):
+        """Weisfeiler-Lehman hash of the graph with distance and weight labels (isomorphism-invariant)."""
+        labels = list(self.distances)
+        neighbours = [[] for _ in self.nodes]
+        for a, b, weight in self.edges:
+            neighbours[a].append((b, weight))
+            neighbours[b].append((a, weight))
+        for _ in range(WL_ROUNDS):
+            labels = [hash((labels[node], tuple(sorted((labels[other], weight) for other, weight in neighbours[node]))))
+                      for node in range(len(labels))]
+        return hash((self.num_qubits, len(self.edges), tuple(sorted(labels))))
+
+    def graph(self):
+        graph = rx.PyGraph()
+        graph.add_nodes_from(self.distances)
+        graph.add_edges_from(self.edges)
+        return graph
+
+    def circuit(self):
+        """Parametrised local QAOA circuit; parameters bind in the order (betas..., gammas...)."""
+        qc = QuantumCircuit(self.num_qubits)
+        betas, gammas = ParameterVector('beta', self.reps), ParameterVector('gamma', self.reps)
+        qc.h(range(self.num_qubits))
+        for layer in range(self.reps):
+            radius = self.reps - 1 - layer
+            for a, b, weight in self.edges:
+                if min(self.distances[a], self.distances[b]) <= radius:
+                    qc.rzz(2 * gammas[layer] * weight, a, b)
+            for qubit, distance in enumerate(self.distances):
+                if distance <= radius:
+                    qc.rx(2 * betas[layer], qubit)
+        return qc
+
+
+def _zz_expectation(qc, values):
+    """<Z_0 Z_1> of the bound local circuit."""
+    from .execution import simulate_statevector
+
+    probabilities = simulate_statevector(qc.assign_parameters(values)).probabilities()
+    outcomes = np.arange(len(probabilities))
+    return float(probabilities @ (1 - 2 * ((outcomes ^ (outcomes >> 1)) & 1)))
+
+
+_worker_circuits = None
+
+
+def _init_worker(circuits):
+    global _worker_circuits
+    _worker_circuits = circuits
+
+
+def _evaluate_classes(classes, values):
+    return [_zz_expectation(_worker_circuits[c], values) for c in classes]
+
+
+class LightconeEvaluator:
+    """
+    QAOA Max-Cut energy sum_(u, v) w_uv <Z_u Z_v> at a fixed depth, from one
+    small simulation per class of isomorphic edge lightcones. params alternate
+    [gamma_1, beta_1, gamma_2, beta_2, ...] as in create_qaoa_circuit.
+    """
+
+    @traced('build', 'LightconeEvaluator')
+    def __init__(self, edges, num_nodes=None, reps=1, weights=None, max_workers=None):
+        self.edges = [tuple(edge) for edge in edges]
+        self.num_nodes = num_nodes if num_nodes is not None else 1 + max(max(edge) for edge in self.edges)
+        self.reps = reps
+        self.weights = np.ones(len(self.edges)) if weights is None else np.asarray(weights, dtype=float)
+        self.max_workers = max_workers or os.cpu_count() or 1
+        adjacency = _adjacency(self.edges, self.weights, self.num_nodes)
+
+        self.classes = []
+        self.edge_class = np.empty(len(self.edges), dtype=np.int64)
+        buckets = {}
+        for index, edge in enumerate(self.edges):
+            cone = Lightcone(adjacency, edge, reps)
+            if cone.num_qubits > MAX_LIGHTCONE_QUBITS:
+                raise ValueError(f"lightcone of edge {edge} has {cone.num_qubits} qubits "
+                                 f"(limit {MAX_LIGHTCONE_QUBITS}); use fewer layers")
+            self.edge_class[index] = self._classify(cone, buckets)
+        self._circuits = [cone.circuit() for cone in self.classes]
+        self._pool = None
+
+    def _classify(self, cone, buckets):
+        graph = cone.graph()
+        bucket = buckets.setdefault(cone.invariant(), [])
+        for class_index, other in bucket:
+            if rx.is_isomorphic(graph, other, node_matcher=lambda a, b: a == b, edge_matcher=lambda a, b: a == b):
+                return class_index
+        self.classes.append(cone)
+        bucket.append((len(self.classes) - 1, graph))
+        return len(self.classes) - 1
+
+    @property
+    def max_qubits(self):
+        return max(cone.num_qubits for cone in self.classes)
+
+    def _values(self, params):
+        params = np.asarray(params, dtype=float)
+        if len(params) != 2 * self.reps:
+            raise ValueError(f"expected {2 * self.reps} parameters for reps={self.reps}, got {len(params)}")
+        return np.concatenate([params[1::2], params[0::2]])
+
+    @traced('run', 'LightconeEvaluator.class_expectations')
+    def class_expectations(self, params):
+        """<Z_u Z_v> of each lightcone class."""
+        values = self._values(params)
+        if self.max_workers == 1 or len(self.classes) < POOL_MIN_CLASSES:
+            return np.array([_zz_expectation(qc, values) for qc in self._circuits])
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(self.max_workers, initializer=_init_worker, initargs=(self._circuits,))
+        chunks = np.array_split(np.arange(len(self.classes)), self.max_workers)
+        results = self._pool.map(_evaluate_classes, [chunk.tolist() for chunk in chunks],
+                                 [values] * len(chunks))
+        return np.array([value for chunk in results for value in chunk])
+
+    def edge_expectations(self, params):
+        """<Z_u Z_v> of every edge, in the order of edges."""
+        return self.class_expectations(params)[self.edge_class]
+
+    def energy(self, params):
+        """sum_(u, v) w_uv <Z_u Z_v>, i.e. <H> for maxcut_hamiltonian(edges)."""
+        return float(self.weights @ self.edge_expectations(params))
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def make_lightcone_objective(edges, num_nodes=None, weights=None, max_workers=None):
+    """
+    objective_function(params) -> <H> like make_objective_function, evaluated
+    through lightcones; one LightconeEvaluator is built per depth on first use
+    (objective_function.evaluators).
+    """
+    evaluators = {}
+
+    @traced('evaluate', 'qaoa lightcone objective')
+    def objective_function(params):
+        reps = len(params) // 2
+        if reps not in evaluators:
+            evaluators[reps] = LightconeEvaluator(edges, num_nodes, reps, weights, max_workers)
+        return evaluators[reps].energy(params)
+
+    objective_function.evaluators = evaluators
+    return objective_function
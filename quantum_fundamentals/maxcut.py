@@ -0,0 +1,122 @@
+"""
+Exact Max-Cut by exhaustive enumeration (ground truth for script 16).
+
+Node n - 1 is fixed to side 0 (a cut and its complement are equal), leaving
+2^(n-1) partitions. They are split into chunks of 2^k: the chunk index sets
+the high nodes, and inside a chunk the k low nodes run through Gray-code
+order, so consecutive partitions differ in one node. With the high nodes
+fixed, the cut is
+
+    cut(high) + cross(high) + cut_low(t) + sum_u a_u(high) x_u(t)
+
+where cut_low (the edges among low nodes, in Gray order) is tabulated once
+per worker, and the last term is updated incrementally: flipping node u
+adds +-a_u, so the whole chunk is one cumulative sum. Chunks are spread over
+a process pool and memory stays at a few 2^k arrays whatever n is, so
+graphs of about 32 nodes take seconds to minutes.
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+
+from .tracing import traced
+
+# Low nodes enumerated per chunk (2^CHUNK_QUBITS partitions, a few 8 MiB arrays)
+CHUNK_QUBITS = 20
+# 2^(n-1) partitions beyond this are refused (hours of work)
+MAX_BRUTE_FORCE_NODES = 40
+
+
+def cut_value(edges, assignment, weights=None):
+    """
+    Weight of the edges cut by assignment: an int (bit q = side of node q) or
+    a bitstring in Qiskit's order (node 0 rightmost).
+    """
+    if isinstance(assignment, str):
+        assignment = int(assignment, 2)
+    weights = np.ones(len(edges)) if weights is None else weights
+    return float(sum(weight for (a, b), weight in zip(edges, weights) if ((assignment >> a) ^ (assignment >> b)) & 1))
+
+
+def _gray_tables(k, low_edges, low_weights):
+    """Gray-code states of k bits, the low-edge cut of each, and the node flipped / direction at each step."""
+    steps = np.arange(1 << k, dtype=np.int64)
+    gray = steps ^ (steps >> 1)
+    cut_low = np.zeros(1 << k)
+    for (a, b), weight in zip(low_edges, low_weights):
+        cut_low += weight * (((gray >> a) ^ (gray >> b)) & 1)
+    flipped = np.zeros(1 << k, dtype=np.int64)
+    if k:
+        # Step t flips the lowest set bit of t
+        lowest = steps[1:] & -steps[1:]
+        flipped[1:] = np.log2(lowest).astype(np.int64)
+    direction = np.where(((gray >> flipped) & 1) == 1, 1.0, -1.0)
+    direction[0] = 0.0
+    return gray, cut_low, flipped, direction
+
+
+_worker = {}
+
+
+def _init_worker(n, k, edges, weights):
+    low = (edges < k).all(axis=1)
+    gray, cut_low, flipped, direction = _gray_tables(k, edges[low], weights[low])
+    _worker.update(n=n, k=k, edges=edges, weights=weights, gray=gray, cut_low=cut_low,
+                   flipped=flipped, direction=direction)
+
+
+def _search_chunks(first, last):
+    """Best (cut, assignment) over chunks first..last - 1."""
+    k, edges, weights = _worker['k'], _worker['edges'], _worker['weights']
+    a_side, b_side = edges[:, 0], edges[:, 1]
+    high = (edges >= k).all(axis=1)
+    # Cross edges oriented as (low node, high node)
+    cross = (edges < k).any(axis=1) & ~(edges < k).all(axis=1)
+    low_node = np.where(a_side < k, a_side, b_side)[cross]
+    high_node = np.where(a_side < k, b_side, a_side)[cross]
+    cross_weights = weights[cross]
+
+    best, best_assignment = -np.inf, 0
+    for chunk in range(first, last):
+        state = chunk << k
+        bits = (state >> high_node) & 1
+        base = weights[high] @ (((state >> a_side[high]) ^ (state >> b_side[high])) & 1) + cross_weights @ bits
+        # At least one entry: with k = 0 the single step still indexes node 0 (with direction 0)
+        coefficients = np.bincount(low_node, cross_weights * (1 - 2 * bits), minlength=max(k, 1))
+        cuts = np.cumsum(coefficients[_worker['flipped']] * _worker['direction'])
+        cuts += _worker['cut_low']
+        index = int(np.argmax(cuts))
+        if cuts[index] + base > best:
+            best, best_assignment = float(cuts[index] + base), state | int(_worker['gray'][index])
+    return best, best_assignment
+
+
+def _search(chunk_range):
+    return _search_chunks(*chunk_range)
+
+
+@traced('algorithm')
+def max_cut_brute_force(edges, num_nodes=None, weights=None, chunk_qubits=CHUNK_QUBITS, max_workers=None):
+    """
+    Maximum cut of a graph by enumerating all partitions. Returns
+    (cut, assignment) with bit q of assignment the side of node q (node
+    num_nodes - 1 on side 0).
+    """
+    n = num_nodes if num_nodes is not None else 1 + max((max(edge) for edge in edges), default=-1)
+    if n > MAX_BRUTE_FORCE_NODES:
+        raise ValueError(f"{n} nodes is too many to enumerate (limit {MAX_BRUTE_FORCE_NODES})")
+    edges_array = np.array(edges, dtype=np.int64).reshape(-1, 2)
+    weights = np.ones(len(edges_array)) if weights is None else np.asarray(weights, dtype=float)
+    k = max(min(chunk_qubits, n - 1), 0)
+    num_chunks = 1 << max(n - 1 - k, 0)
+    max_workers = min(max_workers or os.cpu_count() or 1, num_chunks)
+
+    initargs = (n, k, edges_array, weights)
+    if max_workers == 1:
+        _init_worker(*initargs)
+        return _search_chunks(0, num_chunks)
+    bounds = np.linspace(0, num_chunks, 4 * max_workers + 1).astype(int)
+    ranges = [(int(a), int(b)) for a, b in zip(bounds[:-1], bounds[1:]) if b > a]
+    with ProcessPoolExecutor(max_workers, initializer=_init_worker, initargs=initargs) as pool:
+        results = list(pool.map(_search, ranges))
+    return max(results, key=lambda result: result[0])
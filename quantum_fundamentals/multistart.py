@@ -0,0 +1,122 @@
+"""
+Multi-start optimisation of QAOA/VQE objectives across a process pool.
+
+multistart_minimize runs K seeded local optimisations (COBYLA by default)
+concurrently. Every worker process builds the objective once, by calling a
+picklable factory with its arguments, and large read-only arrays (a
+precomputed Hamiltonian diagonal, say) are placed in shared memory, so the
+workers map one copy instead of receiving one each.
+
+The workers share the best energy found so far. After prune_after
+evaluations, a start whose own best trails the shared best by more than
+prune_margin is stopped, so the pool moves on to the next start. Every
+start keeps its convergence trace (best energy after each evaluation).
+
+Under the spawn start method (the default on Windows and macOS, and on Linux
+from Python 3.14) every worker imports the caller's __main__ module, so a
+script must only call multistart_minimize under `if __name__ == '__main__':`
+(or pass another mp_context).
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
+from multiprocessing import shared_memory
+import numpy as np
+
+from .tracing import traced
+
+_worker = {}
+
+
+class _Pruned(Exception):
+    pass
+
+
+def _init_worker(factory, args, kwargs, shared, best, lock):
+    # Shared arrays are attached by name; the views stay valid while _worker holds the segments
+    segments, views = [], {}
+    for name, (segment_name, shape, dtype) in shared.items():
+        segment = shared_memory.SharedMemory(name=segment_name)
+        segments.append(segment)
+        view = np.ndarray(shape, dtype=dtype, buffer=segment.buf)
+        view.flags.writeable = False
+        views[name] = view
+    _worker.update(objective=factory(*args, **kwargs, **views), segments=segments, best=best, lock=lock)
+
+
+def _publish(energy):
+    best, lock = _worker['best'], _worker['lock']
+    with lock:
+        if energy < best.value:
+            best.value = energy
+    return best.value
+
+
+def _run_start(index, start, method, options, prune_after, prune_margin):
+    from scipy.optimize import minimize
+
+    objective = _worker['objective']
+    trace, best = [], {'energy': np.inf, 'params': np.asarray(start, dtype=float)}
+
+    def tracked(params):
+        energy = float(objective(params))
+        if energy < best['energy']:
+            best['energy'], best['params'] = energy, np.array(params, dtype=float)
+        trace.append(best['energy'])
+        shared_best = _publish(best['energy'])
+        if prune_margin is not None and len(trace) >= prune_after and best['energy'] > shared_best + prune_margin:
+            raise _Pruned
+        return energy
+
+    pruned = False
+    try:
+        minimize(tracked, start, method=method, options=options)
+    except _Pruned:
+        pruned = True
+    return {'index': index, 'start': np.asarray(start, dtype=float), 'params': best['params'],
+            'energy': best['energy'], 'evaluations': len(trace), 'pruned': pruned, 'trace': trace}
+
+
+def random_starts(num_starts, dimension, low=-np.pi, high=np.pi, seed=None):
+    """num_starts points uniform in [low, high)^dimension, one seeded stream per start."""
+    return [np.random.default_rng(child).uniform(low, high, dimension)
+            for child in np.random.SeedSequence(seed).spawn(num_starts)]
+
+
+@traced('algorithm')
+def multistart_minimize(factory, starts, args=(), kwargs=None, shared=None, max_workers=None,
+                        method='COBYLA', options=None, prune_margin=None, prune_after=60, mp_context=None):
+    """
+    Minimises factory(*args, **kwargs, **shared)(params) from every start
+    point, in a process pool. shared maps keyword names to NumPy arrays that
+    are passed to the factory as read-only shared-memory views. mp_context is
+    the multiprocessing context of the pool (the platform default when None;
+    see the module docstring for spawn).
+
+    Returns {'best': the best run, 'runs': one record per start, in order},
+    each run being {index, start, params, energy, evaluations, pruned, trace}.
+    """
+    starts = list(starts)
+    if not starts:
+        raise ValueError("multistart_minimize needs at least one start point")
+    options = {'maxiter': 200, 'tol': 1e-4} if options is None else options
+    segments, specs = [], {}
+    try:
+        for name, array in (shared or {}).items():
+            array = np.ascontiguousarray(array)
+            segment = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+            np.ndarray(array.shape, dtype=array.dtype, buffer=segment.buf)[...] = array
+            segments.append(segment)
+            specs[name] = (segment.name, array.shape, array.dtype.str)
+        context = mp_context or multiprocessing.get_context()
+        best, lock = context.Value('d', np.inf, lock=False), context.Lock()
+        with ProcessPoolExecutor(max_workers or os.cpu_count() or 1, context, initializer=_init_worker,
+                                 initargs=(factory, tuple(args), kwargs or {}, specs, best, lock)) as pool:
+            futures = [pool.submit(_run_start, index, start, method, options, prune_after, prune_margin)
+                       for index, start in enumerate(starts)]
+            runs = [future.result() for future in futures]
+    finally:
+        for segment in segments:
+            segment.close()
+            segment.unlink()
+    return {'best': min(runs, key=lambda run: run['energy']), 'runs': runs}
@@ -0,0 +1,89 @@
+"""
+Validation of single-precision (complex64) simulation against double precision.
+
+Each check runs the same circuit under the active execution profile twice,
+once with precision='double' and once with precision='single', and reports
+how far the single-precision results are from the double-precision ones:
+
+    statevectors        largest amplitude error and infidelity 1 - |<a|b>|^2
+    counts              total variation distance of the sampled distributions
+                        (same seed), next to the distance between two
+                        double-precision runs with different seeds: the shot
+                        noise floor the first number should be compared with
+    expectation values  absolute deviation of Estimator results
+"""
+import time
+import numpy as np
+
+from .execution import get_profile, make_estimator, make_sampler, simulate_statevector
+
+
+def _precisions(profile=None):
+    profile = profile or get_profile()
+    return profile.replace(precision='double'), profile.replace(precision='single')
+
+
+def statevector_deviation(qc, profile=None):
+    """{'max_amplitude_error', 'infidelity'} of the single- against the double-precision state of qc."""
+    double, single = (simulate_statevector(qc, precision).data for precision in _precisions(profile))
+    return {'max_amplitude_error': float(np.abs(double - single).max()),
+            'infidelity': float(max(1 - abs(np.vdot(double, single)) ** 2, 0.0))}
+
+
+def total_variation_distance(counts_a, counts_b):
+    """Half the L1 distance between two normalised histograms ({outcome: count})."""
+    shots_a, shots_b = sum(counts_a.values()), sum(counts_b.values())
+    outcomes = set(counts_a) | set(counts_b)
+    return 0.5 * sum(abs(counts_a.get(k, 0) / shots_a - counts_b.get(k, 0) / shots_b) for k in outcomes)
+
+
+def _sample(qc, shots, seed, profile):
+    start = time.perf_counter()
+    data = make_sampler(seed=seed, profile=profile).run([qc], shots=shots).result()[0].data
+    return next(iter(data.values())).get_int_counts(), time.perf_counter() - start
+
+
+def counts_deviation(qc, shots=100_000, seed=1234, profile=None):
+    """
+    {'total_variation_distance', 'shot_noise', 'double_seconds', 'single_seconds'}:
+    the distance between double- and single-precision counts of qc (same seed)
+    and between two double-precision runs with different seeds.
+    """
+    double, single = _precisions(profile)
+    double_counts, double_seconds = _sample(qc, shots, seed, double)
+    single_counts, single_seconds = _sample(qc, shots, seed, single)
+    reseeded_counts, _ = _sample(qc, shots, seed + 1, double)
+    return {'total_variation_distance': total_variation_distance(double_counts, single_counts),
+            'shot_noise': total_variation_distance(double_counts, reseeded_counts),
+            'double_seconds': double_seconds, 'single_seconds': single_seconds}
+
+
+def expectation_deviation(pubs, profile=None):
+    """
+    Largest absolute deviation of single- from double-precision Estimator
+    results, one entry per pub (over all of its observables and parameter sets).
+    """
+    double, single = (make_estimator(profile=precision).run(pubs).result() for precision in _precisions(profile))
+    return np.array([float(np.max(np.abs(np.asarray(d.data.evs) - np.asarray(s.data.evs)), initial=0.0))
+                     for d, s in zip(double, single)])
+
+
+def validate_precision(circuits=None, pubs=None, shots=100_000, seed=1234, profile=None):
+    """
+    Runs the statevector and counts checks on circuits ({name: circuit}) and
+    the expectation-value check on pubs ({name: (circuit, observable[, params])}).
+    Returns a list of {'name', 'check', ...deviations} rows.
+    """
+    rows = []
+    for name, qc in (circuits or {}).items():
+        rows.append({'name': name, 'check': 'statevector', 'num_qubits': qc.num_qubits,
+                     **statevector_deviation(qc, profile)})
+        if qc.num_clbits:
+            rows.append({'name': name, 'check': 'counts', 'num_qubits': qc.num_qubits,
+                         **counts_deviation(qc, shots, seed, profile)})
+    if pubs:
+        deviations = expectation_deviation(list(pubs.values()), profile)
+        for (name, pub), deviation in zip(pubs.items(), deviations):
+            rows.append({'name': name, 'check': 'expectation', 'num_qubits': pub[0].num_qubits,
+                         'abs_deviation': float(deviation)})
+    return rows
@@ -0,0 +1,101 @@
+"""QAOA for Max-Cut (script 16)."""
+import numpy as np
+from qiskit import QuantumCircuit
+from qiskit.quantum_info import SparsePauliOp
+from .tracing import traced
+
+# Edges of the triangle graph used in script 16
+TRIANGLE_EDGES = [(0, 1), (1, 2), (0, 2)]
+
+
+def maxcut_hamiltonian(edges=TRIANGLE_EDGES, n_qubits=3):
+    """Cost Hamiltonian sum over edges (i, j) of Z_i Z_j."""
+    return SparsePauliOp.from_sparse_list([("ZZ", [i, j], 1.0) for i, j in edges], num_qubits=n_qubits)
+
+
+@traced('build')
+def create_qaoa_circuit(params, reps, n_qubits=3, edges=TRIANGLE_EDGES):
+    """
+    Constructs the QAOA Ansatz manually.
+    params alternates [gamma_1, beta_1, gamma_2, beta_2, ...].
+    """
+    qc = QuantumCircuit(n_qubits)
+
+    # 1. Initialization: Equal Superposition
+    qc.h(range(n_qubits))
+
+    # Split params
+    gammas = params[0::2]
+    betas = params[1::2]
+
+    # 2. Apply Layers
+    for i in range(reps):
+        gamma = gammas[i]
+        beta = betas[i]
+
+        # --- Cost Layer (RZZ) ---
+        for a, b in edges:
+            qc.rzz(2 * gamma, a, b)
+
+        # --- Mixer Layer (RX) ---
+        for q in range(n_qubits):
+            qc.rx(2 * beta, q)
+
+    return qc
+
+
+def make_objective_function(hamiltonian, n_qubits=3, edges=TRIANGLE_EDGES, estimator=None):
+    """Returns objective_function(params) -> <H> for the QAOA ansatz."""
+    if estimator is None:
+        from .pauli import PauliKernelEstimator
+        estimator = PauliKernelEstimator()
+
+    @traced('evaluate', 'qaoa objective')
+    def objective_function(params):
+        # Create circuit
+        reps = len(params) // 2
+        qc = create_qaoa_circuit(params, reps, n_qubits, edges)
+
+        # Run Estimator
+        pub = (qc, hamiltonian)
+        job = estimator.run([pub])
+        result = job.result()[0]
+        energy = result.data.evs
+
+        return float(energy)
+
+    objective_function.estimator = estimator
+    return objective_function
+
+
+def maxcut_diagonal(edges=TRIANGLE_EDGES, n_qubits=3):
+    """Diagonal of maxcut_hamiltonian: <z| sum Z_i Z_j |z> for every basis state z (bit q = qubit q)."""
+    states = np.arange(2 ** n_qubits)
+    diagonal = np.zeros(2 ** n_qubits)
+    for a, b in edges:
+        diagonal += 1 - 2 * (((states >> a) ^ (states >> b)) & 1)
+    return diagonal
+
+
+def make_diagonal_objective(diagonal, n_qubits):
+    """
+    objective_function(params) -> <H> for a diagonal cost Hamiltonian, simulated
+    with NumPy: each cost layer is one elementwise phase exp(-i gamma diagonal)
+    and each mixer layer an RX(2 beta) on every qubit. Same energies as
+    make_objective_function with maxcut_hamiltonian, without building circuits.
+    """
+    diagonal = np.asarray(diagonal)
+
+    @traced('evaluate', 'qaoa diagonal objective')
+    def objective_function(params):
+        psi = np.full(2 ** n_qubits, 2 ** (-n_qubits / 2), dtype=complex)
+        for gamma, beta in zip(params[0::2], params[1::2]):
+            psi *= np.exp(-1j * gamma * diagonal)
+            tensor = psi.reshape((2,) * n_qubits)
+            cos, sin = np.cos(beta), -1j * np.sin(beta)
+            for axis in range(n_qubits):
+                tensor = cos * tensor + sin * np.flip(tensor, axis=axis)
+            psi = tensor.reshape(-1)
+        return float(diagonal @ (psi.real ** 2 + psi.imag ** 2))
+
+    return objective_function
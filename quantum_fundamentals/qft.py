@@ -0,0 +1,39 @@
+"""Quantum Fourier Transform circuits (scripts 11, 12 and 13)."""
+import numpy as np
+from qiskit import QuantumCircuit
+from .tracing import traced
+
+
+@traced('build')
+def qft_circuit(n):
+    """Builds a QFT circuit on n qubits."""
+    qc = QuantumCircuit(n, name=f'QFT({n})')
+    # Apply the rotations
+    for j in range(n):
+        qc.h(j)
+        for k in range(j + 1, n):
+            # Controlled-Phase rotation
+            qc.cp(np.pi / 2**(k - j), k, j)
+    # Swap the qubits at the end to match the mathematical definition
+    for i in range(n // 2):
+        qc.swap(i, n - 1 - i)
+    return qc
+
+
+def append_qft_dagger(qc, n):
+    """Appends an inverse QFT on the first n qubits of qc."""
+    for qubit in range(n // 2):
+        qc.swap(qubit, n - qubit - 1)
+    for j in range(n):
+        for m in range(j):
+            qc.cp(-np.pi / (2**(j - m)), m, j)
+        qc.h(j)
+
+
+@traced('build')
+def qft_dagger(n, name="QFT†"):
+    """Inverse Quantum Fourier Transform"""
+    qc = QuantumCircuit(n)
+    append_qft_dagger(qc, n)
+    qc.name = name
+    return qc
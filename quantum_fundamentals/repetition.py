@@ -0,0 +1,202 @@
+"""
+Distance-d repetition code with bit-packed, vectorised decoding (script 17b).
+
+Shot records come back from the sampler as bit-packed uint8 arrays and all
+shots are decoded at once with NumPy: by table lookup for small codes, and by
+space-time matching over the distinct detection patterns otherwise.
+"""
+import time
+import numpy as np
+import rustworkx as rx
+from qiskit import QuantumCircuit, QuantumRegister, ClassicalRegister
+from .tracing import traced
+
+# Detection-event patterns up to this many bits are decoded from a precomputed
+# table; larger codes fall back to matching on the unique patterns only.
+MAX_LOOKUP_BITS = 12
+
+
+@traced('build')
+def build_repetition_code(distance, rounds):
+    """
+    Distance-d repetition code: d data qubits, d-1 ancillas measuring the
+    Z_i Z_{i+1} parities for the given number of rounds, then a final readout
+    of the data qubits.
+    """
+    data = QuantumRegister(distance, 'data')
+    anc = QuantumRegister(distance - 1, 'ancilla')
+    syndrome = ClassicalRegister((distance - 1) * rounds, 'syndrome')
+    readout = ClassicalRegister(distance, 'readout')
+    qc = QuantumCircuit(data, anc, syndrome, readout)
+
+    for r in range(rounds):
+        # Idle step on the data qubits: this is where the memory noise acts
+        for qubit in data:
+            qc.id(qubit)
+        for i in range(distance - 1):
+            qc.cx(data[i], anc[i])
+            qc.cx(data[i + 1], anc[i])
+        for i in range(distance - 1):
+            qc.measure(anc[i], syndrome[r * (distance - 1) + i])
+        qc.reset(anc)
+        qc.barrier()
+
+    qc.measure(data, readout)
+    return qc
+
+
+def build_noise_model(p):
+    """X errors with probability p on idles, CX qubits and before every measurement."""
+    from qiskit_aer.noise import NoiseModel, pauli_error
+
+    error_1q = pauli_error([('X', p), ('I', 1 - p)])
+    noise_model = NoiseModel()
+    noise_model.add_all_qubit_quantum_error(error_1q, ['id', 'measure'])
+    noise_model.add_all_qubit_quantum_error(error_1q.tensor(error_1q), ['cx'])
+    return noise_model
+
+
+def unpack_bits(packed, num_bits):
+    """
+    Turns a (shots, bytes) big-endian packed uint8 array, as returned by
+    BitArray.array, into a (shots, num_bits) uint8 array where column k holds
+    classical bit k.
+    """
+    bits = np.unpackbits(packed, axis=1, bitorder='big')
+    return bits[:, ::-1][:, :num_bits]
+
+
+def pack_rows(bits):
+    """
+    Packs every row of a 0/1 array. Rows of up to 64 bits become a single
+    uint64 key; longer rows stay as packed uint8 rows.
+    """
+    packed = np.packbits(bits, axis=1, bitorder='little')
+    if packed.shape[1] > 8:
+        return packed
+    padded = np.zeros((packed.shape[0], 8), dtype=np.uint8)
+    padded[:, :packed.shape[1]] = packed
+    return padded.view('<u8').ravel()
+
+
+@traced('post_process')
+def detection_events(syndrome_bits, readout_bits, distance, rounds):
+    """
+    XORs consecutive syndrome rounds (plus the syndrome implied by the final
+    data readout) into detection events of shape (shots, (rounds + 1) * (d - 1)).
+    """
+    shots = syndrome_bits.shape[0]
+    history = np.zeros((shots, rounds + 2, distance - 1), dtype=np.uint8)
+    history[:, 1:-1] = syndrome_bits.reshape(shots, rounds, distance - 1)
+    history[:, -1] = readout_bits[:, :-1] ^ readout_bits[:, 1:]
+    return (history[:, 1:] ^ history[:, :-1]).reshape(shots, -1)
+
+
+def match_detection_events(events, distance):
+    """
+    Minimum-weight perfect matching of one detection pattern on the
+    space-time graph of the repetition code.
+
+    Returns 1 if the correction flips data qubit 0 (the logical readout), i.e.
+    an odd number of defects is matched to the left boundary.
+    """
+    width = distance - 1
+    defects = [divmod(int(k), width) for k in np.flatnonzero(events)]
+    m = len(defects)
+    if m == 0:
+        return 0
+
+    # Nodes 0..m-1 are defects, m..2m-1 their private boundary copies
+    graph = rx.PyGraph()
+    graph.add_nodes_from(range(2 * m))
+    max_weight = 2 * (distance + len(events))
+    to_left = []
+    for a, (t_a, i_a) in enumerate(defects):
+        for b in range(a + 1, m):
+            t_b, i_b = defects[b]
+            graph.add_edge(a, b, max_weight - abs(t_a - t_b) - abs(i_a - i_b))
+            graph.add_edge(m + a, m + b, max_weight)
+        left, right = i_a + 1, width - i_a
+        to_left.append(left <= right)
+        graph.add_edge(a, m + a, max_weight - min(left, right))
+
+    matching = rx.max_weight_matching(graph, max_cardinality=True, weight_fn=lambda w: w)
+    flip = 0
+    for a, b in matching:
+        a, b = min(a, b), max(a, b)
+        if b == m + a:
+            flip ^= int(to_left[a])
+    return flip
+
+
+class LookupTableDecoder:
+    """Decodes all shots with one gather from a table of every detection pattern."""
+
+    def __init__(self, distance, rounds):
+        self.distance = distance
+        self.num_bits = (distance - 1) * (rounds + 1)
+        if self.num_bits > MAX_LOOKUP_BITS:
+            raise ValueError(f"Lookup table would need 2^{self.num_bits} entries")
+        patterns = np.arange(2 ** self.num_bits, dtype=np.uint64)
+        bits = ((patterns[:, None] >> np.arange(self.num_bits, dtype=np.uint64)) & 1).astype(np.uint8)
+        self.table = np.array([match_detection_events(row, distance) for row in bits], dtype=np.uint8)
+
+    @traced('post_process')
+    def decode(self, events):
+        return self.table[pack_rows(events)]
+
+
+class MatchingDecoder:
+    """
+    Runs matching once per distinct detection pattern and scatters the result
+    back to every shot. At low error rates the number of distinct patterns is
+    far below the number of shots; results are memoised across calls.
+    """
+
+    def __init__(self, distance, rounds):
+        self.distance = distance
+        self.cache = {}
+
+    @traced('post_process')
+    def decode(self, events):
+        keys = pack_rows(events)
+        unique_keys, first, inverse = np.unique(keys, axis=0, return_index=True, return_inverse=True)
+        flips = np.empty(len(unique_keys), dtype=np.uint8)
+        for n, (key, row) in enumerate(zip(unique_keys, first)):
+            key = key.tobytes()
+            if key not in self.cache:
+                self.cache[key] = match_detection_events(events[row], self.distance)
+            flips[n] = self.cache[key]
+        return flips[inverse.ravel()]
+
+
+def make_decoder(distance, rounds):
+    """Lookup table for small codes, matching on unique patterns otherwise."""
+    if (distance - 1) * (rounds + 1) <= MAX_LOOKUP_BITS:
+        return LookupTableDecoder(distance, rounds)
+    return MatchingDecoder(distance, rounds)
+
+
+def run_memory_experiment(distance, rounds, p, shots=1_000_000, seed=None, decoder=None):
+    """
+    Samples the repetition code on the stabilizer method and decodes every
+    shot. Returns (logical_error_rate, simulate_seconds, decode_seconds).
+    """
+    from .execution import make_sampler
+
+    qc = build_repetition_code(distance, rounds)
+    sampler = make_sampler(seed=seed, method='stabilizer', noise_model=build_noise_model(p))
+
+    start = time.perf_counter()
+    data = sampler.run([qc], shots=shots).result()[0].data
+    simulate_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    decoder = decoder or make_decoder(distance, rounds)
+    syndrome_bits = unpack_bits(data.syndrome.array, data.syndrome.num_bits)
+    readout_bits = unpack_bits(data.readout.array, data.readout.num_bits)
+    events = detection_events(syndrome_bits, readout_bits, distance, rounds)
+    logical = readout_bits[:, 0] ^ decoder.decode(events)
+    decode_seconds = time.perf_counter() - start
+
+    return float(logical.mean()), simulate_seconds, decode_seconds
@@ -0,0 +1,149 @@
+"""
+Cuccaro ripple-carry adders and a bit-sliced reversible-circuit simulator (script 5a).
+
+Each qubit is a vector of uint64 words whose bit k is that qubit's value for
+input number k. A CX is then one XOR over the whole vector and a CCX one AND
+plus one XOR, so all 2^(2n) inputs of an n-bit adder are evaluated in a single
+pass over the gates.
+"""
+import time
+import numpy as np
+from .tracing import traced
+
+WORD_BITS = 64
+
+# Bit pattern of input-index bit j inside one 64-bit word, for j < 6
+LOW_BIT_PATTERNS = [
+    np.uint64(sum(1 << k for k in range(WORD_BITS) if (k >> j) & 1))
+    for j in range(6)
+]
+
+
+# --- Cuccaro ripple-carry adder ---
+def maj(qc, x, y, z):
+    """In-place majority: z <- MAJ(x, y, z), x <- x^z, y <- y^z"""
+    qc.cx(z, y)
+    qc.cx(z, x)
+    qc.ccx(x, y, z)
+
+
+def uma(qc, x, y, z):
+    """UnMajority-and-Add: undoes MAJ and writes the sum bit into y"""
+    qc.ccx(x, y, z)
+    qc.cx(z, x)
+    qc.cx(x, y)
+
+
+@traced('build')
+def cuccaro_adder(n):
+    """
+    n-bit ripple-carry adder (Cuccaro et al., 2004) computing b <- a + b.
+    Uses one ancilla (carry-in, returned to |0>) and one carry-out qubit.
+    """
+    from qiskit import QuantumCircuit, QuantumRegister
+
+    c_in = QuantumRegister(1, 'cin')
+    a = QuantumRegister(n, 'a')
+    b = QuantumRegister(n, 'b')
+    c_out = QuantumRegister(1, 'cout')
+    qc = QuantumCircuit(c_in, a, b, c_out, name=f'ADD({n})')
+
+    maj(qc, c_in[0], b[0], a[0])
+    for i in range(1, n):
+        maj(qc, a[i - 1], b[i], a[i])
+    qc.cx(a[n - 1], c_out[0])
+    for i in reversed(range(1, n)):
+        uma(qc, a[i - 1], b[i], a[i])
+    uma(qc, c_in[0], b[0], a[0])
+    return qc
+
+
+# --- Bit-sliced reversible simulator ---
+def exhaustive_inputs(num_qubits, input_qubits):
+    """
+    Bit-sliced initial state enumerating every assignment of input_qubits
+    (input number k sets input_qubits[j] to bit j of k); all other qubits are 0.
+    Returns a (num_qubits, words) uint64 array.
+    """
+    num_inputs = 2 ** len(input_qubits)
+    words = max(1, num_inputs // WORD_BITS)
+    word_index = np.arange(words, dtype=np.uint64)
+    state = np.zeros((num_qubits, words), dtype=np.uint64)
+    for j, qubit in enumerate(input_qubits):
+        if j < 6:
+            state[qubit] = LOW_BIT_PATTERNS[j]
+        else:
+            # Whole words are all-ones or all-zeros for the higher index bits
+            state[qubit] = np.uint64(0) - ((word_index >> np.uint64(j - 6)) & np.uint64(1))
+    if num_inputs < WORD_BITS:
+        state &= np.uint64((1 << num_inputs) - 1)
+    return state
+
+
+@traced('run')
+def simulate_reversible(qc, state):
+    """
+    Applies the X/CX/CCX/SWAP gates of qc in place to a bit-sliced state.
+    Barriers are ignored; any other operation raises ValueError.
+    """
+    for instruction in qc.data:
+        name = instruction.operation.name
+        qubits = [qc.find_bit(q).index for q in instruction.qubits]
+        if name == 'x':
+            np.invert(state[qubits[0]], out=state[qubits[0]])
+        elif name == 'cx':
+            state[qubits[1]] ^= state[qubits[0]]
+        elif name == 'ccx':
+            state[qubits[2]] ^= state[qubits[0]] & state[qubits[1]]
+        elif name == 'swap':
+            state[[qubits[0], qubits[1]]] = state[[qubits[1], qubits[0]]]
+        elif name != 'barrier':
+            raise ValueError(f"'{name}' is not a classical reversible gate")
+    return state
+
+
+def verify_adder_exhaustively(n):
+    """
+    Runs the n-bit adder on all 2^(2n) inputs and checks every output bit
+    against a bit-sliced classical ripple-carry reference.
+    Returns (all_correct, seconds).
+    """
+    qc = cuccaro_adder(n)
+    a = list(range(1, n + 1))
+    b = list(range(n + 1, 2 * n + 1))
+    start = time.perf_counter()
+    state = exhaustive_inputs(qc.num_qubits, a + b)
+    inputs = state.copy()
+    simulate_reversible(qc, state)
+
+    # Reference: sum_i = a_i ^ b_i ^ carry, carry = MAJ(a_i, b_i, carry)
+    ok = True
+    carry = np.zeros_like(state[0])
+    for i in range(n):
+        a_i, b_i = inputs[a[i]], inputs[b[i]]
+        ok &= np.array_equal(state[b[i]], a_i ^ b_i ^ carry)
+        ok &= np.array_equal(state[a[i]], a_i)
+        carry = (a_i & b_i) | (carry & (a_i ^ b_i))
+    ok &= np.array_equal(state[-1], carry)
+    ok &= not state[0].any()
+    return bool(ok), time.perf_counter() - start
+
+
+def run_adder_on_aer(n, a_value, b_value):
+    """Single-input cross-check of the adder circuit on Aer."""
+    from qiskit import QuantumCircuit, ClassicalRegister, transpile
+    from .execution import make_simulator
+
+    adder = cuccaro_adder(n)
+    result_bits = ClassicalRegister(n + 1, 'sum')
+    qc = QuantumCircuit(*adder.qregs, result_bits)
+    for i in range(n):
+        if (a_value >> i) & 1:
+            qc.x(1 + i)
+        if (b_value >> i) & 1:
+            qc.x(1 + n + i)
+    qc.compose(adder, inplace=True)
+    qc.measure(list(range(n + 1, 2 * n + 2)), result_bits)
+    simulator = make_simulator()
+    counts = simulator.run(transpile(qc, simulator), shots=1).result().get_counts()
+    return int(next(iter(counts)), 2)
@@ -0,0 +1,237 @@
+"""
+Parallel runner for the numbered example scripts with per-stage timings.
+
+Every example runs in its own worker process (one task per child, so peak RSS
+is per example) inside a scratch directory. Before the script starts, qiskit's
+transpile/pass-manager entry points and the simulator entry points (Aer
+backends and jobs, primitive jobs, Statevector construction) are wrapped with a
+stage clock, which splits the wall time of the script into:
+
+    build         start of the script until the first transpile or simulation
+    transpile     time inside transpile / PassManager.run
+    simulate      time inside backend.run, job.result() and Statevector evolution
+    post_process  everything else (printing, sorting counts, plotting, ...)
+
+The report is plain JSON so a report from a known-good stack can be kept as the
+baseline for the next qiskit / Aer upgrade.
+"""
+import functools
+import importlib
+import io
+import json
+import os
+import platform
+import re
+import sys
+import tempfile
+import threading
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stderr, redirect_stdout
+from datetime import datetime, timezone
+
+try:
+    import resource
+except ImportError:  # Windows: no peak RSS
+    resource = None
+
+STAGES = ['build', 'transpile', 'simulate', 'post_process']
+# A stage is a regression when it is this much slower than the baseline ...
+REGRESSION_THRESHOLD = 0.25
+# ... and at least this many seconds slower, so timer noise on short stages is ignored
+MIN_REGRESSION_SECONDS = 0.05
+EXAMPLE_TIMEOUT = 1800
+
+_EXAMPLE_NAME = re.compile(r'^(\d+)([a-z]?)\..+\.py$')
+
+# Stage billed for each category of tracing.ENTRY_POINTS
+_STAGE_OF_CATEGORY = {'transpile': 'transpile', 'run': 'simulate'}
+
+
+def discover_examples(root, only=None):
+    """
+    Numbered example scripts in root (e.g. '3.4-Qubit-GHZ-State.py', '17a...'),
+    in numeric order. only optionally restricts them to numbers like ['3', '17a'].
+    """
+    examples = []
+    for name in os.listdir(root):
+        match = _EXAMPLE_NAME.match(name)
+        if match and (not only or ''.join(match.groups()) in only):
+            examples.append((int(match.group(1)), match.group(2), os.path.join(root, name)))
+    return [path for _, _, path in sorted(examples)]
+
+
+class _StageClock:
+    """
+    Accumulates wall time spent inside wrapped entry points, per stage. Calls
+    may come from several threads (JobRunner's pool): a stage's time is the
+    wall time during which at least one thread is inside it.
+    """
+
+    def __init__(self):
+        self.seconds = {'transpile': 0.0, 'simulate': 0.0}
+        self.first_call = None
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._active = dict.fromkeys(self.seconds, 0)
+        self._since = {}
+
+    def _enter(self, stage):
+        with self._lock:
+            now = time.perf_counter()
+            if self.first_call is None:
+                self.first_call = now
+            if not self._active[stage]:
+                self._since[stage] = now
+            self._active[stage] += 1
+
+    def _leave(self, stage):
+        with self._lock:
+            self._active[stage] -= 1
+            if not self._active[stage]:
+                self.seconds[stage] += time.perf_counter() - self._since[stage]
+
+    def wrap(self, stage, func):
+        @functools.wraps(func)
+        def timed(*args, **kwargs):
+            # Only the outermost call of a thread counts: transpile runs a
+            # PassManager, Statevector(qc) calls from_instruction, and so on
+            if getattr(self._local, 'busy', False):
+                return func(*args, **kwargs)
+            self._local.busy = True
+            self._enter(stage)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self._leave(stage)
+                self._local.busy = False
+        return timed
+
+    def install(self):
+        from .tracing import wrap_entry_points
+
+        wrap_entry_points(lambda category, func, label: self.wrap(_STAGE_OF_CATEGORY[category], func))
+
+
+def _peak_rss_mb():
+    if resource is None:
+        return None
+    peak = max(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+               resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss)
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS
+    return peak / 1024 ** (2 if sys.platform == 'darwin' else 1)
+
+
+def _timeout(signum, frame):
+    raise TimeoutError("example timed out")
+
+
+def run_example(path, timeout=EXAMPLE_TIMEOUT):
+    """
+    Runs one example script in the current (worker) process and returns its
+    record: status, error, per-stage seconds and peak RSS. The script's output
+    is swallowed and its files are written to a scratch directory.
+    """
+    import runpy
+    import signal
+
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    sys.path.insert(0, root)
+    os.environ.setdefault('MPLBACKEND', 'Agg')
+
+    start = time.perf_counter()
+    import qiskit  # noqa: F401  (imported up front so its cost is not billed to 'build')
+    import qiskit_aer  # noqa: F401
+    clock = _StageClock()
+    clock.install()
+    record = {'status': 'ok', 'error': None, 'import_seconds': time.perf_counter() - start}
+
+    if hasattr(signal, 'SIGALRM'):
+        signal.signal(signal.SIGALRM, _timeout)
+        signal.alarm(timeout)
+    output = io.StringIO()
+    with tempfile.TemporaryDirectory() as scratch:
+        os.chdir(scratch)
+        start = time.perf_counter()
+        try:
+            with redirect_stdout(output), redirect_stderr(output):
+                runpy.run_path(path, run_name='__main__')
+        except BaseException as error:  # SystemExit and timeouts are failures too
+            record['status'] = 'timeout' if isinstance(error, TimeoutError) else 'error'
+            record['error'] = traceback.format_exception_only(type(error), error)[-1].strip()
+        total = time.perf_counter() - start
+        os.chdir(root)
+    if hasattr(signal, 'SIGALRM'):
+        signal.alarm(0)
+
+    build = (clock.first_call or start + total) - start
+    transpile, simulate = clock.seconds['transpile'], clock.seconds['simulate']
+    record['seconds'] = {'build': build, 'transpile': transpile, 'simulate': simulate,
+                         'post_process': max(total - build - transpile - simulate, 0.0), 'total': total}
+    record['peak_rss_mb'] = _peak_rss_mb()
+    return record
+
+
+def _environment():
+    versions = {}
+    for package in ['qiskit', 'qiskit_aer', 'numpy', 'scipy']:
+        try:
+            versions[package] = importlib.import_module(package).__version__
+        except ImportError:
+            versions[package] = None
+    return {'python': platform.python_version(), 'platform': platform.platform(),
+            'cpu_count': os.cpu_count(), **versions}
+
+
+def run_examples(paths, max_workers=None, timeout=EXAMPLE_TIMEOUT, progress=None):
+    """
+    Runs the example scripts in a process pool (one fresh process per example)
+    and returns the report dict. progress(name, record) is called for each
+    example, in the order of paths, once its record is available.
+    """
+    examples = {}
+    with ProcessPoolExecutor(max_workers=max_workers, max_tasks_per_child=1) as pool:
+        futures = {os.path.basename(path): pool.submit(run_example, path, timeout) for path in paths}
+        for name, future in futures.items():
+            try:
+                record = future.result()
+            except Exception as error:  # the worker itself died (e.g. out of memory)
+                record = {'status': 'crashed', 'error': repr(error), 'seconds': None, 'peak_rss_mb': None}
+            examples[name] = record
+            if progress is not None:
+                progress(name, record)
+    return {'created': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            'environment': _environment(), 'examples': examples}
+
+
+def compare_to_baseline(report, baseline, threshold=REGRESSION_THRESHOLD, min_seconds=MIN_REGRESSION_SECONDS):
+    """
+    Lists the regressions of report against baseline: examples that used to run
+    and now fail, and stages (or totals) more than threshold (relative) and
+    min_seconds (absolute) slower than before.
+    """
+    regressions = []
+    for name, before in baseline['examples'].items():
+        after = report['examples'].get(name)
+        if after is None or before['status'] != 'ok':
+            continue
+        if after['status'] != 'ok':
+            regressions.append({'example': name, 'stage': 'status', 'baseline': 'ok', 'current': after['status']})
+            continue
+        for stage in STAGES + ['total']:
+            old, new = before['seconds'][stage], after['seconds'][stage]
+            if new - old > min_seconds and new > old * (1 + threshold):
+                regressions.append({'example': name, 'stage': stage, 'baseline': old, 'current': new,
+                                    'ratio': new / old if old else float('inf')})
+    return regressions
+
+
+def write_report(report, path):
+    with open(path, 'w') as f:
+        json.dump(report, f, indent=2)
+
+
+def load_report(path):
+    with open(path) as f:
+        return json.load(f)
@@ -0,0 +1,202 @@
+"""Shor's algorithm for N = 15 (scripts 11 and 11a)."""
+from fractions import Fraction
+from math import gcd
+from qiskit import QuantumCircuit, QuantumRegister, ClassicalRegister, transpile
+from .counts import IntCounts
+from .qft import qft_dagger
+from .tracing import traced
+
+
+def c_amod15(a, power, compact=False):
+    """Controlled multiplication by a mod 15"""
+    if a not in [2, 4, 7, 8, 11, 13]:
+        raise ValueError("'a' must be coprime to 15")
+
+    U = QuantumCircuit(4)
+    for _ in range(power):
+        if a in [2, 13]:
+            U.swap(0, 1)
+            U.swap(1, 2)
+            U.swap(2, 3)
+        if a in [7, 8]:
+            U.swap(2, 3)
+            U.swap(1, 2)
+            U.swap(0, 1)
+        if a in [4, 11]:
+            U.swap(1, 3)
+            U.swap(0, 2)
+        if a in [7, 11, 13]:
+            for q in range(4):
+                U.x(q)
+    U = U.to_gate()
+    U.name = f"{a}^{power}" if compact else f"{a}^{power} mod 15"
+    c_U = U.control()
+    return c_U
+
+
+@traced('build')
+def shor_circuit(a, n_count=8, compact=False):
+    """
+    Period-finding circuit for a mod 15 with n_count counting qubits.
+    compact=True uses the short register and gate names of script 11a.
+    """
+    names = ('c', 'a', 'm') if compact else ('counting', 'auxiliary', 'classical')
+    qr_count = QuantumRegister(n_count, names[0])
+    qr_aux = QuantumRegister(4, names[1])
+    cr = ClassicalRegister(n_count, names[2])
+    qc = QuantumCircuit(qr_count, qr_aux, cr)
+
+    # Initialize counting qubits in superposition
+    for q in range(n_count):
+        qc.h(q)
+
+    # Initialize auxiliary register to |1⟩
+    qc.x(n_count)
+    qc.barrier()
+
+    # Apply controlled-U operations
+    for q in range(n_count):
+        qc.append(c_amod15(a, 2**q, compact), [q] + [i + n_count for i in range(4)])
+
+    qc.barrier()
+
+    # Apply inverse QFT
+    qc.append(qft_dagger(n_count, name="iQFT" if compact else "QFT†"), range(n_count))
+    qc.barrier()
+
+    # Measure counting qubits
+    qc.measure(range(n_count), range(n_count))
+    return qc
+
+
+@traced('algorithm')
+def shors_algorithm(N=15, a=7, n_count=8, shots=2048, optimization_level=1, compact=False, tuner=None):
+    """
+    Shor's algorithm for factoring N
+
+    Args:
+        N: Number to factor (default: 15)
+        a: Coprime base for modular exponentiation (default: 7)
+        tuner: TranspileTuner whose setting for this (N, a, n_count) replaces
+            optimization_level (measured on first use)
+
+    Returns:
+        tuple: (quantum_circuit, measurement_counts as IntCounts, factors)
+    """
+    from .execution import make_simulator
+
+    # Check if N is even
+    if N % 2 == 0:
+        return None, None, (2, N // 2)
+
+    # Check if gcd(a, N) > 1
+    g = gcd(a, N)
+    if g > 1:
+        return None, None, (g, N // g)
+
+    qc = shor_circuit(a, n_count, compact)
+
+    # Transpile the circuit to decompose custom gates, then simulate
+    simulator = make_simulator()
+    if tuner is not None:
+        transpiled_qc, run_options = tuner.transpile(qc, simulator, family=f"shor-{N}-{a}-{n_count}",
+                                                     shots=shots)
+    else:
+        transpiled_qc, run_options = transpile(qc, simulator, optimization_level=optimization_level), {}
+    result = simulator.run(transpiled_qc, shots=shots, **run_options).result()
+    counts = IntCounts.from_result(result)
+
+    # Process results to find factors
+    factors = process_measurement_results(counts, N, a, n_count)
+
+    if not compact:
+        qc.name = f"Shor's Algorithm for N={N}, a={a}"
+
+    return qc, counts, factors
+
+
+@traced('post_process')
+def process_measurement_results(counts, N, a, n_count):
+    """Process measurement results (IntCounts) to extract factors"""
+
+    # The 10 most frequent measurements, as integers
+    keys, _ = counts.top_k(10)
+
+    for decimal in keys.tolist():
+
+        # Skip if measurement is 0
+        if decimal == 0:
+            continue
+
+        # Calculate phase
+        phase = decimal / (2**n_count)
+
+        # Use continued fractions to find the period r
+        frac = Fraction(phase).limit_denominator(N)
+        r = frac.denominator
+
+        # Check if r is valid
+        if r > 0 and r % 2 == 0:
+            # Calculate potential factors
+            x = pow(a, r//2, N)
+
+            guess1 = gcd(x - 1, N)
+            guess2 = gcd(x + 1, N)
+
+            # Check if we found non-trivial factors
+            if guess1 not in [1, N]:
+                return (guess1, N // guess1)
+            if guess2 not in [1, N]:
+                return (guess2, N // guess2)
+
+    return None
+
+
+def print_compact_circuit(qc, max_width=80):
+    """Print circuit with line wrapping at max_width"""
+    circuit_str = str(qc)
+    lines = circuit_str.split('\n')
+
+    print("=" * max_width)
+    print("SHOR'S ALGORITHM QUANTUM CIRCUIT".center(max_width))
+    print("=" * max_width)
+
+    for line in lines:
+        if len(line) <= max_width:
+            print(line)
+        else:
+            # If line is too long, show truncated with ellipsis
+            print(line[:max_width-3] + "...")
+
+    print("=" * max_width)
+
+
+def print_abstract_circuit(qc):
+    """Print high-level abstract view of circuit"""
+    print("=" * 80)
+    print("ABSTRACT CIRCUIT STRUCTURE".center(80))
+    print("=" * 80)
+    print()
+    print("Registers:")
+    print(f"  - Counting qubits (c): {qc.num_qubits - 4} qubits")
+    print(f"  - Auxiliary qubits (a): 4 qubits")
+    print(f"  - Classical bits (m): {qc.num_clbits} bits")
+    print()
+    print("Circuit stages:")
+    print("  1. Initialization:")
+    print("     └─ Apply Hadamard to all counting qubits (superposition)")
+    print("     └─ Set auxiliary register to |1⟩")
+    print()
+    print("  2. Modular Exponentiation:")
+    print("     └─ Apply controlled-U operations: a^(2^k) mod 15")
+    print(f"     └─ For k = 0, 1, 2, ..., {qc.num_clbits - 1}")
+    print()
+    print("  3. Inverse QFT:")
+    print("     └─ Extract period information from phase")
+    print()
+    print("  4. Measurement:")
+    print("     └─ Measure counting qubits")
+    print()
+    print(f"Total operations: {qc.size()}")
+    print(f"Circuit depth: {qc.depth()}")
+    print("=" * 80)
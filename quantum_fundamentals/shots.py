@@ -0,0 +1,114 @@
+"""
+Memory-mapped streaming of per-shot measurement records (script 7b).
+
+The sampler runs in fixed-size chunks and each chunk is appended, bit-packed
+across shots, to a memory-mapped .npy file. The estimators read the file back
+chunk by chunk, so memory use is bounded by the chunk size.
+"""
+import json
+import math
+import numpy as np
+from .tracing import traced
+
+CHUNK_SHOTS = 1_000_000
+
+
+@traced('run')
+def stream_shots_to_file(qc, total_shots, path, chunk_shots=CHUNK_SHOTS, seed=None):
+    """
+    Samples qc total_shots times and writes every shot to path (a uint8 .npy
+    memmap) plus a path + '.json' sidecar with the layout. Bits are stored
+    shot-major: shot s, clbit k is bit s * num_bits + k of the stream.
+    """
+    if total_shots % 8 or chunk_shots % 8:
+        raise ValueError("total_shots and chunk_shots must be multiples of 8")
+    from .execution import make_sampler
+
+    num_bits = qc.num_clbits
+    records = np.lib.format.open_memmap(path, mode='w+', dtype=np.uint8,
+                                        shape=(total_shots * num_bits // 8,))
+    sampler = make_sampler(seed=seed)
+    written = 0
+    chunk_index = 0
+    while written < total_shots:
+        shots = min(chunk_shots, total_shots - written)
+        if seed is not None:
+            # A fresh seed per chunk keeps chunks independent and reproducible
+            sampler = make_sampler(seed=seed + chunk_index)
+        data = sampler.run([qc], shots=shots).result()[0].data
+        bit_array = next(iter(data.values()))
+        # BitArray rows are big-endian packed; unpack to (shots, num_bits) with clbit k in column k
+        bits = np.unpackbits(bit_array.array, axis=1, bitorder='big')[:, ::-1][:, :num_bits]
+        start = written * num_bits // 8
+        packed = np.packbits(bits.ravel(), bitorder='little')
+        records[start:start + len(packed)] = packed
+        written += shots
+        chunk_index += 1
+    records.flush()
+    with open(path + '.json', 'w') as f:
+        json.dump({'num_bits': num_bits, 'shots': total_shots}, f)
+    return path
+
+
+def iter_shot_chunks(path, chunk_shots=CHUNK_SHOTS):
+    """
+    Yields (shots, num_bits) uint8 arrays of the stored record, one chunk at a
+    time. Chunks must start on a byte, so chunk_shots is rounded up to a
+    multiple of 8 / gcd(num_bits, 8).
+    """
+    with open(path + '.json') as f:
+        layout = json.load(f)
+    num_bits, total_shots = layout['num_bits'], layout['shots']
+    aligned = 8 // math.gcd(num_bits, 8)
+    chunk_shots = -(-chunk_shots // aligned) * aligned
+    records = np.load(path, mmap_mode='r')
+    for first in range(0, total_shots, chunk_shots):
+        shots = min(chunk_shots, total_shots - first)
+        start = first * num_bits // 8
+        stop = start + (shots * num_bits + 7) // 8
+        bits = np.unpackbits(records[start:stop], bitorder='little')[:shots * num_bits]
+        yield bits.reshape(shots, num_bits)
+
+
+class StreamingBitEstimator:
+    """Running per-clbit mean of a shot stream with binomial confidence intervals."""
+
+    def __init__(self, num_bits):
+        self.shots = 0
+        self.ones = np.zeros(num_bits, dtype=np.int64)
+
+    def update(self, bits):
+        self.shots += len(bits)
+        self.ones += bits.sum(axis=0, dtype=np.int64)
+
+    @property
+    def mean(self):
+        return self.ones / self.shots
+
+    def confidence_interval(self, level=0.99):
+        """Wilson score interval for each bit's probability of reading 1."""
+        from scipy import stats
+
+        z = stats.norm.ppf(0.5 + level / 2)
+        n, p = self.shots, self.mean
+        centre = (p + z ** 2 / (2 * n)) / (1 + z ** 2 / n)
+        half = z * np.sqrt(p * (1 - p) / n + z ** 2 / (4 * n ** 2)) / (1 + z ** 2 / n)
+        return centre - half, centre + half
+
+
+class StreamingOutcomeHistogram:
+    """Running histogram over all 2^num_bits outcomes for a chi-square test."""
+
+    def __init__(self, num_bits):
+        self.weights = 1 << np.arange(num_bits)
+        self.counts = np.zeros(2 ** num_bits, dtype=np.int64)
+
+    def update(self, bits):
+        self.counts += np.bincount(bits @ self.weights, minlength=len(self.counts))
+
+    def chi_square(self, probabilities):
+        """Pearson chi-square statistic and p-value against the given distribution."""
+        from scipy import stats
+
+        expected = np.asarray(probabilities) * self.counts.sum()
+        return stats.chisquare(self.counts, expected)
@@ -0,0 +1,222 @@
+"""
+Sparse (dictionary-of-amplitudes) statevector simulator (script 4a).
+
+SparseStatevector stores {basis index: amplitude} for the non-zero entries only,
+so memory and time scale with the support of the state. Once the support passes
+a fraction of 2^n the remaining gates are applied to a dense Statevector, and
+the result keeps that dense array (cast to complex64 under a single-precision
+execution profile).
+"""
+import sys
+import numpy as np
+from qiskit.quantum_info import Statevector
+from .tracing import traced
+
+# Switch to a dense Statevector once this fraction of amplitudes is non-zero
+DENSE_FRACTION = 1 / 8
+# ...but never for states this small, where either representation is cheap
+MIN_DENSE_SUPPORT = 16
+# Amplitudes smaller than this are dropped after every gate
+ATOL = 1e-12
+
+DIAGONAL_PHASES = {
+    'z': lambda params: -1,
+    's': lambda params: 1j,
+    'sdg': lambda params: -1j,
+    't': lambda params: np.exp(1j * np.pi / 4),
+    'tdg': lambda params: np.exp(-1j * np.pi / 4),
+    'p': lambda params: np.exp(1j * params[0]),
+}
+
+
+class SparseStatevector:
+    """
+    Statevector stored as a dictionary of non-zero basis amplitudes, or, after
+    simulate_sparse fell back to dense, as a dense array (dense, otherwise None).
+    """
+
+    def __init__(self, num_qubits, amplitudes=None):
+        self.num_qubits = num_qubits
+        self.amplitudes = {0: 1.0 + 0j} if amplitudes is None else dict(amplitudes)
+        self.dense = None
+
+    @classmethod
+    def from_dense(cls, data):
+        data = np.asarray(data)
+        state = cls(int(data.size).bit_length() - 1, {})
+        state.dense = data
+        return state
+
+    @property
+    def support(self):
+        if self.dense is not None:
+            return int(np.count_nonzero(np.abs(self.dense) > ATOL))
+        return len(self.amplitudes)
+
+    # --- Gate kernels ---
+    def _map(self, fn):
+        """Apply a basis permutation with phases: fn(index, amp) -> (index, amp)."""
+        self.amplitudes = dict(fn(i, a) for i, a in self.amplitudes.items())
+
+    def _apply_matrix_1q(self, matrix, q):
+        mask = 1 << q
+        new = {}
+        for index, amp in self.amplitudes.items():
+            bit = (index >> q) & 1
+            base = index & ~mask
+            for out, target in ((0, base), (1, base | mask)):
+                coeff = matrix[out, bit]
+                if coeff != 0:
+                    new[target] = new.get(target, 0) + coeff * amp
+        self.amplitudes = {i: a for i, a in new.items() if abs(a) > ATOL}
+
+    def _apply_matrix_2q(self, matrix, q0, q1):
+        # Qiskit matrices are little-endian: local index = bit(q0) + 2 * bit(q1)
+        m0, m1 = 1 << q0, 1 << q1
+        new = {}
+        for index, amp in self.amplitudes.items():
+            col = ((index >> q0) & 1) | (((index >> q1) & 1) << 1)
+            base = index & ~(m0 | m1)
+            for row in range(4):
+                coeff = matrix[row, col]
+                if coeff != 0:
+                    target = base | (m0 if row & 1 else 0) | (m1 if row & 2 else 0)
+                    new[target] = new.get(target, 0) + coeff * amp
+        self.amplitudes = {i: a for i, a in new.items() if abs(a) > ATOL}
+
+    def _initialize(self, params, qubits):
+        """
+        Initialize to the amplitude vector params on qubits that are currently
+        |0> in every basis state. Returns False (nothing applied) otherwise, or
+        for a label or integer instead of a vector.
+        """
+        try:
+            vector = np.asarray(params, dtype=complex)
+        except (TypeError, ValueError):
+            return False
+        masks = [1 << q for q in qubits]
+        if vector.shape != (2 ** len(qubits),) or any(index & m for index in self.amplitudes for m in masks):
+            return False
+        new = {}
+        for k, coeff in enumerate(vector):
+            if abs(coeff) <= ATOL:
+                continue
+            offset = sum(m for j, m in enumerate(masks) if (k >> j) & 1)
+            for index, amp in self.amplitudes.items():
+                new[index | offset] = coeff * amp
+        self.amplitudes = new
+        return True
+
+    def apply(self, operation, qubits):
+        """
+        Applies one operation in place. Returns False if the operation has no
+        sparse kernel (or the state is dense), in which case the caller should
+        continue densely.
+        """
+        if self.dense is not None:
+            return False
+        name = operation.name
+        if name in ('barrier', 'id', 'measure'):
+            return True
+        if name == 'x':
+            mask = 1 << qubits[0]
+            self._map(lambda i, a: (i ^ mask, a))
+        elif name in DIAGONAL_PHASES:
+            mask, phase = 1 << qubits[0], DIAGONAL_PHASES[name](operation.params)
+            self._map(lambda i, a: (i, a * phase if i & mask else a))
+        elif name == 'cx':
+            c, t = 1 << qubits[0], 1 << qubits[1]
+            self._map(lambda i, a: (i ^ t if i & c else i, a))
+        elif name == 'ccx':
+            c, t = (1 << qubits[0]) | (1 << qubits[1]), 1 << qubits[2]
+            self._map(lambda i, a: (i ^ t if i & c == c else i, a))
+        elif name in ('cz', 'ccz', 'cp'):
+            mask = sum(1 << q for q in qubits)
+            phase = np.exp(1j * operation.params[0]) if name == 'cp' else -1
+            self._map(lambda i, a: (i, a * phase if i & mask == mask else a))
+        elif name == 'swap':
+            q0, q1 = qubits
+            def swap(i, a):
+                b0, b1 = (i >> q0) & 1, (i >> q1) & 1
+                return (i ^ ((1 << q0) | (1 << q1)) if b0 != b1 else i), a
+            self._map(swap)
+        elif name in ('initialize', 'state_preparation'):
+            return self._initialize(operation.params, qubits)
+        elif len(qubits) <= 2:
+            # reset, unbound parameters and other non-unitary operations have no matrix
+            try:
+                matrix = operation.to_matrix()
+            except Exception:
+                return False
+            if matrix is None:
+                return False
+            if len(qubits) == 1:
+                self._apply_matrix_1q(matrix, qubits[0])
+            else:
+                self._apply_matrix_2q(matrix, *qubits)
+        else:
+            return False
+        return True
+
+    # --- Conversions ---
+    def to_dense(self, dtype=None):
+        """Dense amplitude array, in dtype (default: that of the dense state, else complex128)."""
+        if self.dense is not None:
+            return self.dense if dtype is None else self.dense.astype(dtype, copy=False)
+        data = np.zeros(2 ** self.num_qubits, dtype=dtype or complex)
+        for index, amp in self.amplitudes.items():
+            data[index] = amp
+        return data
+
+    def to_statevector(self):
+        return Statevector(self.to_dense())
+
+    def to_dict(self, decimals=None):
+        """{bitstring: amplitude}, matching Statevector.to_dict()."""
+        out = {}
+        if self.dense is not None:
+            amplitudes = {int(i): self.dense[i] for i in np.flatnonzero(np.abs(self.dense) > ATOL)}
+        else:
+            amplitudes = self.amplitudes
+        for index in sorted(amplitudes):
+            amp = amplitudes[index]
+            out[format(index, f'0{self.num_qubits}b')] = complex(amp if decimals is None else np.round(amp, decimals))
+        return out
+
+    def probabilities_dict(self):
+        return {key: abs(amp) ** 2 for key, amp in self.to_dict().items()}
+
+    def nbytes(self):
+        """Approximate memory held by the amplitude dictionary (or dense array)."""
+        if self.dense is not None:
+            return self.dense.nbytes
+        return sys.getsizeof(self.amplitudes) + sum(
+            sys.getsizeof(i) + sys.getsizeof(a) for i, a in self.amplitudes.items())
+
+
+@traced('run')
+def simulate_sparse(qc, dense_fraction=DENSE_FRACTION, dtype=None):
+    """
+    Simulates qc from |0...0> and returns its SparseStatevector. The rest of
+    the circuit is evolved as a dense Statevector when the support exceeds
+    dense_fraction * 2^n (and MIN_DENSE_SUPPORT) or an operation has no
+    sparse kernel; the returned state then holds the dense amplitudes, cast
+    to dtype (default: the active profile's precision).
+    """
+    from .execution import complex_dtype
+
+    dtype = np.dtype(dtype or complex_dtype())
+    state = SparseStatevector(qc.num_qubits)
+    limit = max(dense_fraction * 2 ** qc.num_qubits, MIN_DENSE_SUPPORT)
+    for position, instruction in enumerate(qc.data):
+        qubits = [qc.find_bit(q).index for q in instruction.qubits]
+        if not state.apply(instruction.operation, qubits) or state.support > limit:
+            if state.support > limit:
+                position += 1
+            rest = qc.copy_empty_like()
+            for remaining in qc.data[position:]:
+                if remaining.operation.name != 'measure':
+                    rest.append(remaining)
+            # Statevector handles any width and operation; only the result is cast
+            return SparseStatevector.from_dense(state.to_statevector().evolve(rest).data.astype(dtype, copy=False))
+    return state
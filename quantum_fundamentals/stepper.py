@@ -0,0 +1,117 @@
+"""
+Incremental statevector stepper with copy-on-write snapshots (script 4b).
+
+Every appended gate is applied once to the current amplitudes, so tracing a
+circuit gate by gate is linear in its length; states and snapshots are O(1)
+read-only views, and a buffer that a live view still refers to is never
+overwritten (the next gate writes to a fresh one instead).
+
+The amplitudes are complex128 or, under a single-precision execution profile,
+complex64. Statevector always holds complex128, so in single precision the
+state and snapshots are upcast copies rather than views.
+"""
+import string
+import weakref
+import numpy as np
+from qiskit import QuantumCircuit
+from qiskit.quantum_info import Statevector
+
+INDICES = string.ascii_letters
+
+
+class StatevectorStepper:
+    """
+    Incrementally evolved statevector. Gates are added with the usual
+    QuantumCircuit methods (stepper.h(0), stepper.cx(0, 1), ...) and applied
+    immediately; the accumulated circuit is available as stepper.circuit.
+
+    dtype defaults to the precision of the active execution profile; initial
+    is an optional starting statevector (default |0...0>).
+    """
+
+    def __init__(self, num_qubits, dtype=None, initial=None):
+        from .execution import complex_dtype
+
+        if 2 * num_qubits + 4 > len(INDICES):
+            raise ValueError(f"At most {(len(INDICES) - 4) // 2} qubits are supported")
+        self.num_qubits = num_qubits
+        self.dtype = np.dtype(dtype or complex_dtype())
+        self.circuit = QuantumCircuit(num_qubits)
+        self.snapshots = {}
+        if initial is None:
+            self._front = np.zeros(2 ** num_qubits, dtype=self.dtype)
+            self._front[0] = 1
+        else:
+            self._front = np.array(getattr(initial, 'data', initial), dtype=self.dtype)
+        self._back = None
+        # Weak references to the Statevectors handed out as views of a buffer
+        self._views = []
+
+    @property
+    def state(self):
+        """Current state as a read-only Statevector view (a copy in single precision)."""
+        if self.dtype != np.complex128:
+            return Statevector(self._front)
+        view = self._front.view()
+        view.flags.writeable = False
+        state = Statevector(view)
+        self._views.append(weakref.ref(state))
+        return state
+
+    def snapshot(self, name):
+        """Records the current state under name without copying it."""
+        self.snapshots[name] = self.state
+        return self.snapshots[name]
+
+    def _take_back_buffer(self):
+        # Copy-on-write: never overwrite a buffer that a returned state (or snapshot) still views
+        live = [state for state in (ref() for ref in self._views) if state is not None]
+        self._views = [weakref.ref(state) for state in live]
+        back = self._back
+        if back is None or any(np.shares_memory(back, state.data) for state in live):
+            back = np.empty_like(self._front)
+        return back
+
+    def append(self, operation, qubits):
+        """Applies operation to the given qubit indices and records it."""
+        self.circuit.append(operation, qubits)
+        if operation.name == 'barrier':
+            return self
+        k = len(qubits)
+        n = self.num_qubits
+        # Axis j of the reshaped state is qubit n - 1 - j; the gate tensor's
+        # row/column axes run from its last qubit down to its first.
+        state_idx = list(INDICES[:n])
+        in_idx = [state_idx[n - 1 - q] for q in reversed(qubits)]
+        out_idx = list(INDICES[n:n + k])
+        result_idx = [out_idx[in_idx.index(c)] if c in in_idx else c for c in state_idx]
+        subscripts = f"{''.join(out_idx + in_idx)},{''.join(state_idx)}->{''.join(result_idx)}"
+
+        gate = np.asarray(operation.to_matrix(), dtype=self.dtype).reshape([2] * (2 * k))
+        back = self._take_back_buffer()
+        np.einsum(subscripts, gate, self._front.reshape([2] * n), out=back.reshape([2] * n))
+        self._front, self._back = back, self._front
+        return self
+
+    def __getattr__(self, name):
+        # Delegate gate methods (h, cx, ry, ...) to a scratch circuit, then apply
+        # whatever instructions that method produced.
+        if name.startswith('_') or not callable(getattr(QuantumCircuit, name, None)):
+            raise AttributeError(name)
+
+        def add_gate(*args, **kwargs):
+            scratch = QuantumCircuit(self.num_qubits)
+            getattr(scratch, name)(*args, **kwargs)
+            for instruction in scratch.data:
+                self.append(instruction.operation, [scratch.find_bit(q).index for q in instruction.qubits])
+            return self
+
+        return add_gate
+
+
+def trace_statevectors(qc, dtype=None):
+    """Yields (instruction, state) after every instruction of qc in O(gates) total."""
+    stepper = StatevectorStepper(qc.num_qubits, dtype)
+    for instruction in qc.data:
+        stepper.append(instruction.operation, [qc.find_bit(q).index for q in instruction.qubits])
+        yield instruction, stepper.state
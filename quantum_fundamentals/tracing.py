@@ -0,0 +1,202 @@
+"""
+Lightweight span tracing, exported as Chrome-trace JSON or a flat CSV.
+
+Spans are nested, timed regions tagged with a category (build, transpile,
+run, post_process, ...). The package's circuit builders, objective functions
+and result processing are decorated with @traced; enable_tracing() also wraps
+qiskit's transpile and the Aer / primitive run entry points, so scripts are
+traced without edits. Open the JSON in chrome://tracing or ui.perfetto.dev.
+
+Tracing is off unless enabled; a disabled traced call costs one extra function
+call and a flag check (about 0.2 us), and the decorated functions are coarse
+(circuit builders, runs, decoders). Set QC_TRACE=trace.json (or trace.csv) to
+trace a whole run and write the file at exit (a script that imported
+transpile by name before the package is still traced through PassManager.run),
+or use `python -m quantum_fundamentals trace [--out FILE] <script> [args]`.
+"""
+import atexit
+import csv
+import functools
+import importlib
+import inspect
+import json
+import os
+import threading
+import time
+
+TRACE_ENV = 'QC_TRACE'
+
+# (module, attribute path, category) of the qiskit entry points worth a span
+ENTRY_POINTS = [
+    ('qiskit', 'transpile', 'transpile'),
+    ('qiskit.compiler', 'transpile', 'transpile'),
+    ('qiskit.transpiler', 'PassManager.run', 'transpile'),
+    ('qiskit_aer.backends.aerbackend', 'AerBackend.run', 'run'),
+    ('qiskit_aer.jobs', 'AerJob.result', 'run'),
+    ('qiskit_aer.primitives', 'SamplerV2.run', 'run'),
+    ('qiskit_aer.primitives', 'EstimatorV2.run', 'run'),
+    ('qiskit.primitives.primitive_job', 'PrimitiveJob.result', 'run'),
+    ('qiskit.quantum_info', 'Statevector.from_instruction', 'run'),
+    ('qiskit.quantum_info', 'Statevector.evolve', 'run'),
+    ('qiskit.quantum_info', 'DensityMatrix.from_instruction', 'run'),
+]
+
+_enabled = False
+_spans = []
+_local = threading.local()
+_origin = time.perf_counter_ns()
+_instrumented = False
+
+
+class _Span:
+    __slots__ = ('name', 'category', 'args', 'start', 'depth')
+
+    def __init__(self, name, category, args):
+        self.name, self.category, self.args = name, category, args
+
+    def __enter__(self):
+        self.depth = getattr(_local, 'depth', 0)
+        _local.depth = self.depth + 1
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc):
+        end = time.perf_counter_ns()
+        _local.depth = self.depth
+        _spans.append((self.name, self.category, self.start - _origin, end - self.start,
+                       threading.get_ident(), self.depth, self.args))
+        return False
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+def span(name, category='', **args):
+    """Context manager timing a block as a span; a shared no-op when tracing is off."""
+    if not _enabled:
+        return _NULL_SPAN
+    return _Span(name, category, args)
+
+
+def traced(category='', name=None):
+    """Decorator recording every call of the function as a span."""
+    def decorate(func):
+        label = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            with _Span(label, category, {}):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def wrap_entry_points(wrap, entry_points=ENTRY_POINTS):
+    """
+    Replaces each qiskit entry point with wrap(category, func, label). Class
+    methods stay class methods; modules that are not installed are skipped.
+    """
+    for module_name, path, category in entry_points:
+        try:
+            owner = importlib.import_module(module_name)
+        except ImportError:
+            continue
+        *owners, attribute = path.split('.')
+        for part in owners:
+            owner = getattr(owner, part)
+        raw = inspect.getattr_static(owner, attribute)
+        if isinstance(raw, classmethod):
+            setattr(owner, attribute, classmethod(wrap(category, raw.__func__, path)))
+        else:
+            setattr(owner, attribute, wrap(category, raw, path))
+
+
+def instrument_qiskit():
+    """Wraps the qiskit entry points (transpile, run, result, ...) in spans, once."""
+    global _instrumented
+    if not _instrumented:
+        wrap_entry_points(lambda category, func, label: traced(category, label)(func))
+        _instrumented = True
+
+
+def enable_tracing(instrument=True):
+    """Starts recording spans; instrument also traces the qiskit entry points."""
+    global _enabled
+    if instrument:
+        instrument_qiskit()
+    _enabled = True
+
+
+def disable_tracing():
+    global _enabled
+    _enabled = False
+
+
+def tracing_enabled():
+    return _enabled
+
+
+def clear_spans():
+    _spans.clear()
+
+
+def get_spans():
+    """Recorded spans as dicts, in order of completion."""
+    keys = ('name', 'category', 'start_ns', 'duration_ns', 'thread', 'depth', 'args')
+    return [dict(zip(keys, record)) for record in _spans]
+
+
+def export_chrome_trace(path):
+    """Writes the spans as Chrome-trace 'complete' events (microsecond timestamps)."""
+    pid = os.getpid()
+    events = [{'name': name, 'cat': category, 'ph': 'X', 'ts': start / 1e3, 'dur': duration / 1e3,
+               'pid': pid, 'tid': thread, 'args': args}
+              for name, category, start, duration, thread, _, args in _spans]
+    with open(path, 'w') as f:
+        json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, f)
+
+
+def export_csv(path):
+    """Writes one row per span: name, category, start/duration in microseconds, depth, thread."""
+    with open(path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['name', 'category', 'start_us', 'duration_us', 'depth', 'thread', 'args'])
+        for name, category, start, duration, thread, depth, args in sorted(_spans, key=lambda s: s[2]):
+            writer.writerow([name, category, f'{start / 1e3:.3f}', f'{duration / 1e3:.3f}', depth, thread,
+                             json.dumps(args, default=str) if args else ''])
+
+
+def export(path):
+    """Exports to CSV if path ends in .csv, Chrome-trace JSON otherwise."""
+    (export_csv if path.endswith('.csv') else export_chrome_trace)(path)
+
+
+def summarize():
+    """
+    {category: (calls, seconds)}. Spans nested in a span of the same category
+    on the same thread (transpile -> PassManager.run) are not counted twice.
+    """
+    totals = {}
+    for name, category, start, duration, thread, _, _ in sorted(_spans, key=lambda s: (s[4], s[1], s[2])):
+        calls, seconds, key, end = totals.get(category, (0, 0.0, None, -1))
+        if key == thread and start + duration <= end:
+            continue
+        totals[category] = (calls + 1, seconds + duration / 1e9, thread, start + duration)
+    return {category: (calls, seconds) for category, (calls, seconds, _, _) in totals.items()}
+
+
+if os.environ.get(TRACE_ENV):
+    enable_tracing()
+    atexit.register(export, os.environ[TRACE_ENV])
@@ -0,0 +1,53 @@
+"""VQE for a two-qubit Ising model (script 18)."""
+import numpy as np
+from qiskit import QuantumCircuit
+from qiskit.circuit import Parameter
+from qiskit.quantum_info import SparsePauliOp
+from .tracing import traced
+
+
+def ising_hamiltonian():
+    """H = Z ^ Z + X ^ I: 'ZZ' acts on qubits 0 and 1, 'XI' on qubit 1."""
+    return SparsePauliOp.from_list([("ZZ", 1.0), ("XI", 1.0)])
+
+
+def exact_ground_energy(hamiltonian):
+    """Lowest eigenvalue by dense diagonalisation (reference value only)."""
+    return float(np.min(np.linalg.eigvalsh(hamiltonian.to_matrix())))
+
+
+@traced('build')
+def hardware_efficient_ansatz():
+    """RY on both qubits followed by a CX: two parameters (θ, φ)."""
+    theta = Parameter('θ')
+    phi = Parameter('φ')
+
+    ansatz = QuantumCircuit(2)
+    ansatz.ry(theta, 0)  # Rotation on Qubit 0
+    ansatz.ry(phi, 1)    # Rotation on Qubit 1
+    ansatz.cx(0, 1)      # Entanglement
+    return ansatz
+
+
+def make_cost_function(ansatz, hamiltonian, estimator=None, verbose=True):
+    """
+    Returns cost_function(params), which runs the ansatz with the given
+    parameters and returns the expected energy.
+    """
+    if estimator is None:
+        from .pauli import PauliKernelEstimator
+        estimator = PauliKernelEstimator()
+
+    @traced('evaluate', 'vqe cost')
+    def cost_function(params):
+        # The Estimator expects inputs in a specific structure (pub = primitive unified bloc)
+        # (circuit, observable, parameter_values)
+        pub = (ansatz, hamiltonian, params)
+        result = estimator.run([pub]).result()[0]
+        energy = float(result.data.evs)
+        if verbose:
+            print(f"Evaluated params {params} -> Energy: {energy:.4f}")
+        return energy
+
+    cost_function.estimator = estimator
+    return cost_function
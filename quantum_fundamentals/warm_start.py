@@ -0,0 +1,151 @@
+"""
+Warm-started QAOA depth progression (script 16).
+
+optimize_depths optimises p = 1, then starts every depth p + 1 from the
+depth-p optimum instead of a hand-picked or random point:
+
+    'interp'   linear interpolation of the p angles onto p + 1 points
+               (gamma_i' = (i-1)/p gamma_(i-1) + (p-i+1)/p gamma_i, likewise beta)
+    'fourier'  the p angles written as p sine (gamma) / cosine (beta)
+               amplitudes, extended with a zero amplitude and evaluated at p + 1
+
+Both follow Zhou et al., "Quantum Approximate Optimization Algorithm:
+Performance, Mechanism, and Implementation on Near-Term Devices" (PRX 2020).
+Angles from PARAMETER_TABLE (or a table loaded with load_parameter_table) are
+used instead whenever the graph degree and depth have an entry. Parameters
+alternate [gamma_1, beta_1, gamma_2, beta_2, ...] as in create_qaoa_circuit.
+"""
+import json
+import numpy as np
+
+STRATEGIES = ['interp', 'fourier']
+
+# Optimal angles of the central edge of a d-regular tree lightcone, i.e. of
+# d-regular graphs without cycles shorter than 2p + 2, minimising <Z_u Z_v> in
+# create_qaoa_circuit's convention (computed with LightconeEvaluator):
+# {degree: {reps: [gamma_1, beta_1, ...]}}. Expected cut fractions: degree 2:
+# 0.750, 0.833, 0.875, 0.900; degree 3: 0.6925, 0.7559; degree 4: 0.6624;
+# degree 5: 0.6431.
+PARAMETER_TABLE = {
+    2: {1: [0.3927, -0.3927],
+        2: [0.3279, -0.6214, 0.6214, -0.3279],
+        3: [0.2961, -0.6823, 0.5780, -0.5780, 0.6823, -0.2961],
+        4: [0.2757, -0.7087, 0.5542, -0.6531, 0.6531, -0.5542, 0.7087, -0.2757]},
+    3: {1: [0.3077, -0.3927],
+        2: [0.2439, -0.5549, 0.4489, -0.2924]},
+    4: {1: [0.2618, -0.3927]},
+    5: {1: [0.2318, -0.3927]},
+}
+
+
+def _split(params):
+    params = np.asarray(params, dtype=float)
+    return params[0::2], params[1::2]
+
+
+def _join(gammas, betas):
+    params = np.empty(2 * len(gammas))
+    params[0::2], params[1::2] = gammas, betas
+    return params
+
+
+def interpolate_params(params):
+    """INTERP: depth-(p + 1) starting angles from depth-p angles."""
+    def extend(angles):
+        p = len(angles)
+        padded = np.concatenate([[0.0], angles, [0.0]])
+        i = np.arange(1, p + 2)
+        return (i - 1) / p * padded[i - 1] + (p - i + 1) / p * padded[i]
+    gammas, betas = _split(params)
+    return _join(extend(gammas), extend(betas))
+
+
+def _fourier_bases(q, p):
+    """(sine, cosine) matrices mapping q amplitudes to p angles."""
+    k = np.arange(1, q + 1)[None, :] - 0.5
+    i = np.arange(1, p + 1)[:, None] - 0.5
+    return np.sin(k * i * np.pi / p), np.cos(k * i * np.pi / p)
+
+
+def to_fourier(params):
+    """(u, v): the p sine amplitudes of the gammas and cosine amplitudes of the betas."""
+    gammas, betas = _split(params)
+    sine, cosine = _fourier_bases(len(gammas), len(gammas))
+    return np.linalg.solve(sine, gammas), np.linalg.solve(cosine, betas)
+
+
+def from_fourier(u, v, reps):
+    """Angles at depth reps from amplitudes u, v (any number of them)."""
+    sine, cosine = _fourier_bases(len(u), reps)
+    return _join(sine @ u, cosine @ v)
+
+
+def fourier_params(params):
+    """FOURIER: depth-(p + 1) starting angles from depth-p angles."""
+    u, v = to_fourier(params)
+    return from_fourier(np.append(u, 0.0), np.append(v, 0.0), len(u) + 1)
+
+
+def next_depth_params(params, strategy='interp'):
+    """Starting angles for depth p + 1 from the depth-p optimum."""
+    if strategy not in STRATEGIES:
+        raise ValueError(f"strategy must be one of {STRATEGIES}, got {strategy!r}")
+    return interpolate_params(params) if strategy == 'interp' else fourier_params(params)
+
+
+def graph_degree(edges):
+    """Largest vertex degree of an edge list."""
+    degrees = {}
+    for a, b in edges:
+        degrees[a] = degrees.get(a, 0) + 1
+        degrees[b] = degrees.get(b, 0) + 1
+    return max(degrees.values())
+
+
+def table_params(degree, reps, table=None):
+    """Tabulated angles for (degree, reps), or None."""
+    table = PARAMETER_TABLE if table is None else table
+    params = table.get(degree, {}).get(reps)
+    return None if params is None else np.array(params, dtype=float)
+
+
+def load_parameter_table(path):
+    """A {degree: {reps: params}} table from JSON (string keys are converted)."""
+    with open(path) as f:
+        raw = json.load(f)
+    return {int(degree): {int(reps): params for reps, params in by_reps.items()} for degree, by_reps in raw.items()}
+
+
+def save_parameter_table(table, path):
+    with open(path, 'w') as f:
+        json.dump({str(degree): {str(reps): list(map(float, params)) for reps, params in by_reps.items()}
+                   for degree, by_reps in table.items()}, f, indent=2)
+
+
+def optimize_depths(objective, max_reps, strategy='interp', initial_params=(0.1, 0.1), degree=None,
+                    table=None, method='COBYLA', options=None):
+    """
+    Optimises objective(params) at depths 1..max_reps, each one warm-started
+    from the previous optimum (or from the table when degree is given and the
+    table has the depth). Returns one record per depth: reps, source
+    ('initial', 'table', 'interp' or 'fourier'), start, params, energy and
+    evaluations.
+    """
+    from scipy.optimize import minimize
+
+    options = {'maxiter': 200, 'tol': 1e-4} if options is None else options
+    records = []
+    params = None
+    for reps in range(1, max_reps + 1):
+        tabulated = table_params(degree, reps, table) if degree is not None else None
+        if tabulated is not None:
+            start, source = tabulated, 'table'
+        elif params is None:
+            start, source = np.asarray(initial_params, dtype=float), 'initial'
+        else:
+            start, source = next_depth_params(params, strategy), strategy
+        result = minimize(objective, start, method=method, options=options)
+        params = result.x
+        records.append({'reps': reps, 'source': source, 'start': start, 'params': params,
+                        'energy': float(result.fun), 'evaluations': int(result.nfev)})
+    return records
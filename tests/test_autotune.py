@@ -0,0 +1,28 @@
+from qiskit import QuantumCircuit
+
+from quantum_fundamentals.autotune import circuit_family
+
+
+def _bell():
+    qc = QuantumCircuit(2)
+    qc.h(0)
+    qc.cx(0, 1)
+    qc.measure_all()
+    return qc
+
+
+def test_identical_constructions_share_a_family():
+    first, second = _bell(), _bell()
+    assert first.name != second.name
+    assert circuit_family(first) == circuit_family(second)
+
+
+def test_family_tells_circuits_apart():
+    other = QuantumCircuit(2)
+    other.h(1)
+    other.cx(1, 0)
+    other.measure_all()
+    assert circuit_family(other) != circuit_family(_bell())
+    named = _bell()
+    named.name = 'bell'
+    assert circuit_family(named).startswith('bell-2q-')
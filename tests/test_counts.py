@@ -0,0 +1,28 @@
+from quantum_fundamentals.counts import IntCounts
+
+
+def test_empty_histograms():
+    counts = IntCounts.from_dict({})
+    assert counts.num_bits == 0 and counts.to_dict() == {}
+    keys, values = counts.top_k(3)
+    assert len(keys) == len(values) == 0
+
+
+def test_top_k_zero():
+    keys, values = IntCounts.from_dict({'01': 3, '10': 5}).top_k(0)
+    assert len(keys) == len(values) == 0
+
+
+def test_from_result_matches_get_counts():
+    from qiskit import QuantumCircuit
+    from qiskit_aer import AerSimulator
+
+    qc = QuantumCircuit(3)
+    qc.h(0)
+    qc.cx(0, 2)
+    qc.measure_all()
+    result = AerSimulator(seed_simulator=7).run(qc, shots=200).result()
+    counts = IntCounts.from_result(result)
+    assert counts.to_dict() == result.get_counts()
+    keys, _ = counts.top_k(2)
+    assert sorted(keys.tolist()) == [0, 5]
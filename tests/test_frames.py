@@ -0,0 +1,44 @@
+import numpy as np
+from qiskit import QuantumCircuit
+from qiskit_aer import AerSimulator
+from qiskit_aer.noise import NoiseModel, pauli_error
+
+from quantum_fundamentals.bit_flip import build_bit_flip_memory_circuit, build_noise_model, decode_samples
+from quantum_fundamentals.frames import sample_pauli_frames
+
+
+def test_random_outcomes_keep_their_correlations():
+    qc = QuantumCircuit(4)
+    qc.h(0)
+    for target in range(1, 4):
+        qc.cx(0, target)
+    qc.measure_all()
+    bits = sample_pauli_frames(qc, 20000, seed=1)
+    assert (bits.all(axis=1) | ~bits.any(axis=1)).all()
+    assert abs(bits[:, 0].mean() - 0.5) < 0.02
+
+
+def test_matches_aer_on_noisy_bit_flip_code():
+    qc = build_bit_flip_memory_circuit(1)
+    noise_model = build_noise_model(0.05, 'depolarizing')
+    shots = 100000
+    counts = AerSimulator(method='density_matrix', noise_model=noise_model).run(
+        qc, shots=shots, seed_simulator=1).result().get_counts()
+    bits = sample_pauli_frames(qc, shots, noise_model, seed=1)
+    keys = (bits << np.arange(bits.shape[1])).sum(axis=1)
+    frequencies = np.bincount(keys, minlength=32) / shots
+    for key, count in counts.items():
+        assert abs(frequencies[int(key.replace(' ', ''), 2)] - count / shots) < 0.01
+    assert decode_samples(np.zeros((3, 5), dtype=bool), 0) == (0, 0)
+
+
+def test_measurement_noise_acts_before_the_measurement():
+    noise_model = NoiseModel()
+    noise_model.add_all_qubit_quantum_error(pauli_error([('X', 0.3), ('I', 0.7)]), ['measure'])
+    qc = QuantumCircuit(1, 2)
+    qc.measure(0, 0)
+    qc.measure(0, 1)
+    bits = sample_pauli_frames(qc, 20000, noise_model, seed=1)
+    # The second measurement sees both flips, the first only its own
+    assert abs(bits[:, 0].mean() - 0.3) < 0.02
+    assert abs(bits[:, 1].mean() - 0.42) < 0.02
@@ -0,0 +1,17 @@
+from qiskit_aer.noise import NoiseModel, depolarizing_error
+
+from quantum_fundamentals.ghz import ghz_fidelity_bound
+
+
+def test_bound_is_one_for_a_noiseless_large_state():
+    bound, method = ghz_fidelity_bound(1500, shots=200, seed=1)
+    assert bound == 1.0 and method == 'pauli_frames'
+
+
+def test_bound_follows_the_error_free_probability():
+    noise_model = NoiseModel()
+    noise_model.add_all_qubit_quantum_error(depolarizing_error(1e-3, 2), ['cx'])
+    bound, _ = ghz_fidelity_bound(200, shots=4000, noise_model=noise_model, seed=1)
+    # Fidelity is at least the chance that none of the 199 CX had an error
+    no_error = (1 - 1e-3 * 15 / 16) ** 199
+    assert 2 * no_error - 1 - 0.03 < bound <= no_error + 0.03
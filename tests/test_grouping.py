@@ -0,0 +1,17 @@
+from qiskit import QuantumCircuit
+from qiskit.quantum_info import SparsePauliOp
+
+from quantum_fundamentals.grouping import GroupedEstimator
+
+
+def test_uniform_allocation_meets_the_requested_precision():
+    hamiltonian = SparsePauliOp.from_list([('ZZII', 1.0), ('IZZI', 1.0), ('IIZZ', 1.0),
+                                           ('XIII', 0.7), ('IXII', 0.7), ('IIXI', 0.7), ('IIIX', 0.7)])
+    qc = QuantumCircuit(4)
+    qc.ry(0.7, range(4))
+    qc.cx(0, 1)
+    estimator = GroupedEstimator(seed=5)
+    for _ in range(2):
+        # First run: coefficient bound on sigma; second run: measured sigma
+        result = estimator.run([(qc, hamiltonian)], precision=0.01).result()[0]
+        assert float(result.data.stds) <= 0.0105
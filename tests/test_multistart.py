@@ -0,0 +1,9 @@
+import pytest
+
+from quantum_fundamentals.multistart import multistart_minimize
+from quantum_fundamentals.qaoa import make_diagonal_objective
+
+
+def test_rejects_empty_starts():
+    with pytest.raises(ValueError):
+        multistart_minimize(make_diagonal_objective, iter([]))
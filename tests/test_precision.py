@@ -0,0 +1,22 @@
+from types import SimpleNamespace
+
+import numpy as np
+
+from quantum_fundamentals import precision
+
+
+class _FakeEstimator:
+    def __init__(self, evs):
+        self.evs = evs
+
+    def run(self, pubs):
+        results = [SimpleNamespace(data=SimpleNamespace(evs=np.asarray(evs))) for evs in self.evs]
+        return SimpleNamespace(result=lambda: results)
+
+
+def test_every_expectation_value_of_a_pub_is_compared(monkeypatch):
+    # The pubs differ between precisions only past their first entry
+    estimators = iter([_FakeEstimator([[0.5, 0.25, 0.0], [1.0]]), _FakeEstimator([[0.5, 0.25, 0.125], [1.0]])])
+    monkeypatch.setattr(precision, 'make_estimator', lambda profile=None: next(estimators))
+    deviations = precision.expectation_deviation([None, None])
+    assert np.allclose(deviations, [0.125, 0.0])
@@ -0,0 +1,16 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from quantum_fundamentals.runner import _StageClock
+
+
+def test_overlapping_threads_count_wall_time_once():
+    clock = _StageClock()
+    simulate = clock.wrap('simulate', lambda seconds: time.sleep(seconds))
+    nested = clock.wrap('simulate', lambda: simulate(0.05))
+    with ThreadPoolExecutor(4) as pool:
+        list(pool.map(lambda _: simulate(0.2), range(4)))
+    assert 0.19 < clock.seconds['simulate'] < 0.35
+    nested()
+    assert 0.24 < clock.seconds['simulate'] < 0.45
+    assert clock.seconds['transpile'] == 0.0
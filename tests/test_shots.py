@@ -0,0 +1,17 @@
+import numpy as np
+from qiskit import QuantumCircuit
+
+from quantum_fundamentals.shots import iter_shot_chunks, stream_shots_to_file
+
+
+def test_misaligned_chunks_read_back_the_same_bits(tmp_path):
+    qc = QuantumCircuit(5)
+    qc.h(range(5))
+    qc.measure_all()
+    path = stream_shots_to_file(qc, 64, str(tmp_path / 'shots.npy'), chunk_shots=16, seed=3)
+    whole = next(iter_shot_chunks(path, chunk_shots=64))
+    chunks = list(iter_shot_chunks(path, chunk_shots=3))
+    # 3 shots of 5 bits do not end on a byte, so the reader rounds up to 8
+    assert all(len(chunk) == 8 for chunk in chunks)
+    assert np.array_equal(np.concatenate(chunks), whole)
+    assert whole.shape == (64, 5) and 0 < whole.mean() < 1
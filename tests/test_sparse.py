@@ -0,0 +1,25 @@
+import numpy as np
+from qiskit import QuantumCircuit
+from qiskit.circuit.library import UnitaryGate
+from qiskit.quantum_info import Statevector, random_unitary
+
+from quantum_fundamentals.sparse import SparseStatevector, simulate_sparse
+
+
+def test_dense_fallback_returns_a_sparse_statevector():
+    qc = QuantumCircuit(6)
+    qc.h(range(6))
+    qc.cx(0, 1)
+    state = simulate_sparse(qc, dtype=np.complex64)
+    assert isinstance(state, SparseStatevector) and state.dense is not None
+    assert state.to_dense().dtype == np.complex64
+    assert np.allclose(state.to_dense(), Statevector(qc).data, atol=1e-6)
+
+
+def test_single_precision_fallback_past_24_qubits():
+    # A 3-qubit unitary has no sparse kernel; the stepper's einsum alphabet stopped at 24 qubits
+    qc = QuantumCircuit(25)
+    qc.append(UnitaryGate(random_unitary(8, seed=1)), [0, 1, 2])
+    state = simulate_sparse(qc, dtype=np.complex64)
+    assert isinstance(state, SparseStatevector) and state.dense.dtype == np.complex64
+    assert state.support <= 8 and abs(np.linalg.norm(state.dense) - 1) < 1e-5
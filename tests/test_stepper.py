@@ -0,0 +1,37 @@
+import numpy as np
+from qiskit import QuantumCircuit
+from qiskit.quantum_info import Statevector
+
+from quantum_fundamentals.stepper import StatevectorStepper, trace_statevectors
+
+
+def test_trace_keeps_earlier_states():
+    qc = QuantumCircuit(2)
+    qc.h(0)
+    qc.cx(0, 1)
+    qc.z(0)
+    qc.x(1)
+    states = list(trace_statevectors(qc, np.complex128))
+    for step, (_, state) in enumerate(states, start=1):
+        prefix = qc.copy_empty_like()
+        for instruction in qc.data[:step]:
+            prefix.append(instruction)
+        assert state.equiv(Statevector(prefix))
+
+
+def test_held_state_is_not_overwritten():
+    stepper = StatevectorStepper(1, np.complex128)
+    held = stepper.h(0).state
+    stepper.z(0)
+    stepper.x(0)
+    np.testing.assert_allclose(held.data, [2 ** -0.5, 2 ** -0.5])
+    np.testing.assert_allclose(stepper.state.data, [-(2 ** -0.5), 2 ** -0.5])
+
+
+def test_released_states_reuse_buffers():
+    stepper = StatevectorStepper(3, np.complex128)
+    stepper.h(0)
+    buffers = {id(stepper._front), id(stepper._back)}
+    for _ in range(4):
+        stepper.x(1)
+    assert {id(stepper._front), id(stepper._back)} == buffers